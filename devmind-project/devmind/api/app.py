@@ -12,7 +12,7 @@ import os
 from pathlib import Path
 
 from devmind.core.container import initialize_container, get_container
-from devmind.core.database import init_db, close_db
+from devmind.core.database import init_db_async, close_db, close_db_async
 from devmind.api import routes_ingest, routes_search, routes_embed, routes_system, routes_chat
 from devmind.api.routes import auth as routes_auth
 from devmind.api.routes import workspaces as routes_workspaces
@@ -44,7 +44,7 @@ async def lifespan(app: FastAPI):
     logger.info(f"Using embedding model: {embedding_model} (dimension: {embedding_dimension})")
     
     # Initialize database (create tables if they don't exist)
-    init_db()
+    await init_db_async()
     
     initialize_container(
         index_base_path=index_path,
@@ -65,6 +65,7 @@ async def lifespan(app: FastAPI):
     
     # Close database connections
     close_db()
+    await close_db_async()
     
     logger.info("DevMind API shutdown complete")
 
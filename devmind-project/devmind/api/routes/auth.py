@@ -5,7 +5,7 @@ Endpoints for user registration, login, logout, and token management.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from devmind.auth import schemas
 from devmind.auth.service import (
@@ -29,7 +29,7 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
 @router.post("/register", response_model=schemas.TokenResponse, status_code=status.HTTP_201_CREATED, dependencies=[Depends(rate_limit_register)])
 async def register(
     request: schemas.UserRegisterRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Register a new user.
@@ -39,7 +39,7 @@ async def register(
     auth_service = AuthService(db)
     
     try:
-        user, access_token, refresh_token = auth_service.register_user(request)
+        user, access_token, refresh_token = await auth_service.register_user(request)
         
         return schemas.TokenResponse(
             access_token=access_token,
@@ -62,7 +62,7 @@ async def register(
 @router.post("/login", response_model=schemas.TokenResponse, dependencies=[Depends(rate_limit_login)])
 async def login(
     request: schemas.UserLoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Login user.
@@ -72,7 +72,7 @@ async def login(
     auth_service = AuthService(db)
     
     try:
-        user, access_token, refresh_token = auth_service.authenticate_user(request)
+        user, access_token, refresh_token = await auth_service.authenticate_user(request)
         
         return schemas.TokenResponse(
             access_token=access_token,
@@ -96,7 +96,7 @@ async def login(
 @router.post("/refresh", response_model=schemas.TokenResponse, dependencies=[Depends(rate_limit_refresh)])
 async def refresh_token(
     request: schemas.RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Refresh access token.
@@ -106,7 +106,7 @@ async def refresh_token(
     auth_service = AuthService(db)
     
     try:
-        user, access_token, new_refresh_token = auth_service.refresh_access_token(request.refresh_token)
+        user, access_token, new_refresh_token = await auth_service.refresh_access_token(request.refresh_token)
         
         return schemas.TokenResponse(
             access_token=access_token,
@@ -125,7 +125,7 @@ async def refresh_token(
 async def logout(
     request: schemas.RefreshTokenRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Logout user.
@@ -133,7 +133,7 @@ async def logout(
     Invalidates the refresh token.
     """
     auth_service = AuthService(db)
-    auth_service.logout_user(request.refresh_token)
+    await auth_service.logout_user(request.refresh_token)
     return None
 
 
@@ -151,14 +151,14 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 async def update_current_user(
     full_name: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update current user profile.
     """
     current_user.full_name = full_name
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    await db.refresh(current_user)
     
     return schemas.UserResponse.from_orm(current_user)
 
@@ -167,7 +167,7 @@ async def update_current_user(
 async def change_password(
     request: schemas.ChangePasswordRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Change user password.
@@ -177,7 +177,7 @@ async def change_password(
     auth_service = AuthService(db)
     
     try:
-        auth_service.change_password(
+        await auth_service.change_password(
             current_user.id,
             request.current_password,
             request.new_password
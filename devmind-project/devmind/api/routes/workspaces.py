@@ -5,7 +5,8 @@ Endpoints for workspace management and member operations.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 import uuid
 
@@ -43,7 +44,7 @@ async def create_workspace(
     Current user becomes the owner.
     """
     try:
-        workspace = workspace_service.create_workspace(current_user.id, request)
+        workspace = await workspace_service.create_workspace(current_user.id, request)
         return schemas.WorkspaceResponse.from_orm(workspace)
     except WorkspaceSlugExistsError as e:
         raise HTTPException(
@@ -60,7 +61,7 @@ async def list_workspaces(
     """
     List all workspaces where current user is a member.
     """
-    workspaces = workspace_service.get_user_workspaces(current_user.id)
+    workspaces = await workspace_service.get_user_workspaces(current_user.id)
     return [schemas.WorkspaceResponse.from_orm(w) for w in workspaces]
 
 
@@ -72,7 +73,7 @@ async def get_workspace(
     """
     Get workspace details including members.
     """
-    workspace = workspace_service.get_workspace(workspace_id)
+    workspace = await workspace_service.get_workspace(workspace_id)
     if not workspace:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -110,7 +111,7 @@ async def update_workspace(
     Requires admin or owner role.
     """
     try:
-        workspace = workspace_service.update_workspace(workspace_id, current_user.id, request)
+        workspace = await workspace_service.update_workspace(workspace_id, current_user.id, request)
         return schemas.WorkspaceResponse.from_orm(workspace)
     except WorkspaceNotFoundError as e:
         raise HTTPException(
@@ -136,7 +137,7 @@ async def delete_workspace(
     Only the owner can delete a workspace.
     """
     try:
-        workspace_service.delete_workspace(workspace_id, current_user.id)
+        await workspace_service.delete_workspace(workspace_id, current_user.id)
         return None
     except WorkspaceNotFoundError as e:
         raise HTTPException(
@@ -156,7 +157,7 @@ async def add_member(
     request: schemas.WorkspaceInviteRequest,
     current_user: User = Depends(get_current_user),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Add a member to the workspace.
@@ -165,7 +166,8 @@ async def add_member(
     """
     # Find user by email
     from devmind.auth.models import User as UserModel
-    user = db.query(UserModel).filter(UserModel.email == request.user_email).first()
+    result = await db.execute(select(UserModel).where(UserModel.email == request.user_email))
+    user = result.scalars().first()
     
     if not user:
         raise HTTPException(
@@ -174,7 +176,7 @@ async def add_member(
         )
     
     try:
-        member = workspace_service.add_member(workspace_id, current_user.id, user.id, request.role)
+        member = await workspace_service.add_member(workspace_id, current_user.id, user.id, request.role)
         
         return schemas.WorkspaceMemberResponse(
             id=str(member.id),
@@ -204,7 +206,7 @@ async def remove_member(
     Requires admin or owner role.
     """
     try:
-        workspace_service.remove_member(workspace_id, current_user.id, user_id)
+        await workspace_service.remove_member(workspace_id, current_user.id, user_id)
         return None
     except PermissionDeniedError as e:
         raise HTTPException(
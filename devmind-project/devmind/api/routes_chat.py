@@ -171,7 +171,6 @@ async def chat_stream(websocket: WebSocket):
         
         # Get chat engine  
         chat_engine = container.get_chat_engine()
-        llm_manager = container.get_llm_manager()
         
         # Parse provider
         provider_type = None
@@ -181,76 +180,16 @@ async def chat_stream(websocket: WebSocket):
             except ValueError:
                 pass
         
-        # Step 1: Retrieval (non-streaming)
-        retrieval_pipeline = container.get_retrieval_pipeline()
-        
-        # Expand query if needed
-        if use_expansion:
-            from devmind.llm import QueryExpander
-            expander = QueryExpander()
-            expanded = expander.expand(query, max_variants=2)
-            search_query = expanded[1] if len(expanded) > 1 else query
-        else:
-            search_query = query
-        
-        # Retrieve
-        results = retrieval_pipeline.search(
-            query=search_query,
+        # Stream answer deltas, then the final message with citations
+        async for event in chat_engine.chat_stream(
+            query=query,
             top_k=top_k,
-            use_keyword=use_keyword
-        )
-        
-        if not results:
-            await websocket.send_json({
-                "delta": "I couldn't find any relevant information in the codebase.",
-                "is_final": True,
-                "citations": [],
-                "metadata": {"num_results": 0}
-            })
-            await websocket.close()
-            return
-        
-        # Step 2: Assemble context
-        from devmind.llm import AnswerBuilder
-        from devmind.llm.prompts import build_chat_prompt
-        
-        answer_builder = AnswerBuilder(max_context_tokens=8000)
-        assembled = answer_builder.assemble_context(results)
-        
-        # Step 3: Build prompt
-        prompt = build_chat_prompt(query, assembled.formatted_context)
-        
-        # Step 4: Stream response
-        full_answer = ""
-        
-        async for chunk in llm_manager.stream(
-            prompt,
-            context_size=assembled.total_tokens,
-            query_complexity="medium",
+            use_query_expansion=use_expansion,
+            use_keyword_search=use_keyword,
             provider_type=provider_type,
             temperature=temperature
         ):
-            full_answer += chunk
-            
-            # Send chunk
-            await websocket.send_json({
-                "delta": chunk,
-                "is_final": False
-            })
-        
-        # Step 5: Send final message with citations
-        citations = answer_builder.build_citations(assembled.context_blocks)
-        
-        await websocket.send_json({
-            "delta": "",
-            "is_final": True,
-            "citations": citations,
-            "metadata": {
-                "num_results": len(results),
-                "sources_count": assembled.sources_count,
-                "context_tokens": assembled.total_tokens
-            }
-        })
+            await websocket.send_json(event)
         
         logger.info("WebSocket chat completed")
         await websocket.close()
@@ -48,7 +48,7 @@ async def run_ingestion_job(job_id: str, config: PipelineConfig, container: DICo
         pipeline = container.create_ingestion_pipeline(config)
         
         # Run ingestion
-        result = pipeline.run()
+        result = await pipeline.run_async()
         
         # Mark complete
         job_manager.complete_job(job_id, result)
@@ -152,7 +152,7 @@ async def get_job_status(
         
         return JobStatusResponse(
             job_id=job.job_id,
-            status=job.status.value,
+            status=job.status,
             progress=progress,
             created_at=job.created_at.isoformat(),
             started_at=job.started_at.isoformat() if job.started_at else None,
@@ -190,14 +190,11 @@ async def list_jobs(
         if status:
             try:
                 job_status = JobStatus(status.upper())
-                jobs = job_manager.list_jobs(status=job_status)
+                jobs = job_manager.list_jobs(status=job_status, limit=limit)
             except ValueError:
                 raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
         else:
-            jobs = job_manager.list_jobs()
-        
-        # Limit results
-        jobs = jobs[:limit]
+            jobs = job_manager.list_jobs(limit=limit)
         
         # Convert to response models
         results = []
@@ -212,7 +209,7 @@ async def list_jobs(
             
             results.append(JobStatusResponse(
                 job_id=job.job_id,
-                status=job.status.value,
+                status=job.status,
                 progress=progress,
                 created_at=job.created_at.isoformat(),
                 started_at=job.started_at.isoformat() if job.started_at else None,
@@ -7,11 +7,12 @@ Provides dependency injection for authentication and authorization.
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
 from devmind.auth.models import User, UserRole
 from devmind.auth import security
+from devmind.auth.service import AuthService
 from devmind.core.database import get_db
 
 # Security scheme for JWT
@@ -19,10 +20,8 @@ security_scheme = HTTPBearer()
 
 
 async def get_current_user(
-    credentials: HTTPAuth
-
-orizationCredentials = Depends(security_scheme),
-    db: Session = Depends(get_db)
+    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """
     Get current authenticated user from JWT token.
@@ -63,7 +62,7 @@ orizationCredentials = Depends(security_scheme),
         raise credentials_exception
     
     # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await AuthService(db).get_user_by_id(user_id)
     if user is None:
         raise credentials_exception
     
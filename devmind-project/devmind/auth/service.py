@@ -6,7 +6,8 @@ Business logic for user management and authentication.
 
 from typing import Optional
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 import uuid
 import logging
@@ -50,16 +51,16 @@ class AuthService:
     Handles registration, login, token management, and account security.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """
         Initialize auth service.
         
         Args:
-            db: Database session
+            db: Async database session
         """
         self.db = db
     
-    def register_user(self, request: UserRegisterRequest) -> tuple[User, str, str]:
+    async def register_user(self, request: UserRegisterRequest) -> tuple[User, str, str]:
         """
         Register a new user.
         
@@ -95,8 +96,8 @@ class AuthService:
         
         try:
             self.db.add(user)
-            self.db.commit()
-            self.db.refresh(user)
+            await self.db.commit()
+            await self.db.refresh(user)
             logger.info(f"User registered: {user.username} ({user.email})")
             
             # Generate tokens for immediate login
@@ -113,11 +114,11 @@ class AuthService:
                 expires_at=expires_at
             )
             self.db.add(refresh_token)
-            self.db.commit()
+            await self.db.commit()
             
             return user, access_token, refresh_token_str
         except IntegrityError as e:
-            self.db.rollback()
+            await self.db.rollback()
             if "email" in str(e):
                 raise UserAlreadyExistsError(f"Email {request.email} already registered")
             elif "username" in str(e):
@@ -125,7 +126,7 @@ class AuthService:
             else:
                 raise UserAlreadyExistsError("User already exists")
     
-    def authenticate_user(self, request: UserLoginRequest) -> tuple[User, str, str]:
+    async def authenticate_user(self, request: UserLoginRequest) -> tuple[User, str, str]:
         """
         Authenticate user and generate tokens.
         
@@ -141,9 +142,10 @@ class AuthService:
         """
         # Find user by email or username
         identifier = request.username_or_email.lower()
-        user = self.db.query(User).filter(
-            (User.email == identifier) | (User.username == identifier)
-        ).first()
+        result = await self.db.execute(
+            select(User).where((User.email == identifier) | (User.username == identifier))
+        )
+        user = result.scalars().first()
         
         if not user:
             raise InvalidCredentialsError("Invalid username/email or password")
@@ -161,7 +163,7 @@ class AuthService:
             # Increment failed attempts
             user.failed_login_attempts += 1
             user.locked_until = security.get_lockout_until(user.failed_login_attempts)
-            self.db.commit()
+            await self.db.commit()
             
             raise InvalidCredentialsError("Invalid username/email or password")
         
@@ -173,7 +175,7 @@ class AuthService:
         user.failed_login_attempts = 0
         user.locked_until = None
         user.last_login = datetime.utcnow()
-        self.db.commit()
+        await self.db.commit()
         
         # Generate tokens
         access_token = security.create_access_token(
@@ -189,12 +191,12 @@ class AuthService:
             expires_at=expires_at
         )
         self.db.add(refresh_token)
-        self.db.commit()
+        await self.db.commit()
         
         logger.info(f"User logged in: {user.username}")
         return user, access_token, refresh_token_str
     
-    def refresh_access_token(self, refresh_token_str: str) -> tuple[User, str, str]:
+    async def refresh_access_token(self, refresh_token_str: str) -> tuple[User, str, str]:
         """
         Refresh access token using refresh token.
         
@@ -208,17 +210,18 @@ class AuthService:
             InvalidCredentialsError: If refresh token is invalid/expired
         """
         # Find refresh token in database
-        refresh_token = self.db.query(RefreshToken).filter(
-            RefreshToken.token == refresh_token_str
-        ).first()
+        result = await self.db.execute(
+            select(RefreshToken).where(RefreshToken.token == refresh_token_str)
+        )
+        refresh_token = result.scalars().first()
         
         if not refresh_token:
             raise InvalidCredentialsError("Invalid refresh token")
         
         # Check expiration
         if refresh_token.is_expired:
-            self.db.delete(refresh_token)
-            self.db.commit()
+            await self.db.delete(refresh_token)
+            await self.db.commit()
             raise InvalidCredentialsError("Refresh token expired")
         
         # Validate token
@@ -227,7 +230,7 @@ class AuthService:
             raise InvalidCredentialsError("Invalid refresh token")
         
         # Get user
-        user = self.db.query(User).filter(User.id == refresh_token.user_id).first()
+        user = await self.get_user_by_id(refresh_token.user_id)
         if not user or not user.is_active:
             raise InvalidCredentialsError("User not found or inactive")
         
@@ -239,34 +242,35 @@ class AuthService:
         new_refresh_token_str, new_expires_at = security.create_refresh_token(str(user.id))
         
         # Delete old refresh token and create new one
-        self.db.delete(refresh_token)
+        await self.db.delete(refresh_token)
         new_refresh_token = RefreshToken(
             user_id=user.id,
             token=new_refresh_token_str,
             expires_at=new_expires_at
         )
         self.db.add(new_refresh_token)
-        self.db.commit()
+        await self.db.commit()
         
         return user, new_access_token, new_refresh_token_str
     
-    def logout_user(self, refresh_token_str: str) -> None:
+    async def logout_user(self, refresh_token_str: str) -> None:
         """
         Logout user by invalidating refresh token.
         
         Args:
             refresh_token_str: Refresh token to invalidate
         """
-        refresh_token = self.db.query(RefreshToken).filter(
-            RefreshToken.token == refresh_token_str
-        ).first()
+        result = await self.db.execute(
+            select(RefreshToken).where(RefreshToken.token == refresh_token_str)
+        )
+        refresh_token = result.scalars().first()
         
         if refresh_token:
-            self.db.delete(refresh_token)
-            self.db.commit()
+            await self.db.delete(refresh_token)
+            await self.db.commit()
             logger.info(f"User logged out: {refresh_token.user_id}")
     
-    def change_password(
+    async def change_password(
         self,
         user_id: uuid.UUID,
         current_password: str,
@@ -284,7 +288,7 @@ class AuthService:
             InvalidCredentialsError: If current password is wrong
             WeakPasswordError: If new password doesn't meet requirements
         """
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = await self.get_user_by_id(user_id)
         if not user:
             raise InvalidCredentialsError("User not found")
         
@@ -302,12 +306,12 @@ class AuthService:
         user.updated_at = datetime.utcnow()
         
         # Invalidate all refresh tokens (force re-login on all devices)
-        self.db.query(RefreshToken).filter(RefreshToken.user_id == user_id).delete()
+        await self.db.execute(delete(RefreshToken).where(RefreshToken.user_id == user_id))
         
-        self.db.commit()
+        await self.db.commit()
         logger.info(f"Password changed for user: {user.username}")
     
-    def get_user_by_id(self, user_id: uuid.UUID) -> Optional[User]:
+    async def get_user_by_id(self, user_id: uuid.UUID) -> Optional[User]:
         """
         Get user by ID.
         
@@ -317,4 +321,5 @@ class AuthService:
         Returns:
             User or None
         """
-        return self.db.query(User).filter(User.id == user_id).first()
+        result = await self.db.execute(select(User).where(User.id == user_id))
+        return result.scalars().first()
@@ -10,7 +10,8 @@ from .chunker import (
     CodeAwareChunker,
     Chunk,
     ChunkMetadata,
-    ChunkerFactory
+    ChunkerFactory,
+    make_chunk_id
 )
 
 __all__ = [
@@ -21,4 +22,5 @@ __all__ = [
     "Chunk",
     "ChunkMetadata",
     "ChunkerFactory",
+    "make_chunk_id",
 ]
@@ -4,17 +4,109 @@ Splits sections into embeddings-ready chunks.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Union
+from typing import Iterable, Iterator, List, Optional, Union
 from dataclasses import dataclass, field
 from pathlib import Path
-import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+import hashlib
+import multiprocessing
+import os
+import re
+import sys
 import logging
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from devmind.processing.code_processor import CodeSection
 from devmind.processing.doc_processor import DocSection
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"\S+")
+
+
+@lru_cache(maxsize=1)
+def process_pool_context():
+    """
+    Get the multiprocessing context for worker pools.
+    
+    Pools are created inside the threaded API server (model, FAISS and
+    job-writer threads); forked children can deadlock on locks held by
+    those threads, so workers are started via forkserver, or spawn where
+    forkserver is unavailable.
+    
+    Returns:
+        Multiprocessing context to pass as mp_context
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+@lru_cache(maxsize=8192)
+def _intern_path(path_str: str) -> Path:
+    """
+    Return a shared Path instance for a path string.
+    
+    All chunks from the same file reference one Path object instead of
+    one each. Bounded because Path objects cannot be weakly referenced.
+    
+    Args:
+        path_str: File path as a string
+        
+    Returns:
+        Cached Path for path_str
+    """
+    return Path(path_str)
+
+
+def _word_spans(content: str):
+    """
+    Locate words in content without materializing them as strings.
+    
+    Args:
+        content: Text to scan
+        
+    Returns:
+        (N, 2) int32 array of (start, end) offsets, or a list of
+        (start, end) tuples when numpy is unavailable
+    """
+    spans = (m.span() for m in _WORD_RE.finditer(content))
+    if NUMPY_AVAILABLE:
+        return np.fromiter(chain.from_iterable(spans), dtype=np.int32).reshape(-1, 2)
+    return list(spans)
+
+
+def make_chunk_id(source_file: Path, section_key: str, chunk_index: int, content: str) -> str:
+    """
+    Derive a deterministic chunk ID from its source, position and content.
+    
+    Re-ingesting an unchanged file yields the same IDs, so downstream
+    stores can skip chunks they already hold. The section key places the
+    chunk within its file: identical text in two sections gets distinct
+    IDs, and a section that moves gets new IDs (and fresh line metadata).
+    
+    Args:
+        source_file: Source file path
+        section_key: Position of the chunk's section within the file
+        chunk_index: Index of the chunk within its section
+        content: Chunk content
+        
+    Returns:
+        32-character hex digest
+    """
+    digest = hashlib.blake2b(
+        f"{source_file}|{section_key}|{chunk_index}|".encode(), digest_size=16
+    )
+    digest.update(content.encode())
+    return digest.hexdigest()
+
 
 @dataclass
 class ChunkMetadata:
@@ -74,6 +166,22 @@ class BaseChunker(ABC):
         """
         pass
     
+    def iter_chunk(self, sections: Iterable[Union[CodeSection, DocSection]]) -> Iterator[Chunk]:
+        """
+        Yield chunks as they are produced.
+        
+        Lets consumers such as the encoder start on the first chunks while
+        the rest are still being cut. Strategies that can stream override
+        this; the default falls back to chunk().
+        
+        Args:
+            sections: Sections to chunk (a list, or a lazy iterable)
+            
+        Yields:
+            Chunk objects
+        """
+        yield from self.chunk(sections)
+    
     def create_chunk(
         self, 
         content: str, 
@@ -97,16 +205,39 @@ class BaseChunker(ABC):
         Returns:
             Chunk object
         """
+        if "language" in kwargs:
+            kwargs["language"] = sys.intern(kwargs["language"])
+        
         metadata = ChunkMetadata(
-            source_file=source_file,
+            source_file=_intern_path(str(source_file)),
             chunk_index=chunk_index,
             total_chunks=total_chunks,
-            section_type=section_type,
+            section_type=sys.intern(section_type),
             **kwargs
         )
         
+        return self._make_chunk(content, metadata)
+    
+    def _make_chunk(self, content: str, metadata: ChunkMetadata) -> Chunk:
+        """
+        Wrap content and prebuilt metadata into a Chunk with its ID.
+        
+        Args:
+            content: Chunk content
+            metadata: Chunk metadata
+            
+        Returns:
+            Chunk object
+        """
+        # Code sections are placed by line span, doc sections by number
+        section_key = (
+            f"{metadata.start_line}-{metadata.end_line}:"
+            f"{metadata.extra.get('section_number', 0)}"
+        )
         return Chunk(
-            chunk_id=str(uuid.uuid4()),
+            chunk_id=make_chunk_id(
+                metadata.source_file, section_key, metadata.chunk_index, content
+            ),
             content=content,
             metadata=metadata
         )
@@ -117,93 +248,160 @@ class FixedSizeChunker(BaseChunker):
     Simple fixed-size chunking strategy.
     
     Splits text into chunks of approximately chunk_size characters.
+    Large section lists are chunked across a process pool.
     """
     
-    def chunk(self, sections: List[Union[CodeSection, DocSection]]) -> List[Chunk]:
+    # Below this many sections, process start-up costs more than it saves
+    PARALLEL_MIN_SECTIONS = 512
+    # Sections handed to a worker per task
+    PARALLEL_TASK_SIZE = 64
+    
+    def __init__(
+        self,
+        chunk_size: int = 512,
+        chunk_overlap: int = 50,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Initialize chunker.
+        
+        Args:
+            chunk_size: Target size of chunks (in words)
+            chunk_overlap: Overlap between chunks (in words)
+            max_workers: Worker processes for large inputs (None = CPU count, 1 = serial)
+        """
+        super().__init__(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        self.max_workers = max_workers or os.cpu_count() or 1
+    
+    def chunk(self, sections: Iterable[Union[CodeSection, DocSection]]) -> List[Chunk]:
         """
         Chunk sections using fixed-size strategy.
         
+        Accepts any iterable; sections from a generator are consumed one
+        at a time rather than materialized first.
+        
         Returns:
             List of Chunk objects
         """
-        logger.info(f"Chunking {len(sections)} sections with FixedSizeChunker")
+        all_chunks = list(self.iter_chunk(sections))
+        logger.info(f"Generated {len(all_chunks)} chunks")
+        return all_chunks
+    
+    def iter_chunk(self, sections: Iterable[Union[CodeSection, DocSection]]) -> Iterator[Chunk]:
+        """
+        Yield chunks section by section, in input order.
         
-        all_chunks = []
+        Only sized inputs (lists) are chunked in parallel: executor.map
+        would drain a generator up front, defeating streaming.
         
-        for section in sections:
-            content = section.content
-            
-            # Skip empty sections
-            if not content or not content.strip():
-                continue
-            
-            # Split into words for token approximation
-            words = content.split()
+        Yields:
+            Chunk objects
+        """
+        sized = hasattr(sections, "__len__")
+        if sized:
+            logger.info(f"Chunking {len(sections)} sections with FixedSizeChunker")
+        else:
+            logger.info("Chunking streamed sections with FixedSizeChunker")
+        
+        if sized and self.max_workers > 1 and len(sections) >= self.PARALLEL_MIN_SECTIONS:
+            # Sections are independent, so chunk them in worker processes
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=process_pool_context()
+            ) as executor:
+                yield from chain.from_iterable(executor.map(
+                    self._chunk_section,
+                    sections,
+                    chunksize=self.PARALLEL_TASK_SIZE
+                ))
+        else:
+            yield from chain.from_iterable(map(self._chunk_section, sections))
+    
+    def _chunk_section(self, section: Union[CodeSection, DocSection]) -> List[Chunk]:
+        """
+        Chunk a single section.
+        
+        Args:
+            section: Section to chunk
             
-            # If section fits in one chunk, create single chunk
-            if len(words) <= self.chunk_size:
-                chunk = self._create_chunk_from_section(
+        Returns:
+            Chunks for this section (empty for blank sections)
+        """
+        content = section.content
+        
+        # Skip empty sections
+        if not content or not content.strip():
+            return []
+        
+        # Resolve the source path once and share it across all chunks
+        source_file = _intern_path(section.metadata.get("file_path", ""))
+        
+        # Word offsets for token approximation; chunks are sliced from content
+        spans = _word_spans(content)
+        num_words = len(spans)
+        
+        # If section fits in one chunk, create single chunk
+        if num_words <= self.chunk_size:
+            return [
+                self._create_chunk_from_section(
                     section, 
                     content, 
+                    source_file,
                     chunk_index=0,
                     total_chunks=1
                 )
-                all_chunks.append(chunk)
-                continue
+            ]
+        
+        # Otherwise, split into multiple chunks with overlap
+        section_chunks = []
+        start_idx = 0
+        chunk_index = 0
+        
+        while start_idx < num_words:
+            # Slice from the first word's start to the last word's end
+            end_idx = min(start_idx + self.chunk_size, num_words)
+            chunk_content = content[spans[start_idx][0]:spans[end_idx - 1][1]]
             
-            # Otherwise, split into multiple chunks with overlap
-            section_chunks = []
-            start_idx = 0
-            chunk_index = 0
+            section_chunks.append((chunk_content, chunk_index))
+            chunk_index += 1
             
-            while start_idx < len(words):
-                # Get chunk words
-                end_idx = min(start_idx + self.chunk_size, len(words))
-                chunk_words = words[start_idx:end_idx]
-                chunk_content = ' '.join(chunk_words)
-                
-                section_chunks.append((chunk_content, chunk_index))
-                chunk_index += 1
-                
-                # Move start with overlap
-                start_idx += (self.chunk_size - self.chunk_overlap)
-                
-                # Break if we've covered all words
-                if end_idx >= len(words):
-                    break
+            # Move start with overlap
+            start_idx += (self.chunk_size - self.chunk_overlap)
             
-            # Create Chunk objects
-            total_chunks = len(section_chunks)
-            for chunk_content, idx in section_chunks:
-                chunk = self._create_chunk_from_section(
-                    section,
-                    chunk_content,
-                    chunk_index=idx,
-                    total_chunks=total_chunks
-                )
-                all_chunks.append(chunk)
+            # Break if we've covered all words
+            if end_idx >= num_words:
+                break
         
-        logger.info(f"Generated {len(all_chunks)} chunks")
-        return all_chunks
+        # Create Chunk objects
+        total_chunks = len(section_chunks)
+        return [
+            self._create_chunk_from_section(
+                section,
+                chunk_content,
+                source_file,
+                chunk_index=idx,
+                total_chunks=total_chunks
+            )
+            for chunk_content, idx in section_chunks
+        ]
     
     def _create_chunk_from_section(
         self,
         section: Union[CodeSection, DocSection],
         content: str,
+        source_file: Path,
         chunk_index: int,
         total_chunks: int
     ) -> Chunk:
-        """Create a Chunk from a section."""
-        from devmind.processing.code_processor import CodeSection
-        
+        """Create a Chunk from a section (source_file is resolved once per section)."""
         # Extract common metadata
         if isinstance(section, CodeSection):
             metadata = ChunkMetadata(
-                source_file=Path(section.metadata.get("file_path", "")),
+                source_file=source_file,
                 chunk_index=chunk_index,
                 total_chunks=total_chunks,
-                section_type=section.section_type,
-                language=section.language,
+                section_type=sys.intern(section.section_type),
+                language=sys.intern(section.language),
                 start_line=section.start_line,
                 end_line=section.end_line,
                 extra={
@@ -214,10 +412,10 @@ class FixedSizeChunker(BaseChunker):
             )
         else:  # DocSection
             metadata = ChunkMetadata(
-                source_file=Path(section.metadata.get("file_path", "")),
+                source_file=source_file,
                 chunk_index=chunk_index,
                 total_chunks=total_chunks,
-                section_type=section.section_type,
+                section_type=sys.intern(section.section_type),
                 extra={
                     "heading": section.heading,
                     "heading_level": section.heading_level,
@@ -225,17 +423,7 @@ class FixedSizeChunker(BaseChunker):
                 }
             )
         
-        return self.create_chunk(
-            content=content,
-            source_file=metadata.source_file,
-            chunk_index=chunk_index,
-            total_chunks=total_chunks,
-            section_type=metadata.section_type,
-            language=metadata.language,
-            start_line=metadata.start_line,
-            end_line=metadata.end_line,
-            extra=metadata.extra
-        )
+        return self._make_chunk(content, metadata)
 
 
 class OverlappingChunker(BaseChunker):
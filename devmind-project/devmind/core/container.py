@@ -230,7 +230,18 @@ class DIContainer:
                 logger.error(error_msg)
                 shutdown_errors.append(error_msg)
         
-        # 3. Close any open connections/resources
+        # 3. Close pooled LLM provider connections
+        if self._llm_manager:
+            try:
+                logger.info("Closing LLM provider connections...")
+                await self._llm_manager.aclose()
+                logger.info("LLM provider connections closed")
+            except Exception as e:
+                error_msg = f"Error closing LLM providers: {e}"
+                logger.error(error_msg)
+                shutdown_errors.append(error_msg)
+        
+        # 4. Close any other open connections/resources
         # (Add more cleanup as needed for future resources)
         
         if shutdown_errors:
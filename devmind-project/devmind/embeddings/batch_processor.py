@@ -3,10 +3,13 @@ Batch Processor for DevMind Embedding Service.
 Handles efficient batch processing of large text datasets.
 """
 
-from typing import List, Generator, Tuple, Optional
+from typing import Dict, List, Generator, Tuple, Optional, Union
+from bisect import bisect_left
+from pathlib import Path
 import numpy as np
 from tqdm import tqdm
 import logging
+from .encoder import quantize_int8
 
 logger = logging.getLogger(__name__)
 
@@ -14,16 +17,37 @@ logger = logging.getLogger(__name__)
 class BatchProcessor:
     """Processes large batches of texts for embedding."""
     
-    def __init__(self, encoder, batch_size: int = 32):
+    # Token-length bucket boundaries; longer texts share a final bucket
+    LENGTH_BUCKETS = (32, 64, 128, 256, 512)
+    
+    # Batches written to a memory-mapped output between flushes
+    MEMMAP_FLUSH_INTERVAL = 64
+    
+    def __init__(
+        self, 
+        encoder, 
+        batch_size: int = 32, 
+        output_dtype: str = "float32",
+        num_workers: int = 1,
+        devices: Optional[List[str]] = None
+    ):
         """
         Initialize BatchProcessor.
         
         Args:
             encoder: Encoder instance to use
             batch_size: Number of texts to process at once
+            output_dtype: Embedding dtype ("float32" or "int8")
+            num_workers: Encoding processes for process_all; > 1 shards
+                texts across a SentenceTransformer multi-process pool
+            devices: Device per worker process (e.g. ["cuda:0", "cuda:1"]);
+                defaults to num_workers CPU workers
         """
         self.encoder = encoder
         self.batch_size = batch_size
+        self.output_dtype = output_dtype
+        self.devices = devices or (["cpu"] * num_workers if num_workers > 1 else None)
+        self._pool = None
         logger.info(f"BatchProcessor initialized with batch_size: {batch_size}")
         
     def process_batches(
@@ -35,6 +59,10 @@ class BatchProcessor:
         """
         Process texts in batches, yielding (embeddings, metadata).
         
+        Texts are grouped into token-length buckets (see LENGTH_BUCKETS) so
+        each batch holds texts of similar length and needs little padding.
+        Within a bucket, texts keep their input order.
+        
         Args:
             texts: List of texts to encode
             metadatas: Optional list of metadata dicts (same length as texts)
@@ -43,31 +71,56 @@ class BatchProcessor:
         Yields:
             Tuple of (batch_embeddings, batch_metadatas)
         """
+        for _, embeddings, batch_meta in self._iter_batches(texts, metadatas, show_progress):
+            yield embeddings, batch_meta
+    
+    def _iter_batches(
+        self, 
+        texts: List[str],
+        metadatas: Optional[List[dict]] = None,
+        show_progress: bool = True
+    ) -> Generator[Tuple[List[int], np.ndarray, List[dict]], None, None]:
+        """
+        Encode length-bucketed batches, yielding their input indices too.
+        
+        Yields:
+            Tuple of (input_indices, batch_embeddings, batch_metadatas)
+        """
         if metadatas is not None and len(metadatas) != len(texts):
             raise ValueError(
                 f"Metadatas length ({len(metadatas)}) must match "
                 f"texts length ({len(texts)})"
             )
         
-        total_batches = (len(texts) + self.batch_size - 1) // self.batch_size
+        # Group input indices by length bucket, then cut each group into batches
+        buckets: Dict[int, List[int]] = {}
+        for i, length in enumerate(self._token_lengths(texts)):
+            buckets.setdefault(bisect_left(self.LENGTH_BUCKETS, length), []).append(i)
+        
+        batches = [
+            indices[j:j + self.batch_size]
+            for _, indices in sorted(buckets.items())
+            for j in range(0, len(indices), self.batch_size)
+        ]
+        
         logger.info(
-            f"Processing {len(texts)} texts in {total_batches} batches "
-            f"of size {self.batch_size}"
+            f"Processing {len(texts)} texts in {len(batches)} batches "
+            f"of size {self.batch_size} across {len(buckets)} length buckets"
         )
         
-        iterator = range(0, len(texts), self.batch_size)
+        iterator = batches
         if show_progress:
             iterator = tqdm(
                 iterator, 
-                total=total_batches, 
+                total=len(batches), 
                 desc="Encoding batches",
                 unit="batch"
             )
         
-        for i in iterator:
-            batch_texts = texts[i:i + self.batch_size]
+        for batch_indices in iterator:
+            batch_texts = [texts[i] for i in batch_indices]
             batch_meta = (
-                metadatas[i:i + self.batch_size] 
+                [metadatas[i] for i in batch_indices]
                 if metadatas is not None 
                 else [{}] * len(batch_texts)
             )
@@ -76,20 +129,40 @@ class BatchProcessor:
                 embeddings = self.encoder.encode_batch(
                     batch_texts,
                     batch_size=self.batch_size,
-                    show_progress=False  # We're already showing progress
+                    show_progress=False,  # We're already showing progress
+                    output_dtype=self.output_dtype
                 )
-                yield embeddings, batch_meta
+                yield batch_indices, embeddings, batch_meta
                 
             except Exception as e:
-                logger.error(f"Error processing batch starting at index {i}: {e}")
+                logger.error(f"Error processing batch starting at index {batch_indices[0]}: {e}")
                 # Yield empty batch or skip
                 continue
     
+    def _token_lengths(self, texts: List[str]) -> List[int]:
+        """
+        Get the token count of each text, used to pick its length bucket.
+        
+        Falls back to whitespace word counts if the model has no tokenizer.
+        """
+        tokenizer = getattr(getattr(self.encoder, "model", None), "tokenizer", None)
+        if tokenizer is None:
+            return [len(text.split()) for text in texts]
+        
+        encoded = tokenizer(
+            texts,
+            add_special_tokens=True,
+            truncation=True,
+            max_length=self.LENGTH_BUCKETS[-1]
+        )
+        return [len(ids) for ids in encoded["input_ids"]]
+    
     def process_all(
         self,
         texts: List[str],
         metadatas: Optional[List[dict]] = None,
-        show_progress: bool = True
+        show_progress: bool = True,
+        output_path: Optional[Union[str, Path]] = None
     ) -> Tuple[np.ndarray, List[dict]]:
         """
         Process all texts and return all embeddings and metadata.
@@ -98,26 +171,152 @@ class BatchProcessor:
             texts: List of texts to encode
             metadatas: Optional list of metadata dicts
             show_progress: Whether to show progress bar
+            output_path: Optional file to stream embeddings into. The
+                result is then an np.memmap backed by that file, so the
+                embeddings never have to fit in RAM at once. Rows of
+                failed batches are left as zero vectors.
             
         Returns:
             Tuple of (all_embeddings, all_metadatas)
         """
-        all_embeddings = []
-        all_metadatas = []
+        if metadatas is not None and len(metadatas) != len(texts):
+            raise ValueError(
+                f"Metadatas length ({len(metadatas)}) must match "
+                f"texts length ({len(texts)})"
+            )
+        
+        if output_path is not None:
+            return self._process_to_memmap(texts, metadatas, show_progress, output_path)
+        
+        if texts and self.devices and hasattr(self.encoder.model, "start_multi_process_pool"):
+            all_metadatas = list(metadatas) if metadatas is not None else [{} for _ in texts]
+            return self._encode_multi_process(texts), all_metadatas
+        
+        # Encode the whole corpus in one call so SentenceTransformer can
+        # length-sort across all texts and pad each mini-batch minimally
+        if texts:
+            try:
+                embeddings = self.encoder.encode_batch(
+                    texts,
+                    batch_size=self.batch_size,
+                    show_progress=show_progress,
+                    output_dtype=self.output_dtype
+                )
+                all_metadatas = (
+                    list(metadatas) if metadatas is not None 
+                    else [{} for _ in texts]
+                )
+                return embeddings, all_metadatas
+            except Exception as e:
+                logger.error(
+                    f"Single-pass encoding failed ({e}), "
+                    f"falling back to per-batch encoding"
+                )
         
-        for embeddings, batch_meta in self.process_batches(
+        # Preallocate the output and scatter each batch into its input rows
+        result = np.empty(
+            (len(texts), self.encoder.get_embedding_dim()), dtype=self.output_dtype
+        )
+        encoded = np.zeros(len(texts), dtype=bool)
+        
+        for batch_indices, embeddings, _ in self._iter_batches(
             texts, metadatas, show_progress
         ):
-            all_embeddings.append(embeddings)
-            all_metadatas.extend(batch_meta)
+            result[batch_indices] = embeddings
+            encoded[batch_indices] = True
+        
+        all_metadatas = list(metadatas) if metadatas is not None else [{} for _ in texts]
         
-        if not all_embeddings:
+        if not encoded.any():
             logger.warning("No embeddings generated")
-            return (
-                np.array([], dtype=np.float32).reshape(
-                    0, self.encoder.get_embedding_dim()
-                ),
-                []
-            )
+            return result[:0], []
+        
+        if encoded.all():
+            return result, all_metadatas
+        
+        # Failed batches are skipped; keep only rows that were encoded
+        keep = np.flatnonzero(encoded)
+        return result[keep], [all_metadatas[i] for i in keep]
+    
+    def _process_to_memmap(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[dict]],
+        show_progress: bool,
+        output_path: Union[str, Path]
+    ) -> Tuple[np.memmap, List[dict]]:
+        """
+        Encode batch by batch straight into a memory-mapped file.
         
-        return np.vstack(all_embeddings), all_metadatas
+        Args:
+            texts: List of texts to encode
+            metadatas: Optional list of metadata dicts
+            show_progress: Whether to show progress bar
+            output_path: File backing the returned memmap
+            
+        Returns:
+            Tuple of (memmap_embeddings, all_metadatas)
+        """
+        # np.memmap can't map an empty file
+        shape = (max(len(texts), 1), self.encoder.get_embedding_dim())
+        result = np.memmap(output_path, dtype=self.output_dtype, mode="w+", shape=shape)
+        failed = len(texts)
+        
+        for n, (batch_indices, embeddings, _) in enumerate(
+            self._iter_batches(texts, metadatas, show_progress), start=1
+        ):
+            result[batch_indices] = embeddings
+            failed -= len(batch_indices)
+            if n % self.MEMMAP_FLUSH_INTERVAL == 0:
+                result.flush()
+        
+        result.flush()
+        if failed:
+            logger.warning(f"{failed} texts failed to encode and were left as zero vectors")
+        
+        all_metadatas = list(metadatas) if metadatas is not None else [{} for _ in texts]
+        return result[:len(texts)], all_metadatas
+    
+    def _encode_multi_process(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts across the worker pool, starting it on first use.
+        
+        Mirrors Encoder.encode_batch: empty texts get zero vectors and
+        embeddings are L2-normalized.
+        
+        Args:
+            texts: List of texts to encode
+            
+        Returns:
+            numpy array of shape (num_texts, embedding_dim)
+        """
+        model = self.encoder.model
+        if self._pool is None:
+            logger.info(f"Starting encoding pool on devices: {self.devices}")
+            self._pool = model.start_multi_process_pool(target_devices=self.devices)
+        
+        result = np.zeros(
+            (len(texts), self.encoder.get_embedding_dim()), dtype=self.output_dtype
+        )
+        valid_indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not valid_indices:
+            return result
+        
+        embeddings = model.encode_multi_process(
+            [texts[i] for i in valid_indices], 
+            self._pool, 
+            batch_size=self.batch_size
+        )
+        embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+        
+        result[valid_indices] = (
+            quantize_int8(embeddings) if self.output_dtype == "int8" else embeddings
+        )
+        return result
+    
+    def close(self) -> None:
+        """Stop the multi-process encoding pool, if one was started."""
+        if self._pool is not None:
+            self.encoder.model.stop_multi_process_pool(self._pool)
+            self._pool = None
+            logger.info("Encoding pool stopped")
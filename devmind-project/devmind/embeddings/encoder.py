@@ -3,13 +3,53 @@ Encoder for DevMind Embedding Service.
 Converts text to vector embeddings.
 """
 
-from typing import List, Union
+from typing import List, Literal, Union
 import numpy as np
+import torch
 import logging
 from .model_manager import get_model_manager, ModelManager
 
 logger = logging.getLogger(__name__)
 
+# Supported output dtypes
+OutputDType = Literal["float32", "int8"]
+_NUMPY_DTYPES = {"float32": np.float32, "int8": np.int8}
+
+
+def _numpy_dtype(output_dtype: str, normalize: bool):
+    """
+    Map an output dtype name to its numpy dtype.
+    
+    Raises:
+        ValueError: If the dtype is unknown, or int8 is requested for
+            unnormalized embeddings (which have no fixed range)
+    """
+    if output_dtype not in _NUMPY_DTYPES:
+        raise ValueError(
+            f"Unknown output dtype: {output_dtype}. "
+            f"Available: {list(_NUMPY_DTYPES.keys())}"
+        )
+    if output_dtype == "int8" and not normalize:
+        raise ValueError("int8 output requires normalize=True")
+    return _NUMPY_DTYPES[output_dtype]
+
+
+def quantize_int8(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Quantize unit-normalized embeddings to int8.
+    
+    Components of normalized vectors lie in [-1, 1], so a fixed scale of
+    127 is used. Unlike per-batch calibration, this keeps embeddings from
+    different calls comparable.
+    
+    Args:
+        embeddings: Normalized float embeddings
+        
+    Returns:
+        int8 array of the same shape
+    """
+    return np.clip(np.rint(embeddings * 127.0), -127, 127).astype(np.int8)
+
 
 class Encoder:
     """Encodes text into vector embeddings."""
@@ -30,40 +70,91 @@ class Encoder:
         self.model_manager = model_manager or get_model_manager()
         self.model = self.model_manager.get_model(model_type)
         
+        # Fixed per model; avoid walking the module list on every call
+        self._dim = self.model.get_sentence_embedding_dimension()
+        
+        # Single texts bypass model.encode() when the model exposes its
+        # tokenizer and forward pass (SentenceTransformer does)
+        self._fast_single = hasattr(self.model, "tokenize") and hasattr(self.model, "forward")
+        
         logger.info(
             f"Encoder initialized with model_type: {model_type}, "
             f"dimension: {self.get_embedding_dim()}"
         )
         
-    def encode(self, text: str, normalize: bool = True) -> np.ndarray:
+    def encode(
+        self, 
+        text: str, 
+        normalize: bool = True,
+        output_dtype: OutputDType = "float32"
+    ) -> np.ndarray:
         """
         Encode single text to vector.
         
         Args:
             text: Text to encode
             normalize: Whether to normalize embeddings
+            output_dtype: "float32", or "int8" for quantized embeddings
             
         Returns:
             numpy array of shape (embedding_dim,)
         """
+        dtype = _numpy_dtype(output_dtype, normalize)
+        
         if not text or not text.strip():
             logger.warning("Empty text provided to encode(), returning zero vector")
-            return np.zeros(self.get_embedding_dim(), dtype=np.float32)
+            return np.zeros(self.get_embedding_dim(), dtype=dtype)
             
-        embedding = self.model.encode(
-            [text], 
-            normalize_embeddings=normalize,
-            convert_to_numpy=True
-        )[0]
+        if self._fast_single:
+            embedding = self._encode_single(text, normalize)
+        else:
+            embedding = self.model.encode(
+                [text], 
+                normalize_embeddings=normalize,
+                convert_to_numpy=True
+            )[0]
         
+        if output_dtype == "int8":
+            return quantize_int8(embedding)
         return embedding.astype(np.float32)
     
+    @torch.no_grad()
+    def _encode_single(self, text: str, normalize: bool) -> np.ndarray:
+        """
+        Encode one text with a direct forward pass.
+        
+        Skips the DataLoader, length sort and batching model.encode() sets
+        up, which dominate latency for a single query. Pooling still runs
+        through the model's own modules, so results match model.encode().
+        Runs under no_grad like model.encode(), not inference_mode: CUDA
+        graph buffers captured here are reused in place by batch encodes.
+        
+        Args:
+            text: Non-empty text to encode
+            normalize: Whether to L2-normalize the embedding
+            
+        Returns:
+            float32 numpy array of shape (embedding_dim,)
+        """
+        features = self.model.tokenize([text])
+        features = {
+            name: tensor.to(self.model.device) 
+            for name, tensor in features.items()
+        }
+        embedding = self.model.forward(features)["sentence_embedding"][0]
+        
+        if normalize:
+            embedding = torch.nn.functional.normalize(embedding, p=2, dim=0)
+        
+        return embedding.float().cpu().numpy()
+    
     def encode_batch(
         self, 
         texts: List[str], 
         batch_size: int = 32,
         show_progress: bool = False,
-        normalize: bool = True
+        normalize: bool = True,
+        output_dtype: OutputDType = "float32"
     ) -> np.ndarray:
         """
         Encode multiple texts to vectors.
@@ -73,13 +164,16 @@ class Encoder:
             batch_size: Batch size for encoding
             show_progress: Whether to show progress bar
             normalize: Whether to normalize embeddings
+            output_dtype: "float32", or "int8" for quantized embeddings
             
         Returns:
             numpy array of shape (num_texts, embedding_dim)
         """
+        dtype = _numpy_dtype(output_dtype, normalize)
+        
         if not texts:
             logger.warning("Empty texts list provided to encode_batch()")
-            return np.array([], dtype=np.float32).reshape(0, self.get_embedding_dim())
+            return np.array([], dtype=dtype).reshape(0, self.get_embedding_dim())
         
         # Filter out empty texts but keep track of indices
         valid_texts = []
@@ -92,7 +186,7 @@ class Encoder:
         
         if not valid_texts:
             logger.warning("No valid texts in batch, returning zero vectors")
-            return np.zeros((len(texts), self.get_embedding_dim()), dtype=np.float32)
+            return np.zeros((len(texts), self.get_embedding_dim()), dtype=dtype)
         
         # Encode valid texts
         embeddings = self.model.encode(
@@ -101,14 +195,18 @@ class Encoder:
             normalize_embeddings=normalize,
             show_progress_bar=show_progress,
             convert_to_numpy=True
-        ).astype(np.float32)
+        )
+        embeddings = (
+            quantize_int8(embeddings) if output_dtype == "int8" 
+            else embeddings.astype(np.float32)
+        )
         
         # If all texts were valid, return directly
         if len(valid_texts) == len(texts):
             return embeddings
         
         # Otherwise, create result array with zero vectors for invalid texts
-        result = np.zeros((len(texts), self.get_embedding_dim()), dtype=np.float32)
+        result = np.zeros((len(texts), self.get_embedding_dim()), dtype=dtype)
         result[valid_indices] = embeddings
         
         return result
@@ -120,7 +218,7 @@ class Encoder:
         Returns:
             Embedding dimension
         """
-        return self.model.get_sentence_embedding_dimension()
+        return self._dim
     
     def get_model_info(self) -> dict:
         """
@@ -4,12 +4,140 @@ Handles loading, caching, and managing embedding models.
 """
 
 from sentence_transformers import SentenceTransformer
-from typing import Dict, Optional
+from typing import Dict, Literal, Optional, Sequence, Tuple
+from bisect import bisect_left
+import os
+import threading
 import torch
 import logging
+from .onnx_model import load_onnx_model
 
 logger = logging.getLogger(__name__)
 
+# Inference engines a model can be run with
+Engine = Literal["pytorch", "onnx", "tensorrt"]
+
+
+class CUDAGraphModel(torch.nn.Module):
+    """
+    Replays a captured CUDA graph per (bucket_len, batch_size) input shape.
+    
+    Wraps a transformer's auto_model. Inputs are padded up to the nearest
+    bucket length, so every batch in a bucket reuses one static graph and
+    skips per-kernel launch overhead. Outputs are sliced back to the
+    original sequence length so downstream pooling sees the usual shapes.
+    Sequences longer than the last bucket, calls with autograd enabled
+    and calls that don't pass return_dict=False run the wrapped model
+    eagerly. Graph replays are serialized, since each shape has a single
+    set of static buffers shared by all callers.
+    """
+    
+    # Eager forwards run before capturing a graph
+    WARMUP_STEPS = 3
+    
+    def __init__(self, model: torch.nn.Module, buckets: Sequence[int]):
+        """
+        Initialize the graph wrapper.
+        
+        Args:
+            model: Transformer model (e.g. a HuggingFace AutoModel) on CUDA
+            buckets: Ascending sequence-length buckets to pad inputs to
+        """
+        super().__init__()
+        self.model = model
+        self.buckets = tuple(buckets)
+        self._graphs: Dict[
+            Tuple[int, int],
+            Tuple[torch.cuda.CUDAGraph, Dict[str, torch.Tensor], Tuple[torch.Tensor, ...]]
+        ] = {}
+        
+        # Guards capture and the copy-in/replay/copy-out of static buffers
+        self._lock = threading.Lock()
+    
+    def __getattr__(self, name: str):
+        try:
+            return super().__getattr__(name)
+        except AttributeError:
+            # Delegate config, embeddings etc. to the wrapped model
+            return getattr(super().__getattr__("model"), name)
+    
+    def forward(
+        self,
+        input_ids: torch.Tensor,
+        attention_mask: torch.Tensor,
+        token_type_ids: Optional[torch.Tensor] = None,
+        **kwargs
+    ):
+        inputs = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if token_type_ids is not None:
+            inputs["token_type_ids"] = token_type_ids
+        
+        batch_size, seq_len = input_ids.shape
+        bucket = bisect_left(self.buckets, seq_len)
+        if (
+            bucket == len(self.buckets) 
+            or torch.is_grad_enabled() 
+            or kwargs.get("return_dict", True)
+        ):
+            return self.model(**inputs, **kwargs)
+        
+        key = (self.buckets[bucket], batch_size)
+        with self._lock:
+            if key not in self._graphs:
+                self._graphs[key] = self._capture(inputs, self.buckets[bucket])
+            graph, static_inputs, static_outputs = self._graphs[key]
+            
+            for name, tensor in inputs.items():
+                static = static_inputs[name]
+                static.zero_()
+                static[:, :seq_len].copy_(tensor)
+            graph.replay()
+            
+            # Copy out of the static buffers, which the next replay overwrites
+            return tuple(
+                out[:, :seq_len].clone() if out.dim() == 3 else out.clone()
+                for out in static_outputs
+            )
+    
+    def _capture(
+        self, 
+        inputs: Dict[str, torch.Tensor], 
+        bucket_len: int
+    ) -> Tuple[torch.cuda.CUDAGraph, Dict[str, torch.Tensor], Tuple[torch.Tensor, ...]]:
+        """
+        Capture the model's forward pass for one padded input shape.
+        
+        Args:
+            inputs: Example inputs (only shapes and dtypes are used)
+            bucket_len: Sequence length to pad the static inputs to
+            
+        Returns:
+            Tuple of (graph, static_inputs, static_outputs)
+        """
+        batch_size = inputs["input_ids"].shape[0]
+        static_inputs = {
+            name: torch.zeros(
+                (batch_size, bucket_len), dtype=tensor.dtype, device=tensor.device
+            )
+            for name, tensor in inputs.items()
+        }
+        static_inputs["attention_mask"].fill_(1)
+        
+        # Warm up on a side stream so lazy init doesn't end up in the graph
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(self.WARMUP_STEPS):
+                self.model(**static_inputs, return_dict=False)
+        torch.cuda.current_stream().wait_stream(stream)
+        
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph):
+            static_outputs = tuple(self.model(**static_inputs, return_dict=False))
+        
+        logger.debug(f"Captured CUDA graph for shape ({batch_size}, {bucket_len})")
+        return graph, static_inputs, static_outputs
+
 
 class ModelManager:
     """Manages loading and caching of embedding models."""
@@ -21,22 +149,103 @@ class ModelManager:
         "production_code": "BAAI/bge-code-large",
     }
     
-    def __init__(self, device: str = "auto"):
+    # Supported model weight dtypes
+    DTYPE_MAP = {
+        "float32": torch.float32,
+        "float16": torch.float16,
+        "bfloat16": torch.bfloat16,
+    }
+    
+    # Batch size of the dummy encode run after compiling a model
+    WARMUP_BATCH_SIZE = 32
+    
+    # Default cap on intra-op CPU threads; more rarely helps SBERT-sized models
+    MAX_CPU_THREADS = 8
+    
+    # Sequence-length buckets CUDA graphs are captured for
+    GRAPH_BUCKETS = (32, 64, 128, 256, 512)
+    
+    def __init__(
+        self, 
+        device: str = "auto", 
+        dtype: str = "auto",
+        compile_model: bool = False,
+        cuda_graphs: bool = False,
+        engine: Engine = "pytorch",
+        cpu_threads: Optional[int] = None
+    ):
         """
         Initialize Model Manager.
         
         Args:
             device: Device to use ('auto', 'cpu', 'cuda')
+            dtype: Weight dtype ('auto', 'float32', 'float16', 'bfloat16');
+                'auto' uses float16 on CUDA and float32 on CPU
+            compile_model: Compile the transformer with torch.compile on CUDA
+                (opt-in: batches aren't padded to fixed shapes, so the
+                model is compiled with dynamic shapes)
+            cuda_graphs: Replay captured CUDA graphs per (bucket, batch size)
+                instead of compiling; only used on CUDA
+            engine: Inference engine ('pytorch', 'onnx', 'tensorrt'); the
+                ONNX engines need optimum[onnxruntime] and return a
+                SentenceTransformer-compatible wrapper
+            cpu_threads: Intra-op threads for CPU inference (default:
+                min(MAX_CPU_THREADS, cpu count))
         """
         self._models: Dict[str, SentenceTransformer] = {}
+        self._compile_model = compile_model
+        self._cuda_graphs = cuda_graphs
+        
+        if engine not in ("pytorch", "onnx", "tensorrt"):
+            raise ValueError(
+                f"Unknown engine: {engine}. "
+                f"Available engines: ['pytorch', 'onnx', 'tensorrt']"
+            )
+        self._engine = engine
         
         if device == "auto":
             self._device = "cuda" if torch.cuda.is_available() else "cpu"
         else:
             self._device = device
+        
+        if dtype == "auto":
+            dtype = "float16" if self._device.startswith("cuda") else "float32"
+        if dtype not in self.DTYPE_MAP:
+            raise ValueError(
+                f"Unknown dtype: {dtype}. "
+                f"Available dtypes: {list(self.DTYPE_MAP.keys())}"
+            )
+        self._dtype = self.DTYPE_MAP[dtype]
+        
+        if self._device == "cpu":
+            self._configure_cpu(cpu_threads)
             
-        logger.info(f"ModelManager initialized with device: {self._device}")
+        logger.info(
+            f"ModelManager initialized with device: {self._device}, "
+            f"dtype: {dtype}, engine: {engine}"
+        )
+        
+    def _configure_cpu(self, cpu_threads: Optional[int]) -> None:
+        """
+        Set PyTorch threading and enable oneDNN kernels for CPU inference.
+        
+        Args:
+            cpu_threads: Intra-op thread count, or None for the default
+        """
+        if cpu_threads is None:
+            cpu_threads = min(self.MAX_CPU_THREADS, os.cpu_count() or 1)
+        torch.set_num_threads(cpu_threads)
+        
+        try:
+            # Inter-op parallelism only oversubscribes cores for one model
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Can only be set once, before any inter-op work has started
+            logger.debug("Inter-op threads already configured")
         
+        torch.backends.mkldnn.enabled = True
+        logger.info(f"CPU inference using {cpu_threads} threads")
+    
     def load_model(self, model_name: str) -> SentenceTransformer:
         """
         Load model from cache or download.
@@ -49,16 +258,91 @@ class ModelManager:
         """
         if model_name not in self._models:
             logger.info(f"Loading model: {model_name} on {self._device}")
-            self._models[model_name] = SentenceTransformer(
+            if self._engine != "pytorch":
+                self._models[model_name] = load_onnx_model(
+                    model_name, self._engine, self._device
+                )
+                logger.info(f"Model loaded: {model_name}")
+                return self._models[model_name]
+            
+            model = SentenceTransformer(
                 model_name, 
                 device=self._device
             )
+            if self._dtype != torch.float32:
+                # Half-precision weights: half the memory traffic, tensor-core matmuls
+                model = model.to(dtype=self._dtype)
+            if self._use_cuda_graphs():
+                self._wrap_cuda_graphs(model, model_name)
+            elif self._should_compile():
+                self._compile(model, model_name)
+            self._models[model_name] = model
             logger.info(f"Model loaded: {model_name}")
         else:
             logger.debug(f"Using cached model: {model_name}")
             
         return self._models[model_name]
     
+    def _use_cuda_graphs(self) -> bool:
+        """Check whether loaded models should replay captured CUDA graphs."""
+        return (
+            self._cuda_graphs 
+            and self._device.startswith("cuda") 
+            and torch.cuda.is_available()
+        )
+    
+    def _wrap_cuda_graphs(self, model: SentenceTransformer, model_name: str) -> None:
+        """
+        Wrap the model's transformer in a CUDAGraphModel.
+        
+        Graphs are captured lazily on the first batch of each shape.
+        
+        Args:
+            model: Loaded SentenceTransformer
+            model_name: Model name (for logging)
+        """
+        transformer = model[0]
+        if not hasattr(transformer, "auto_model"):
+            return
+        
+        transformer.auto_model = CUDAGraphModel(transformer.auto_model, self.GRAPH_BUCKETS)
+        logger.info(f"Using CUDA graphs for model: {model_name}")
+    
+    def _should_compile(self) -> bool:
+        """Check whether torch.compile should be applied to loaded models."""
+        if not self._compile_model or not self._device.startswith("cuda"):
+            return False
+        major, minor = (int(p) for p in torch.__version__.split(".")[:2])
+        return (major, minor) >= (2, 1)
+    
+    def _compile(self, model: SentenceTransformer, model_name: str) -> None:
+        """
+        Compile the model's transformer in place and warm it up.
+        
+        Falls back to eager execution if compilation fails.
+        
+        Args:
+            model: Loaded SentenceTransformer
+            model_name: Model name (for logging)
+        """
+        transformer = model[0]
+        if not hasattr(transformer, "auto_model"):
+            return
+        
+        eager = transformer.auto_model
+        try:
+            # Batches are padded to their longest text, so sequence length
+            # varies per call; dynamic shapes avoid a recompile per shape
+            transformer.auto_model = torch.compile(
+                eager, mode="reduce-overhead", dynamic=True
+            )
+            # Trigger compilation now so the first real request isn't slow
+            model.encode(["warmup"] * self.WARMUP_BATCH_SIZE, show_progress_bar=False)
+            logger.info(f"Compiled model: {model_name}")
+        except Exception as e:
+            transformer.auto_model = eager
+            logger.warning(f"torch.compile failed for {model_name}, using eager mode: {e}")
+    
     def get_model(self, model_type: str) -> SentenceTransformer:
         """
         Get model by type (mvp, production_doc, production_code).
@@ -85,6 +369,14 @@ class ModelManager:
         """Get the current device being used."""
         return self._device
     
+    def get_engine(self) -> str:
+        """Get the inference engine models are run with."""
+        return self._engine
+    
+    def get_dtype(self) -> torch.dtype:
+        """Get the dtype model weights are loaded in."""
+        return self._dtype
+    
     def clear_cache(self) -> None:
         """Clear all cached models and free GPU memory."""
         logger.info("Clearing model cache")
@@ -0,0 +1,192 @@
+"""
+ONNX Runtime backend for DevMind Embedding Service.
+Runs sentence-transformer models through ONNX Runtime or TensorRT.
+"""
+
+from typing import List, Union
+import json
+import numpy as np
+from tqdm import tqdm
+import logging
+
+try:
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+    from huggingface_hub import hf_hub_download
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Execution provider per engine and device
+PROVIDERS = {
+    ("onnx", "cpu"): "CPUExecutionProvider",
+    ("onnx", "cuda"): "CUDAExecutionProvider",
+    ("tensorrt", "cuda"): "TensorrtExecutionProvider",
+}
+
+
+class OnnxSBERTWrapper:
+    """
+    Drop-in stand-in for SentenceTransformer backed by ONNX Runtime.
+    
+    Implements the parts of the SentenceTransformer interface the Encoder
+    uses: encode(), get_sentence_embedding_dimension(), max_seq_length
+    and tokenizer. Token embeddings are pooled the same way as the
+    source sentence-transformer model ('mean' or 'cls').
+    """
+    
+    def __init__(
+        self, 
+        model, 
+        tokenizer, 
+        max_seq_length: int = 512,
+        pooling: str = "mean"
+    ):
+        """
+        Initialize wrapper.
+        
+        Args:
+            model: ORTModelForFeatureExtraction instance
+            tokenizer: Matching HuggingFace tokenizer
+            max_seq_length: Maximum number of tokens per text
+            pooling: Pooling mode ('mean' or 'cls')
+        """
+        self.model = model
+        self.tokenizer = tokenizer
+        self.max_seq_length = max_seq_length
+        self.pooling = pooling
+        self._dimension = model.config.hidden_size
+    
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False
+    ) -> np.ndarray:
+        """
+        Encode texts to embeddings.
+        
+        Args:
+            sentences: Text or list of texts to encode
+            batch_size: Batch size for encoding
+            show_progress_bar: Whether to show progress bar
+            convert_to_numpy: Accepted for compatibility; always returns numpy
+            normalize_embeddings: Whether to L2-normalize embeddings
+        
+        Returns:
+            numpy array of shape (num_texts, embedding_dim), or
+            (embedding_dim,) for a single text
+        """
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        
+        # Sort by length so each batch pads to similar lengths
+        order = np.argsort([-len(s) for s in sentences], kind="stable")
+        result = np.empty((len(sentences), self._dimension), dtype=np.float32)
+        
+        starts = range(0, len(sentences), batch_size)
+        if show_progress_bar:
+            starts = tqdm(starts, desc="Batches", unit="batch")
+        
+        for start in starts:
+            batch_idx = order[start:start + batch_size]
+            features = self.tokenizer(
+                [sentences[i] for i in batch_idx],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+            token_embeddings = np.asarray(self.model(**features).last_hidden_state)
+            if self.pooling == "cls":
+                result[batch_idx] = token_embeddings[:, 0]
+            else:
+                result[batch_idx] = self._mean_pool(
+                    token_embeddings, features["attention_mask"]
+                )
+        
+        if normalize_embeddings:
+            norms = np.linalg.norm(result, axis=1, keepdims=True)
+            result /= np.maximum(norms, 1e-12)
+        
+        return result[0] if single else result
+    
+    @staticmethod
+    def _mean_pool(token_embeddings: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        """Average token embeddings over non-padding positions."""
+        mask = attention_mask[..., None].astype(np.float32)
+        summed = (token_embeddings.astype(np.float32) * mask).sum(axis=1)
+        return summed / np.maximum(mask.sum(axis=1), 1e-9)
+    
+    def get_sentence_embedding_dimension(self) -> int:
+        """Get dimensionality of embeddings."""
+        return self._dimension
+
+
+def _pooling_mode(model_name: str) -> str:
+    """
+    Read the pooling mode from a sentence-transformer model's config.
+    
+    Falls back to 'mean' if the model has no pooling config.
+    """
+    try:
+        with open(hf_hub_download(model_name, "1_Pooling/config.json")) as f:
+            config = json.load(f)
+    except Exception:
+        return "mean"
+    return "cls" if config.get("pooling_mode_cls_token") else "mean"
+
+
+def load_onnx_model(model_name: str, engine: str, device: str) -> OnnxSBERTWrapper:
+    """
+    Export (or load) a model to ONNX and wrap it for sentence encoding.
+    
+    Args:
+        model_name: HuggingFace model name or path
+        engine: 'onnx' or 'tensorrt'
+        device: 'cpu' or 'cuda'
+    
+    Returns:
+        OnnxSBERTWrapper around the ONNX Runtime session
+    
+    Raises:
+        ImportError: If optimum[onnxruntime] is not installed
+        ValueError: If the engine is not supported on the device
+    """
+    if not ONNX_AVAILABLE:
+        raise ImportError(
+            "ONNX engine requires optimum. "
+            "Install with: pip install optimum[onnxruntime]"
+        )
+    
+    device_type = "cuda" if device.startswith("cuda") else "cpu"
+    provider = PROVIDERS.get((engine, device_type))
+    if provider is None:
+        raise ValueError(f"Engine {engine} is not supported on device {device}")
+    
+    provider_options = None
+    if engine == "tensorrt":
+        # FP16 lets TensorRT pick tensor-core kernels
+        provider_options = {"trt_fp16_enable": True, "trt_engine_cache_enable": True}
+    
+    logger.info(f"Loading ONNX model: {model_name} with {provider}")
+    model = ORTModelForFeatureExtraction.from_pretrained(
+        model_name,
+        export=True,
+        provider=provider,
+        provider_options=provider_options
+    )
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    max_seq_length = min(tokenizer.model_max_length, 512)
+    
+    return OnnxSBERTWrapper(
+        model, 
+        tokenizer, 
+        max_seq_length=max_seq_length,
+        pooling=_pooling_mode(model_name)
+    )
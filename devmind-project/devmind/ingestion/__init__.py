@@ -15,7 +15,8 @@ from .job_manager import (
     JobManager,
     IngestJob,
     JobStatus,
-    JobProgress
+    JobProgress,
+    PipelineResultSummary
 )
 
 __all__ = [
@@ -34,5 +35,6 @@ __all__ = [
     "IngestJob",
     "JobStatus",
     "JobProgress",
+    "PipelineResultSummary",
 ]
 
@@ -4,21 +4,49 @@ Manages ingestion jobs, progress tracking, and state persistence.
 """
 
 from pathlib import Path
-from typing import List, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
+import asyncio
 import json
+import operator
+import os
+import queue
+import threading
 import uuid
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from devmind.ingestion.file_scanner import FileType
 from devmind.ingestion.pipeline import PipelineConfig, PipelineResult
 
 logger = logging.getLogger(__name__)
 
 
-class JobStatus(Enum):
-    """Status of an ingestion job."""
+def _dumps(data: dict) -> bytes:
+    """Serialize to indented JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class JobStatus(str, Enum):
+    """Status of an ingestion job (members compare and serialize as their value)."""
     PENDING = "pending"
     RUNNING = "running"
     PAUSED = "paused"
@@ -27,7 +55,15 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Statuses a job never leaves on its own; only these jobs are evicted from memory
+_FINISHED_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+# Plain dict lookups instead of Enum.__call__ when loading saved jobs
+_FILETYPE_BY_VALUE = {member.value: member for member in FileType}
+_JOBSTATUS_BY_VALUE = {member.value: member for member in JobStatus}
+
+
+@dataclass(slots=True)
 class JobProgress:
     """Progress information for a job."""
     files_scanned: int = 0
@@ -37,9 +73,62 @@ class JobProgress:
     current_file: str = ""
     errors_count: int = 0
     progress_percentage: float = 0.0
+    
+    def to_dict(self) -> dict:
+        """Convert progress to dictionary."""
+        return dict(zip(_PROGRESS_FIELDS, _progress_values(self)))
+
+
+# Field names resolved once at import; attrgetter reads them all in one C call
+_PROGRESS_FIELDS = tuple(f.name for f in fields(JobProgress))
+_progress_values = operator.attrgetter(*_PROGRESS_FIELDS)
+
+
+def _config_to_dict(config: PipelineConfig) -> dict:
+    """Convert a pipeline config to a JSON-serializable dictionary."""
+    return {
+        "source_path": str(config.source_path),
+        "file_types": [ft.value for ft in config.file_types],
+        "languages": config.languages,
+        "chunking_strategy": config.chunking_strategy,
+        "chunk_size": config.chunk_size,
+        "chunk_overlap": config.chunk_overlap,
+    }
+
+
+@dataclass(slots=True)
+class PipelineResultSummary:
+    """
+    Aggregate counters of a pipeline run, kept on a job instead of the
+    full PipelineResult so finished jobs don't pin their chunks in memory.
+    """
+    total_files_scanned: int
+    total_files_processed: int
+    total_sections_extracted: int
+    total_chunks_generated: int
+    errors: List[dict]
+    
+    @classmethod
+    def from_result(cls, result: PipelineResult) -> "PipelineResultSummary":
+        """Summarize a pipeline result, dropping its chunks."""
+        return cls(
+            total_files_scanned=result.total_files_scanned,
+            total_files_processed=result.total_files_processed,
+            total_sections_extracted=result.total_sections_extracted,
+            total_chunks_generated=result.total_chunks_generated,
+            errors=result.errors
+        )
+    
+    def to_dict(self) -> dict:
+        """Convert summary to dictionary."""
+        return dict(zip(_SUMMARY_FIELDS, _summary_values(self)))
+
 
+_SUMMARY_FIELDS = tuple(f.name for f in fields(PipelineResultSummary))
+_summary_values = operator.attrgetter(*_SUMMARY_FIELDS)
 
-@dataclass
+
+@dataclass(slots=True)
 class IngestJob:
     """A complete ingestion job."""
     job_id: str
@@ -49,20 +138,26 @@ class IngestJob:
     created_at: datetime
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    result: Optional[PipelineResult] = None
+    result: Optional[PipelineResultSummary] = None
     errors: List[dict] = field(default_factory=list)
     
     def to_dict(self) -> dict:
-        """Convert job to dictionary."""
-        data = asdict(self)
-        # Convert enums and datetimes
-        data["status"] = self.status.value
-        data["created_at"] = self.created_at.isoformat()
-        if self.started_at:
-            data["started_at"] = self.started_at.isoformat()
-        if self.completed_at:
-            data["completed_at"] = self.completed_at.isoformat()
-        return data
+        """
+        Convert job to dictionary.
+        
+        Built from direct attribute reads rather than dataclasses.asdict().
+        """
+        return {
+            "job_id": self.job_id,
+            "config": _config_to_dict(self.config),
+            "status": self.status,
+            "progress": self.progress.to_dict(),
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "result": self.result.to_dict() if self.result else None,
+            "errors": self.errors,
+        }
     
     def duration_seconds(self) -> Optional[float]:
         """Get job duration in seconds."""
@@ -71,6 +166,29 @@ class IngestJob:
         return None
 
 
+def _construct(cls, values: dict):
+    """
+    Create a dataclass instance from complete field values without __init__.
+    
+    Args:
+        cls: Dataclass type
+        values: Value for every field
+        
+    Returns:
+        New instance of cls
+    """
+    obj = object.__new__(cls)
+    for name, value in values.items():
+        object.__setattr__(obj, name, value)
+    return obj
+
+
+# Defaults for fields that aren't persisted or may be missing in old files
+# (slotted dataclasses keep defaults on their fields, not as class attributes)
+_PROGRESS_DEFAULTS = JobProgress().to_dict()
+_DEFAULT_MAX_FILE_SIZE = PipelineConfig.__dataclass_fields__["max_file_size"].default
+
+
 class JobManager:
     """
     Manages ingestion jobs.
@@ -82,6 +200,13 @@ class JobManager:
     - Handle job lifecycle (start, pause, resume, cancel)
     """
     
+    # Threads used to read job state files at startup
+    LOAD_WORKERS = 8
+    
+    # Jobs kept in memory; least recently used finished jobs beyond this
+    # live only in their state files and are reloaded on demand
+    MAX_HOT_JOBS = 256
+    
     def __init__(self, state_dir: Path):
         """
         Initialize Job Manager.
@@ -92,10 +217,35 @@ class JobManager:
         self.state_dir = Path(state_dir)
         self.state_dir.mkdir(parents=True, exist_ok=True)
         
-        self.jobs: dict[str, IngestJob] = {}
+        # In-memory (hot) jobs in LRU order, bounded by MAX_HOT_JOBS
+        self.jobs: "OrderedDict[str, IngestJob]" = OrderedDict()
+        
+        # (status, created_at) of every known job, hot or on disk only
+        self._index: Dict[str, Tuple[JobStatus, datetime]] = {}
+        
+        # Serialized PipelineConfig per hot job; configs don't change after creation
+        self._config_cache: dict[str, dict] = {}
+        
+        # Running aggregates for get_stats, updated on every state change
+        self._status_counts: dict[str, int] = {status.value: 0 for status in JobStatus}
+        self._total_chunks = 0
+        self._total_errors = 0
+        
         self._load_jobs()
         
-        logger.info(f"JobManager initialized with {len(self.jobs)} existing jobs")
+        # Background persistence: _save_job snapshots the job into _pending
+        # and a writer thread writes the latest snapshot per job, so bursts
+        # of progress updates coalesce into few disk writes. A snapshot
+        # stays in _pending until it is on disk
+        self._pending: dict[str, dict] = {}
+        self._pending_lock = threading.Lock()
+        self._write_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="job-state-writer", daemon=True
+        )
+        self._writer.start()
+        
+        logger.info(f"JobManager initialized with {len(self._index)} existing jobs")
     
     def create_job(
         self, 
@@ -123,8 +273,15 @@ class JobManager:
             created_at=datetime.now()
         )
         
+        previous = self.get_job(job_id)
+        if previous:
+            self._track(previous, -1)
         self.jobs[job_id] = job
+        self.jobs.move_to_end(job_id)
+        self._track(job, 1)
+        self._config_cache[job_id] = _config_to_dict(config)
         self._save_job(job)
+        self._evict()
         
         logger.info(f"Created job {job_id} for {config.source_path}")
         return job
@@ -133,13 +290,31 @@ class JobManager:
         """
         Get job by ID.
         
+        Jobs evicted from memory are reloaded from their state file and
+        become hot again.
+        
         Args:
             job_id: Job ID
             
         Returns:
             IngestJob or None
         """
-        return self.jobs.get(job_id)
+        job = self.jobs.get(job_id)
+        if job is not None:
+            self.jobs.move_to_end(job_id)
+            return job
+        
+        if job_id not in self._index:
+            return None
+        
+        entry = self._read_job(job_id)
+        if entry is None:
+            return None
+        job, config_data = entry
+        self.jobs[job_id] = job
+        self._config_cache[job_id] = config_data
+        self._evict()
+        return job
     
     def update_progress(
         self, 
@@ -153,7 +328,7 @@ class JobManager:
             job_id: Job ID
             progress: Updated progress information
         """
-        job = self.jobs.get(job_id)
+        job = self.get_job(job_id)
         if job:
             job.progress = progress
             self._save_job(job)
@@ -166,9 +341,9 @@ class JobManager:
         Args:
             job_id: Job ID
         """
-        job = self.jobs.get(job_id)
+        job = self.get_job(job_id)
         if job:
-            job.status = JobStatus.RUNNING
+            self._set_status(job, JobStatus.RUNNING)
             job.started_at = datetime.now()
             self._save_job(job)
             logger.info(f"Started job {job_id}")
@@ -181,15 +356,20 @@ class JobManager:
         """
         Mark job as completed.
         
+        Only a PipelineResultSummary is kept on the job; the caller is
+        responsible for passing result.chunks on to indexing.
+        
         Args:
             job_id: Job ID
             result: Pipeline result
         """
-        job = self.jobs.get(job_id)
+        job = self.get_job(job_id)
         if job:
-            job.status = JobStatus.COMPLETED
+            self._set_status(job, JobStatus.COMPLETED)
             job.completed_at = datetime.now()
-            job.result = result
+            self._track_result(job.result, -1)
+            job.result = PipelineResultSummary.from_result(result)
+            self._track_result(job.result, 1)
             self._save_job(job)
             
             duration = job.duration_seconds()
@@ -206,9 +386,9 @@ class JobManager:
             job_id: Job ID
             error: Error message
         """
-        job = self.jobs.get(job_id)
+        job = self.get_job(job_id)
         if job:
-            job.status = JobStatus.FAILED
+            self._set_status(job, JobStatus.FAILED)
             job.completed_at = datetime.now()
             job.errors.append({
                 "timestamp": datetime.now().isoformat(),
@@ -219,48 +399,64 @@ class JobManager:
     
     def pause_job(self, job_id: str) -> None:
         """Pause a running job."""
-        job = self.jobs.get(job_id)
+        job = self.get_job(job_id)
         if job and job.status == JobStatus.RUNNING:
-            job.status = JobStatus.PAUSED
+            self._set_status(job, JobStatus.PAUSED)
             self._save_job(job)
             logger.info(f"Paused job {job_id}")
     
     def resume_job(self, job_id: str) -> None:
         """Resume a paused job."""
-        job = self.jobs.get(job_id)
+        job = self.get_job(job_id)
         if job and job.status == JobStatus.PAUSED:
-            job.status = JobStatus.RUNNING
+            self._set_status(job, JobStatus.RUNNING)
             self._save_job(job)
             logger.info(f"Resumed job {job_id}")
     
     def cancel_job(self, job_id: str) -> None:
         """Cancel a job."""
-        job = self.jobs.get(job_id)
+        job = self.get_job(job_id)
         if job:
-            job.status = JobStatus.CANCELLED
+            self._set_status(job, JobStatus.CANCELLED)
             job.completed_at = datetime.now()
             self._save_job(job)
             logger.info(f"Cancelled job {job_id}")
     
     def list_jobs(
         self, 
-        status: Optional[JobStatus] = None
+        status: Optional[JobStatus] = None,
+        limit: Optional[int] = None
     ) -> List[IngestJob]:
         """
-        List all jobs, optionally filtered by status.
+        List all jobs, newest first, optionally filtered by status.
+        
+        Filtering and sorting use the in-memory index; only the returned
+        jobs that aren't hot are read from disk (without caching them).
         
         Args:
             status: Optional status filter
+            limit: Optional maximum number of jobs to return
             
         Returns:
             List of jobs
         """
-        jobs = list(self.jobs.values())
+        job_ids = [
+            job_id for job_id, (job_status, _) in self._index.items()
+            if not status or job_status == status
+        ]
+        job_ids.sort(key=lambda job_id: self._index[job_id][1], reverse=True)
+        if limit is not None:
+            job_ids = job_ids[:limit]
         
-        if status:
-            jobs = [j for j in jobs if j.status == status]
-        
-        return sorted(jobs, key=lambda j: j.created_at, reverse=True)
+        jobs = []
+        for job_id in job_ids:
+            job = self.jobs.get(job_id)
+            if job is None:
+                entry = self._read_job(job_id)
+                job = entry[0] if entry else None
+            if job is not None:
+                jobs.append(job)
+        return jobs
     
     def get_stats(self) -> dict:
         """
@@ -269,105 +465,290 @@ class JobManager:
         Returns:
             Dictionary with stats
         """
-        stats = {
-            "total_jobs": len(self.jobs),
-            "by_status": {},
-            "total_chunks": 0,
-            "total_errors": 0
+        return {
+            "total_jobs": len(self._index),
+            "by_status": {
+                status: count for status, count in self._status_counts.items() if count
+            },
+            "total_chunks": self._total_chunks,
+            "total_errors": self._total_errors
         }
+    
+    def _set_status(self, job: IngestJob, status: JobStatus) -> None:
+        """
+        Change a job's status, keeping the status counts in sync.
         
-        for job in self.jobs.values():
-            status = job.status.value
-            stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-            
-            if job.result:
-                stats["total_chunks"] += job.result.total_chunks_generated
-                stats["total_errors"] += len(job.result.errors)
+        Args:
+            job: Job to update
+            status: New status
+        """
+        self._status_counts[job.status] -= 1
+        job.status = status
+        self._status_counts[status] += 1
+        self._index[job.job_id] = (status, job.created_at)
+    
+    def _track(self, job: IngestJob, sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) a job from the running aggregates.
+        
+        Args:
+            job: Job to count
+            sign: +1 to add, -1 to remove
+        """
+        self._status_counts[job.status] += sign
+        self._track_result(job.result, sign)
+        if sign > 0:
+            self._index[job.job_id] = (job.status, job.created_at)
+        else:
+            self._index.pop(job.job_id, None)
+    
+    def _track_result(self, result: Optional[PipelineResultSummary], sign: int) -> None:
+        """
+        Add or remove a result's chunk and error totals from the aggregates.
+        
+        Args:
+            result: Result summary (ignored if None)
+            sign: +1 to add, -1 to remove
+        """
+        if result:
+            self._total_chunks += sign * result.total_chunks_generated
+            self._total_errors += sign * len(result.errors)
+    
+    def _evict(self) -> None:
+        """
+        Drop least recently used finished jobs beyond MAX_HOT_JOBS.
+        
+        Evicted jobs stay in the index and are reloaded from disk on
+        demand; active jobs are never evicted.
+        """
+        excess = len(self.jobs) - self.MAX_HOT_JOBS
+        if excess <= 0:
+            return
         
-        return stats
+        victims = []
+        for job_id, job in self.jobs.items():
+            if job.status in _FINISHED_STATUSES:
+                victims.append(job_id)
+                if len(victims) == excess:
+                    break
+        
+        for job_id in victims:
+            del self.jobs[job_id]
+            self._config_cache.pop(job_id, None)
+    
+    def _read_job(self, job_id: str) -> Optional[Tuple[IngestJob, dict]]:
+        """
+        Read a job that isn't in memory from its state file.
+        
+        Args:
+            job_id: Job ID
+            
+        Returns:
+            Tuple of (job, serialized_config), or None if loading failed
+        """
+        # A snapshot still pending (or mid-write) is newer than the file
+        if job_id in self._pending:
+            self.flush()
+        return self._load_one_job(str(self.state_dir / f"{job_id}.json"))
     
     def _save_job(self, job: IngestJob) -> None:
         """
-        Save job state to disk.
+        Queue job state to be saved to disk by the writer thread.
         
         Args:
             job: Job to save
         """
-        job_file = self.state_dir / f"{job.job_id}.json"
-        
         try:
-            # Create a serializable dict
+            # Create a serializable snapshot
             job_data = {
                 "job_id": job.job_id,
-                "status": job.status.value,
+                "status": job.status,
                 "created_at": job.created_at.isoformat(),
                 "started_at": job.started_at.isoformat() if job.started_at else None,
                 "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                "config": {
-                    "source_path": str(job.config.source_path),
-                    "file_types": [ft.value for ft in job.config.file_types],
-                    "languages": job.config.languages,
-                    "chunking_strategy": job.config.chunking_strategy,
-                    "chunk_size": job.config.chunk_size,
-                    "chunk_overlap": job.config.chunk_overlap,
-                },
-                "progress": asdict(job.progress),
-                "errors": job.errors
+                "config": self._serialized_config(job),
+                "progress": job.progress.to_dict(),
+                "result": job.result.to_dict() if job.result else None,
+                "errors": list(job.errors)
             }
-            
-            with open(job_file, "w") as f:
-                json.dump(job_data, f, indent=2)
-            logger.debug(f"Saved job {job.job_id} to {job_file}")
         except Exception as e:
             logger.error(f"Failed to save job {job.job_id}: {e}")
+            return
+        
+        with self._pending_lock:
+            queued = job.job_id in self._pending
+            self._pending[job.job_id] = job_data
+        
+        # Already queued: the writer will pick up this newer snapshot
+        if not queued:
+            self._write_queue.put(job.job_id)
+    
+    def _serialized_config(self, job: IngestJob) -> dict:
+        """
+        Get the job's serialized config, computing it once per job.
+        
+        Args:
+            job: Job whose config to serialize
+            
+        Returns:
+            Shared config dictionary (must not be mutated)
+        """
+        config_data = self._config_cache.get(job.job_id)
+        if config_data is None:
+            config_data = self._config_cache[job.job_id] = _config_to_dict(job.config)
+        return config_data
+    
+    def _writer_loop(self) -> None:
+        """Write queued job snapshots until a None sentinel is received."""
+        while True:
+            job_id = self._write_queue.get()
+            try:
+                if job_id is None:
+                    return
+                with self._pending_lock:
+                    job_data = self._pending.get(job_id)
+                if job_data is None:
+                    continue
+                self._write_job_file(job_id, job_data)
+                
+                # Drop the snapshot only once written; a newer one saved
+                # during the write wasn't queued, so queue it now
+                with self._pending_lock:
+                    written = self._pending.get(job_id) is job_data
+                    if written:
+                        del self._pending[job_id]
+                if not written:
+                    self._write_queue.put(job_id)
+            finally:
+                self._write_queue.task_done()
+    
+    def _write_job_file(self, job_id: str, job_data: dict) -> None:
+        """
+        Atomically write a job snapshot to its state file.
+        
+        Args:
+            job_id: Job ID
+            job_data: Serializable job snapshot
+        """
+        job_file = self.state_dir / f"{job_id}.json"
+        tmp_file = job_file.with_suffix(".json.tmp")
+        
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(_dumps(job_data))
+            # Atomic on POSIX: readers see the old or the new file, never a torn one
+            os.replace(tmp_file, job_file)
+            logger.debug(f"Saved job {job_id} to {job_file}")
+        except Exception as e:
+            logger.error(f"Failed to save job {job_id}: {e}")
+            tmp_file.unlink(missing_ok=True)
+    
+    def flush(self) -> None:
+        """Block until all queued job states have been written."""
+        self._write_queue.join()
+    
+    def close(self) -> None:
+        """Flush pending job states and stop the writer thread."""
+        if self._writer.is_alive():
+            self.flush()
+            self._write_queue.put(None)
+            self._writer.join()
     
     def _load_jobs(self) -> None:
         """
         Load all jobs from state directory.
+        
+        Files are read and parsed on a thread pool so their I/O overlaps.
         """
         if not self.state_dir.exists():
             return
         
-        for job_file in self.state_dir.glob("*.json"):
-            try:
-                with open(job_file, "r") as f:
-                    data = json.load(f)
-                
-                # Reconstruct job from saved data
-                from devmind.ingestion.file_scanner import FileType
-                
-                config = PipelineConfig(
-                    source_path=Path(data["config"]["source_path"]),
-                    file_types=[FileType(ft) for ft in data["config"]["file_types"]],
-                    languages=data["config"]["languages"],
-                    chunking_strategy=data["config"]["chunking_strategy"],
-                    chunk_size=data["config"]["chunk_size"],
-                    chunk_overlap=data["config"]["chunk_overlap"],
-                )
-                
-                job = IngestJob(
-                    job_id=data["job_id"],
-                    config=config,
-                    status=JobStatus(data["status"]),
-                    progress=JobProgress(**data["progress"]),
-                    created_at=datetime.fromisoformat(data["created_at"]),
-                    started_at=datetime.fromisoformat(data["started_at"]) if data.get("started_at") else None,
-                    completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
-                    errors=data.get("errors", [])
-                )
-                
-                self.jobs[job.job_id] = job
-                logger.debug(f"Loaded job {job.job_id} from {job_file}")
-                
-            except Exception as e:
-                logger.error(f"Failed to load job from {job_file}: {e}")
+        # One directory pass; DirEntry names need no Path objects or pattern matching
+        job_files = []
+        with os.scandir(self.state_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".json"):
+                    if entry.is_file():
+                        job_files.append(entry.path)
+                elif name.endswith(".json.tmp"):
+                    # Left by a crash mid-write; the previous state file is intact
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
+        
+        if not job_files:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(self.LOAD_WORKERS, len(job_files))) as executor:
+            loaded = list(executor.map(self._load_one_job, job_files))
+        
+        # Insert oldest first so the newest jobs are the last to be evicted
+        loaded = sorted(filter(None, loaded), key=lambda entry: entry[0].created_at)
+        for job, config_data in loaded:
+            self.jobs[job.job_id] = job
+            self._track(job, 1)
+            self._config_cache[job.job_id] = config_data
+        self._evict()
+    
+    def _load_one_job(self, job_file: str) -> Optional[Tuple[IngestJob, dict]]:
+        """
+        Load a single job from its state file.
+        
+        Args:
+            job_file: Path to the job's JSON file
+            
+        Returns:
+            Tuple of (job, serialized_config), or None if loading failed
+        """
+        try:
+            with open(job_file, "rb") as f:
+                data = _loads(f.read())
+            
+            # Reconstruct job from saved data, skipping dataclass __init__
+            # and PipelineConfig.__post_init__ (saved values are complete)
+            config_data = data["config"]
+            config = _construct(PipelineConfig, {
+                "source_path": Path(config_data["source_path"]),
+                "file_types": [_FILETYPE_BY_VALUE[ft] for ft in config_data["file_types"]],
+                "languages": config_data["languages"],
+                "chunking_strategy": config_data["chunking_strategy"],
+                "chunk_size": config_data["chunk_size"],
+                "chunk_overlap": config_data["chunk_overlap"],
+                "ignored_patterns": [],
+                "max_file_size": _DEFAULT_MAX_FILE_SIZE,
+            })
+            
+            started_at = data.get("started_at")
+            completed_at = data.get("completed_at")
+            result = data.get("result")
+            job = _construct(IngestJob, {
+                "job_id": data["job_id"],
+                "config": config,
+                "status": _JOBSTATUS_BY_VALUE[data["status"]],
+                "progress": _construct(JobProgress, {**_PROGRESS_DEFAULTS, **data["progress"]}),
+                "created_at": datetime.fromisoformat(data["created_at"]),
+                "started_at": datetime.fromisoformat(started_at) if started_at else None,
+                "completed_at": datetime.fromisoformat(completed_at) if completed_at else None,
+                "result": _construct(PipelineResultSummary, result) if result else None,
+                "errors": data.get("errors", []),
+            })
+            
+            logger.debug(f"Loaded job {job.job_id} from {job_file}")
+            return job, config_data
+            
+        except Exception as e:
+            logger.error(f"Failed to load job from {job_file}: {e}")
+            return None
     
     async def save_all_states(self) -> None:
         """
         Explicitly save all job states to disk.
         
         This ensures all pending job states are persisted,
-        particularly useful during graceful shutdown.
+        particularly useful during graceful shutdown. Jobs evicted from
+        memory were saved before eviction and are skipped.
         """
         logger.info(f"Saving states for {len(self.jobs)} jobs...")
         
@@ -382,6 +763,9 @@ class JobManager:
                 error_count += 1
                 logger.error(f"Failed to save job {job.job_id}: {e}")
         
+        # Wait for the writer thread without blocking the event loop
+        await asyncio.to_thread(self.flush)
+        
         logger.info(f"Saved {saved_count} job states ({error_count} errors)")
     
     def cleanup_old_jobs(self, days: int = 30) -> int:
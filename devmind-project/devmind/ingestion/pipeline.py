@@ -4,25 +4,52 @@ Orchestrates the flow from files to chunks.
 """
 
 from pathlib import Path
-from typing import List, Optional, Union, Callable
-from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import deque
+from itertools import chain
+from dataclasses import dataclass, field
+from datetime import datetime
 import logging
 import asyncio
+import mmap
+import os
+import random
 import time
 import hashlib
 import json
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from devmind.ingestion.file_scanner import FileScanner, FileInfo, FileType
 from devmind.processing.code_processor import ProcessorFactory, CodeSection
 from devmind.processing.doc_processor import DocumentProcessorFactory, DocSection
-from devmind.chunking.chunker import ChunkerFactory, Chunk, BaseChunker
+from devmind.chunking.chunker import ChunkerFactory, Chunk, BaseChunker, process_pool_context
 
 logger = logging.getLogger(__name__)
 
 
-class PipelineStage(Enum):
-    """Stages of the ingestion pipeline."""
+class _SectionSourceError(Exception):
+    """Wraps an error raised while producing sections for the chunker."""
+
+
+def _guard_source(
+    sections: Iterable[Union[CodeSection, DocSection]]
+) -> Iterator[Union[CodeSection, DocSection]]:
+    """Re-raise errors from a lazy section source as _SectionSourceError."""
+    try:
+        yield from sections
+    except Exception as e:
+        raise _SectionSourceError() from e
+
+
+class PipelineStage(str, Enum):
+    """Stages of the ingestion pipeline (members compare and serialize as their value)."""
     SCANNING = "scanning"
     PROCESSING = "processing"
     CHUNKING = "chunking"
@@ -30,7 +57,7 @@ class PipelineStage(Enum):
     INDEXING = "indexing"    # Future: not implemented yet
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     """Configuration for ingestion pipeline."""
     source_path: Path
@@ -41,6 +68,7 @@ class PipelineConfig:
     chunk_overlap: int = 50
     ignored_patterns: List[str] = None
     max_file_size: int = 10 * 1024 * 1024  # 10 MB
+    max_workers: Optional[int] = None  # None = INGEST_MAX_WORKERS env or CPU count, 1 = serial
     
     def __post_init__(self):
         if self.file_types is None:
@@ -51,7 +79,43 @@ class PipelineConfig:
             self.ignored_patterns = []
 
 
-@dataclass
+# Cap on error / DLQ entries kept in memory so long runs with many
+# failures don't grow without bound (oldest entries are dropped first)
+MAX_RECORDED_ERRORS = 10_000
+
+
+def _bounded_log() -> Deque[dict]:
+    """Create a bounded log for error and DLQ entries."""
+    return deque(maxlen=MAX_RECORDED_ERRORS)
+
+
+@dataclass(slots=True)
+class PipelineStats:
+    """Running counters for a pipeline run (slotted for cheap updates)."""
+    files_scanned: int = 0
+    files_processed: int = 0
+    sections_extracted: int = 0
+    chunks_generated: int = 0
+    errors: Deque[dict] = field(default_factory=_bounded_log)
+    retries: int = 0
+    dlq_files: Deque[dict] = field(default_factory=_bounded_log)  # Dead-letter queue for persistently failing files
+    duplicates_skipped: int = 0  # Files dropped because their content matched an earlier file
+    
+    def to_dict(self) -> dict:
+        """Convert stats to dictionary."""
+        return {
+            "files_scanned": self.files_scanned,
+            "files_processed": self.files_processed,
+            "sections_extracted": self.sections_extracted,
+            "chunks_generated": self.chunks_generated,
+            "errors": list(self.errors),
+            "retries": self.retries,
+            "dlq_files": list(self.dlq_files),
+            "duplicates_skipped": self.duplicates_skipped,
+        }
+
+
+@dataclass(slots=True)
 class PipelineResult:
     """Result of pipeline execution."""
     total_files_scanned: int
@@ -76,6 +140,17 @@ class IngestionPipeline:
     - Collect statistics
     """
     
+    # Below this many files, processing stays in-process
+    PARALLEL_MIN_FILES = 32
+    
+    # Files smaller than this (bytes) are sent to worker processes in
+    # batches of SMALL_FILE_BATCH to amortize per-task overhead
+    SMALL_FILE_SIZE = 4096
+    SMALL_FILE_BATCH = 64
+    
+    # Minimum time between progress callbacks within a stage
+    PROGRESS_INTERVAL_NS = 50_000_000
+    
     def __init__(
         self, 
         config: PipelineConfig,
@@ -90,6 +165,8 @@ class IngestionPipeline:
         """
         self.config = config
         self.progress_callback = progress_callback
+        self._last_emit_ns = 0
+        self._last_emit_stage: Optional[PipelineStage] = None
         
         # Initialize components
         self.scanner = FileScanner(ignored_patterns=config.ignored_patterns)
@@ -99,21 +176,26 @@ class IngestionPipeline:
             chunk_overlap=config.chunk_overlap
         )
         
+        # Scan filters as frozensets, built once (None = no filter)
+        self._file_type_filter = frozenset(config.file_types) if config.file_types else None
+        self._language_filter = frozenset(config.languages) if config.languages else None
+        
         # Statistics
-        self.stats = {
-            "files_scanned": 0,
-            "files_processed": 0,
-            "sections_extracted": 0,
-            "chunks_generated": 0,
-            "errors": [],
-            "retries": 0,
-            "dlq_files": []  # Dead-letter queue for persistently failing files
-        }
+        self.stats = PipelineStats()
         
         # Retry configuration
         self.max_retries = 3
         self.retry_delay_base = 1.0  # seconds
         
+        # Worker processes for file processing (1 = serial); capped by the
+        # config or INGEST_MAX_WORKERS so concurrent jobs don't oversubscribe
+        self.max_workers = (
+            config.max_workers
+            or int(os.getenv("INGEST_MAX_WORKERS", "0"))
+            or os.cpu_count()
+            or 1
+        )
+        
         logger.info(f"Initialized IngestionPipeline for {config.source_path}")
     
     def run(self) -> PipelineResult:
@@ -129,58 +211,92 @@ class IngestionPipeline:
             # Step 1: Scan files
             self.emit_progress(PipelineStage.SCANNING, 0, 1, "Scanning directory...")
             file_infos = self.scan_files()
-            self.stats["files_scanned"] = len(file_infos)
+            self.stats.files_scanned = len(file_infos)
             
-            # Step 2: Process files
+            # Steps 2-3: Process files and chunk their sections as they stream in
             self.emit_progress(PipelineStage.PROCESSING, 0, len(file_infos), "Processing files...")
-            all_sections = []
+            chunks = self.chunk_sections(self.iter_sections(file_infos))
+            return self._finish(chunks)
             
-            for i, file_info in enumerate(file_infos):
-                sections = self.process_file(file_info)
-                all_sections.extend(sections)
-                self.stats["files_processed"] += 1
-                self.stats["sections_extracted"] += len(sections)
-                
-                self.emit_progress(
-                    PipelineStage.PROCESSING, 
-                    i + 1, 
-                    len(file_infos),
-                    f"Processed {file_info.path.name}"
-                )
-            
-            # Step 3: Chunk sections
-            self.emit_progress(
-                PipelineStage.CHUNKING, 
-                0, 
-                len(all_sections),
-                "Chunking sections..."
-            )
-            chunks = self.chunk_sections(all_sections)
-            self.stats["chunks_generated"] = len(chunks)
+        except Exception as e:
+            logger.error(f"Pipeline failed: {e}")
+            self.stats.errors.append({
+                "error": str(e),
+                "stage": "pipeline"
+            })
+            raise
+    
+    async def run_async(self) -> PipelineResult:
+        """
+        Run the complete ingestion pipeline without blocking the event loop.
+        
+        Scanning and chunking run in a worker thread, and files are
+        processed concurrently by process_files_async. Prefer run() for
+        large, parse-bound batches outside an event loop: it spreads
+        parsing over processes rather than GIL-bound threads.
+        
+        Returns:
+            PipelineResult with chunks and statistics
+        """
+        logger.info("Starting ingestion pipeline (async)")
+        
+        try:
+            # Step 1: Scan files
+            self.emit_progress(PipelineStage.SCANNING, 0, 1, "Scanning directory...")
+            file_infos = await asyncio.to_thread(self.scan_files)
+            self.stats.files_scanned = len(file_infos)
             
-            logger.info(
-                f"Pipeline complete: {self.stats['files_processed']} files, "
-                f"{self.stats['sections_extracted']} sections, "
-                f"{self.stats['chunks_generated']} chunks"
-            )
+            # Step 2: Process files concurrently
+            self.emit_progress(PipelineStage.PROCESSING, 0, len(file_infos), "Processing files...")
+            per_file_sections = await self.process_files_async(file_infos)
             
-            return PipelineResult(
-                total_files_scanned=self.stats["files_scanned"],
-                total_files_processed=self.stats["files_processed"],
-                total_sections_extracted=self.stats["sections_extracted"],
-                total_chunks_generated=self.stats["chunks_generated"],
-                chunks=chunks,
-                errors=self.stats["errors"]
+            # Step 3: Chunk sections
+            chunks = await asyncio.to_thread(
+                self.chunk_sections, chain.from_iterable(per_file_sections)
             )
-            
+            return self._finish(chunks)
+        
         except Exception as e:
             logger.error(f"Pipeline failed: {e}")
-            self.stats["errors"].append({
+            self.stats.errors.append({
                 "error": str(e),
                 "stage": "pipeline"
             })
             raise
     
+    def _finish(self, chunks: List[Chunk]) -> PipelineResult:
+        """
+        Record the chunk count, report completion and build the result.
+        
+        Args:
+            chunks: Chunks generated by the run
+            
+        Returns:
+            PipelineResult with chunks and statistics
+        """
+        self.stats.chunks_generated = len(chunks)
+        self.emit_progress(
+            PipelineStage.CHUNKING, 
+            self.stats.sections_extracted, 
+            self.stats.sections_extracted,
+            "Chunked sections"
+        )
+        
+        logger.info(
+            f"Pipeline complete: {self.stats.files_processed} files, "
+            f"{self.stats.sections_extracted} sections, "
+            f"{self.stats.chunks_generated} chunks"
+        )
+        
+        return PipelineResult(
+            total_files_scanned=self.stats.files_scanned,
+            total_files_processed=self.stats.files_processed,
+            total_sections_extracted=self.stats.sections_extracted,
+            total_chunks_generated=self.stats.chunks_generated,
+            chunks=chunks,
+            errors=list(self.stats.errors)
+        )
+    
     def scan_files(self) -> List[FileInfo]:
         """
         Scan for files to process.
@@ -193,29 +309,207 @@ class IngestionPipeline:
         # Scan directory
         file_infos = self.scanner.scan(self.config.source_path)
         
-        # Filter by file types
-        if self.config.file_types:
-            file_infos = [
-                f for f in file_infos 
-                if f.file_type in self.config.file_types
-            ]
-        
-        # Filter by languages
-        if self.config.languages:
-            file_infos = [
-                f for f in file_infos
-                if f.language in self.config.languages or f.file_type == FileType.DOCUMENT
-            ]
-        
-        # Filter by file size
+        # Filter by file type, language and size in a single pass
+        file_types = self._file_type_filter
+        languages = self._language_filter
+        max_size = self.config.max_file_size
+        document = FileType.DOCUMENT
+        
         file_infos = [
             f for f in file_infos
-            if f.size <= self.config.max_file_size
+            if (file_types is None or f.file_type in file_types)
+            and (languages is None or f.language in languages or f.file_type == document)
+            and f.size <= max_size
         ]
+        file_infos = self._dedup_by_content(file_infos)
         
         logger.info(f"Found {len(file_infos)} files to process")
         return file_infos
     
+    def _dedup_by_content(self, file_infos: List[FileInfo]) -> List[FileInfo]:
+        """
+        Drop files whose content duplicates an earlier file.
+        
+        Uses the content hash the scanner already computed, so no file is
+        read again; vendored copies and forks are processed only once.
+        Files that couldn't be hashed are always kept.
+        
+        Args:
+            file_infos: Scanned files
+            
+        Returns:
+            Files with the first occurrence of each content kept
+        """
+        seen = set()
+        unique = []
+        for file_info in file_infos:
+            if file_info.hash:
+                key = (file_info.size, file_info.hash)
+                if key in seen:
+                    logger.debug(f"Skipping duplicate file: {file_info.path}")
+                    continue
+                seen.add(key)
+            unique.append(file_info)
+        
+        duplicates = len(file_infos) - len(unique)
+        if duplicates:
+            self.stats.duplicates_skipped += duplicates
+            logger.info(f"Skipped {duplicates} files with duplicate content")
+        return unique
+    
+    def iter_processed_files(
+        self, 
+        file_infos: List[FileInfo]
+    ) -> Iterator[Tuple[FileInfo, List[Union[CodeSection, DocSection]]]]:
+        """
+        Process files, yielding each file with its sections in input order.
+        
+        Parsing is CPU-bound, so large batches are spread over a process
+        pool; retry counts and dead-letter entries from the workers are
+        merged into self.stats.
+        
+        Args:
+            file_infos: Files to process
+            
+        Yields:
+            Tuple of (file_info, sections)
+        """
+        if self.max_workers <= 1 or len(file_infos) < self.PARALLEL_MIN_FILES:
+            for file_info in file_infos:
+                yield file_info, self.process_file(file_info)
+            return
+        
+        tasks = [(file_info, self.max_retries, self.retry_delay_base) for file_info in file_infos]
+        chunksize = max(1, len(tasks) // (self.max_workers * 4))
+        
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=process_pool_context()
+        ) as executor:
+            results = executor.map(_process_file_worker, tasks, chunksize=chunksize)
+            for file_info, (sections, worker_stats) in zip(file_infos, results):
+                self._merge_worker_stats(worker_stats)
+                yield file_info, sections
+    
+    def iter_sections(
+        self, 
+        file_infos: List[FileInfo],
+        on_file: Optional[Callable[[FileInfo], None]] = None
+    ) -> Iterator[Union[CodeSection, DocSection]]:
+        """
+        Lazily process files and yield their sections.
+        
+        Only one file's sections are held at a time, so chunking can
+        consume them without the whole corpus being kept in memory.
+        Updates stats and emits PROCESSING progress per file.
+        
+        Args:
+            file_infos: Files to process
+            on_file: Optional callback run after each file is processed
+            
+        Yields:
+            Sections, file by file
+        """
+        for i, (file_info, sections) in enumerate(self.iter_processed_files(file_infos)):
+            self.stats.files_processed += 1
+            self.stats.sections_extracted += len(sections)
+            if on_file is not None:
+                on_file(file_info)
+            
+            self.emit_progress(
+                PipelineStage.PROCESSING, 
+                i + 1, 
+                len(file_infos),
+                f"Processed {file_info.path.name}"
+            )
+            yield from sections
+    
+    async def process_files_async(
+        self, 
+        file_infos: List[FileInfo]
+    ) -> List[List[Union[CodeSection, DocSection]]]:
+        """
+        Process files concurrently without blocking the event loop.
+        
+        Small batches run in worker threads, at most max_workers files at
+        a time, with retry backoff waiting on the event loop. Batches of
+        PARALLEL_MIN_FILES or more are parsed in a process pool instead,
+        since threads can't run parsing past one core. Updates stats and
+        emits PROCESSING progress as files finish.
+        
+        Args:
+            file_infos: Files to process
+            
+        Returns:
+            Sections of each file, in input order
+        """
+        done = 0
+        
+        def record(file_info: FileInfo, sections: List[Union[CodeSection, DocSection]]) -> None:
+            nonlocal done
+            done += 1
+            self.stats.files_processed += 1
+            self.stats.sections_extracted += len(sections)
+            self.emit_progress(
+                PipelineStage.PROCESSING, 
+                done, 
+                len(file_infos),
+                f"Processed {file_info.path.name}"
+            )
+        
+        if self.max_workers > 1 and len(file_infos) >= self.PARALLEL_MIN_FILES:
+            loop = asyncio.get_running_loop()
+            results: List[List[Union[CodeSection, DocSection]]] = [[] for _ in file_infos]
+            
+            # Large files go to the pool one by one; small files are sent in
+            # batches so submit/return overhead doesn't dominate their cost
+            small = [i for i, f in enumerate(file_infos) if f.size < self.SMALL_FILE_SIZE]
+            batches = [[i] for i, f in enumerate(file_infos) if f.size >= self.SMALL_FILE_SIZE]
+            batches.extend(
+                small[start:start + self.SMALL_FILE_BATCH]
+                for start in range(0, len(small), self.SMALL_FILE_BATCH)
+            )
+            
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=process_pool_context()
+            ) as executor:
+                async def process_in_pool(indices: List[int]) -> None:
+                    batch_sections, worker_stats = await loop.run_in_executor(
+                        executor,
+                        _process_file_batch_worker,
+                        ([file_infos[i] for i in indices], self.max_retries, self.retry_delay_base)
+                    )
+                    self._merge_worker_stats(worker_stats)
+                    for i, sections in zip(indices, batch_sections):
+                        results[i] = sections
+                        record(file_infos[i], sections)
+                
+                await asyncio.gather(*(process_in_pool(indices) for indices in batches))
+            
+            return results
+        
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def process_in_thread(file_info: FileInfo) -> List[Union[CodeSection, DocSection]]:
+            async with semaphore:
+                sections = await self._process_file_with_retry_async(file_info)
+            record(file_info, sections)
+            return sections
+        
+        return await asyncio.gather(*(process_in_thread(file_info) for file_info in file_infos))
+    
+    def _merge_worker_stats(self, worker_stats: PipelineStats) -> None:
+        """
+        Merge retry counts and failures recorded by a worker process.
+        
+        Args:
+            worker_stats: Stats returned by _process_file_worker
+        """
+        self.stats.retries += worker_stats.retries
+        self.stats.errors.extend(worker_stats.errors)
+        self.stats.dlq_files.extend(worker_stats.dlq_files)
+    
     def process_file(self, file_info: FileInfo) -> List[Union[CodeSection, DocSection]]:
         """
         Process a single file into sections with retry logic.
@@ -230,103 +524,179 @@ class IngestionPipeline:
     
     def _process_file_with_retry(
         self, 
-        file_info: FileInfo,
-        attempt: int = 0
+        file_info: FileInfo
     ) -> List[Union[CodeSection, DocSection]]:
         """
         Process file with exponential backoff retry.
         
+        Failed attempts are retried in a loop after a jittered backoff
+        delay; once retries are exhausted the file goes to the
+        dead-letter queue.
+        
         Args:
             file_info: File to process
-            attempt: Current retry attempt (0-indexed)
             
         Returns:
-            List of sections
+            List of sections (empty if every attempt failed)
         """
-        logger.debug(f"Processing file: {file_info.path} (attempt {attempt + 1}/{self.max_retries + 1})")
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._process_file_attempt(file_info, attempt)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self._dead_letter(file_info, e)
+                    return []
+                time.sleep(self._retry_delay(file_info, attempt, e))
+        return []
+    
+    async def _process_file_with_retry_async(
+        self, 
+        file_info: FileInfo
+    ) -> List[Union[CodeSection, DocSection]]:
+        """
+        Async variant of _process_file_with_retry.
         
-        try:
-            # Determine processor type
-            if file_info.file_type == FileType.CODE:
-                processor = ProcessorFactory.get_processor(file_info)
-            elif file_info.file_type == FileType.DOCUMENT:
-                processor = DocumentProcessorFactory.get_processor(file_info)
-            else:
-                logger.warning(f"No processor for {file_info.file_type}")
-                return []
-            
-            if processor is None:
-                logger.warning(f"No processor found for {file_info.path}")
-                return []
+        Each attempt runs in a worker thread and backoff uses
+        asyncio.sleep, so other files keep making progress on the event
+        loop while this one is parsed or waits to retry.
+        
+        Args:
+            file_info: File to process
             
-            # Process file
-            sections = processor.process(file_info)
+        Returns:
+            List of sections (empty if every attempt failed)
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await asyncio.to_thread(self._process_file_attempt, file_info, attempt)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self._dead_letter(file_info, e)
+                    return []
+                await asyncio.sleep(self._retry_delay(file_info, attempt, e))
+        return []
+    
+    def _process_file_attempt(
+        self, 
+        file_info: FileInfo,
+        attempt: int
+    ) -> List[Union[CodeSection, DocSection]]:
+        """
+        Make one attempt at processing a file.
+        
+        Args:
+            file_info: File to process
+            attempt: Current retry attempt (0-indexed)
             
-            # Log retry success if this was a retry
-            if attempt > 0:
-                logger.info(f"✓ Successfully processed {file_info.path} after {attempt} retries")
+        Returns:
+            List of sections
             
-            return sections
+        Raises:
+            Exception: Whatever the processor raised
+        """
+        logger.debug(f"Processing file: {file_info.path} (attempt {attempt + 1}/{self.max_retries + 1})")
+        
+        # Determine processor type
+        if file_info.file_type == FileType.CODE:
+            processor = ProcessorFactory.get_processor(file_info)
+        elif file_info.file_type == FileType.DOCUMENT:
+            processor = DocumentProcessorFactory.get_processor(file_info)
+        else:
+            logger.warning(f"No processor for {file_info.file_type}")
+            return []
+        
+        if processor is None:
+            logger.warning(f"No processor found for {file_info.path}")
+            return []
+        
+        # Process file
+        sections = processor.process(file_info)
+        
+        # Log retry success if this was a retry
+        if attempt > 0:
+            logger.info(f"✓ Successfully processed {file_info.path} after {attempt} retries")
+        
+        return sections
+    
+    def _retry_delay(self, file_info: FileInfo, attempt: int, error: Exception) -> float:
+        """
+        Count a retry and get its backoff delay.
+        
+        The exponential delay is jittered to 50-150% so files failing on
+        a shared resource don't all retry at the same moment.
+        
+        Args:
+            file_info: File being retried
+            attempt: Failed attempt (0-indexed)
+            error: Error from the failed attempt
             
-        except Exception as e:
-            # Check if we should retry
-            if attempt < self.max_retries:
-                # Calculate exponential backoff delay
-                delay = self.retry_delay_base * (2 ** attempt)
-                logger.warning(
-                    f"Error processing {file_info.path} (attempt {attempt + 1}/{self.max_retries + 1}): {e}. "
-                    f"Retrying in {delay}s..."
-                )
-                
-                # Sleep before retry
-                time.sleep(delay)
-                self.stats["retries"] += 1
-                
-                # Retry
-                return self._process_file_with_retry(file_info, attempt + 1)
-            else:
-                # All retries exhausted - add to dead-letter queue
-                logger.error(
-                    f"✗ Failed to process {file_info.path} after {self.max_retries + 1} attempts. "
-                    f"Adding to dead-letter queue."
-                )
-                
-                dlq_entry = {
-                    "file": str(file_info.path),
-                    "error": str(e),
-                    "attempts": self.max_retries + 1,
-                    "stage": "processing",
-                    "file_type": file_info.file_type.value,
-                    "language": file_info.language
-                }
-                
-                self.stats["errors"].append(dlq_entry)
-                self.stats["dlq_files"].append(dlq_entry)
-                
-                return []
+        Returns:
+            Delay in seconds
+        """
+        delay = self.retry_delay_base * (1 << attempt) * (0.5 + random.random())
+        logger.warning(
+            f"Error processing {file_info.path} (attempt {attempt + 1}/{self.max_retries + 1}): {error}. "
+            f"Retrying in {delay:.2f}s..."
+        )
+        self.stats.retries += 1
+        return delay
+    
+    def _dead_letter(self, file_info: FileInfo, error: Exception) -> None:
+        """
+        Record a file whose retries are exhausted in the dead-letter queue.
+        
+        Args:
+            file_info: File that failed
+            error: Error from the last attempt
+        """
+        logger.error(
+            f"✗ Failed to process {file_info.path} after {self.max_retries + 1} attempts. "
+            f"Adding to dead-letter queue."
+        )
+        
+        dlq_entry = {
+            "file": str(file_info.path),
+            "error": str(error),
+            "attempts": self.max_retries + 1,
+            "stage": "processing",
+            "file_type": file_info.file_type.value,
+            "language": file_info.language
+        }
+        
+        self.stats.errors.append(dlq_entry)
+        self.stats.dlq_files.append(dlq_entry)
     
     def chunk_sections(
         self, 
-        sections: List[Union[CodeSection, DocSection]]
+        sections: Iterable[Union[CodeSection, DocSection]]
     ) -> List[Chunk]:
         """
         Chunk sections into embeddings-ready pieces.
         
         Args:
-            sections: Sections to chunk
+            sections: Sections to chunk (a list, or a lazy iterable)
             
         Returns:
             List of chunks
+            
+        Raises:
+            Exception: Errors from a lazy section source (file processing)
+                propagate unchanged; only chunker errors are recorded here
         """
-        logger.info(f"Chunking {len(sections)} sections")
+        # Lists can't fail mid-iteration and keep parallel chunking
+        if not hasattr(sections, "__len__"):
+            sections = _guard_source(sections)
         
         try:
             chunks = self.chunker.chunk(sections)
             logger.info(f"Generated {len(chunks)} chunks")
             return chunks
+        except _SectionSourceError as e:
+            # Processing failures belong to the caller's pipeline handler
+            raise e.__cause__
         except Exception as e:
             logger.error(f"Error during chunking: {e}")
-            self.stats["errors"].append({
+            self.stats.errors.append({
                 "error": str(e),
                 "stage": "chunking"
             })
@@ -359,24 +729,40 @@ class IngestionPipeline:
         """
         Emit progress update.
         
+        Updates within a stage are throttled to one per PROGRESS_INTERVAL_NS;
+        the first update of each stage and the final one (current >= total)
+        are always emitted.
+        
         Args:
             stage: Current pipeline stage
             current: Current item number
             total: Total items
             message: Optional message
         """
-        if self.progress_callback:
-            self.progress_callback({
-                "stage": stage.value,
-                "current": current,
-                "total": total,
-                "message": message,
-                "stats": self.stats
-            })
+        if not self.progress_callback:
+            return
+        
+        now = time.monotonic_ns()
+        if (
+            stage is self._last_emit_stage
+            and current < total
+            and now - self._last_emit_ns < self.PROGRESS_INTERVAL_NS
+        ):
+            return
+        self._last_emit_ns = now
+        self._last_emit_stage = stage
+        
+        self.progress_callback({
+            "stage": stage,
+            "current": current,
+            "total": total,
+            "message": message,
+            "stats": self.stats.to_dict()
+        })
     
     def get_stats(self) -> dict:
         """Get pipeline statistics."""
-        return self.stats.copy()
+        return self.stats.to_dict()
     
     def get_dead_letter_queue(self) -> List[dict]:
         """
@@ -385,7 +771,7 @@ class IngestionPipeline:
         Returns:
             List of DLQ entries with file info and error details
         """
-        return self.stats["dlq_files"].copy()
+        return list(self.stats.dlq_files)
     
     def get_error_summary(self) -> dict:
         """
@@ -395,20 +781,71 @@ class IngestionPipeline:
             Dictionary with error statistics
         """
         return {
-            "total_errors": len(self.stats["errors"]),
-            "total_retries": self.stats["retries"],
-            "dlq_files_count": len(self.stats["dlq_files"]),
+            "total_errors": len(self.stats.errors),
+            "total_retries": self.stats.retries,
+            "dlq_files_count": len(self.stats.dlq_files),
             "dlq_files": self.get_dead_letter_queue()
         }
 
 
+def _new_worker(max_retries: int, retry_delay_base: float) -> IngestionPipeline:
+    """Create a bare pipeline that only carries retry settings and stats."""
+    worker = IngestionPipeline.__new__(IngestionPipeline)
+    worker.stats = PipelineStats()
+    worker.max_retries = max_retries
+    worker.retry_delay_base = retry_delay_base
+    return worker
+
+
+def _process_file_worker(
+    task: Tuple[FileInfo, int, float]
+) -> Tuple[List[Union[CodeSection, DocSection]], PipelineStats]:
+    """
+    Process one file in a worker process.
+    
+    Runs IngestionPipeline's retry logic on a bare instance that only
+    carries the retry settings, and returns the stats it recorded so the
+    parent can merge them.
+    
+    Args:
+        task: Tuple of (file_info, max_retries, retry_delay_base)
+        
+    Returns:
+        Tuple of (sections, stats)
+    """
+    file_info, max_retries, retry_delay_base = task
+    
+    worker = _new_worker(max_retries, retry_delay_base)
+    sections = worker._process_file_with_retry(file_info)
+    return sections, worker.stats
+
+
+def _process_file_batch_worker(
+    task: Tuple[List[FileInfo], int, float]
+) -> Tuple[List[List[Union[CodeSection, DocSection]]], PipelineStats]:
+    """
+    Process several files in one worker process call.
+    
+    Args:
+        task: Tuple of (file_infos, max_retries, retry_delay_base)
+        
+    Returns:
+        Tuple of (sections per file in input order, combined stats)
+    """
+    file_infos, max_retries, retry_delay_base = task
+    
+    worker = _new_worker(max_retries, retry_delay_base)
+    sections = [worker._process_file_with_retry(file_info) for file_info in file_infos]
+    return sections, worker.stats
+
+
 class IncrementalPipeline(IngestionPipeline):
     """
     Incremental ingestion pipeline.
     
     Only processes changed files based on:
-    - File modification time
-    - File hash (SHA-256)
+    - File size and modification time
+    - File hash (BLAKE3 when installed, else SHA-256)
     - Previous ingestion state
     
     This significantly speeds up re-ingestion by skipping unchanged files.
@@ -431,31 +868,129 @@ class IncrementalPipeline(IngestionPipeline):
         super().__init__(config, progress_callback)
         self.state_file = Path(state_file)
         self.previous_state = self._load_state()
+        self._stat_index = self._build_stat_index()
+        
+        # Hashes computed during the current run: (path, algo) -> (size, mtime_ns, hash)
+        self._file_hashes: Dict[Tuple[str, str], Tuple[int, int, str]] = {}
+        
+        # Set when unchanged files' state entries were refreshed this run
+        self._state_refreshed = False
+        
+        # Re-scans skip hashing files whose size and mtime are unchanged
+        self.scanner = FileScanner(
+            ignored_patterns=config.ignored_patterns,
+            hash_cache_path=self.state_file.with_suffix(".scan_index.json")
+        )
         
         logger.info(f"Initialized IncrementalPipeline with state file: {state_file}")
     
-    def _compute_file_hash(self, file_path: Path) -> str:
+    def _compute_file_hash(self, file_path: Path, hash_algo: Optional[str] = None) -> str:
         """
-        Compute SHA-256 hash of file contents.
+        Compute the content hash of a file.
+        
+        Uses the scanner's algorithm (BLAKE3 when installed) unless
+        hash_algo names another hashlib algorithm, as for SHA-256 state
+        entries written before the algorithm was recorded. Hashes are
+        memoized for the current run, so a file is read at most once.
         
         Args:
             file_path: Path to file
+            hash_algo: Algorithm to use (default: the scanner's)
             
         Returns:
             Hex digest of file hash
         """
-        sha256 = hashlib.sha256()
+        hash_algo = hash_algo or self.scanner.hash_algo
         
         try:
-            with open(file_path, 'rb') as f:
-                # Read in chunks to handle large files
-                while chunk := f.read(8192):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+            stats = file_path.stat()
+            key = (str(file_path), hash_algo)
+            cached = self._file_hashes.get(key)
+            if cached is not None and cached[:2] == (stats.st_size, stats.st_mtime_ns):
+                return cached[2]
+            
+            if hash_algo == self.scanner.hash_algo:
+                file_hash = self.scanner.calculate_hash(file_path, stats.st_size)
+            elif stats.st_size >= FileScanner.MMAP_HASH_THRESHOLD:
+                # Large files: hash the whole mapping in one call, no copies
+                with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    file_hash = hashlib.new(hash_algo, mm).hexdigest()
+            else:
+                # file_digest runs the read/update loop in C with a large buffer
+                with open(file_path, 'rb', buffering=0) as f:
+                    file_hash = hashlib.file_digest(f, hash_algo).hexdigest()
+            self._file_hashes[key] = (stats.st_size, stats.st_mtime_ns, file_hash)
+            return file_hash
         except Exception as e:
             logger.warning(f"Could not hash {file_path}: {e}")
             return ""
     
+    def _current_hash(self, file_info: FileInfo) -> str:
+        """
+        Get a file's hash in the scanner's algorithm, reusing the scan's.
+        
+        Args:
+            file_info: Scanned file
+            
+        Returns:
+            Hex digest of file hash
+        """
+        return file_info.hash or self._compute_file_hash(file_info.path)
+    
+    @staticmethod
+    def _mtime_ns(file_info: FileInfo) -> int:
+        """
+        Get a file's mtime as of its scan, stat'ing only if it's unknown.
+        
+        Args:
+            file_info: Scanned file
+            
+        Returns:
+            st_mtime_ns, or 0 if the file can't be stat'ed
+        """
+        if file_info.mtime_ns:
+            return file_info.mtime_ns
+        try:
+            return file_info.path.stat().st_mtime_ns
+        except OSError:
+            return 0
+    
+    def _stable_mtime_ns(self, file_info: FileInfo) -> Optional[int]:
+        """
+        Get a file's mtime for the stat fast path in should_process_file.
+        
+        Uses the scan-time mtime, matching the scan-time hash it is saved
+        with. Returns None for files modified within the racy window,
+        since a same-size write in the same mtime tick could go
+        unnoticed; those files are hashed again next run.
+        
+        Args:
+            file_info: Scanned file
+            
+        Returns:
+            st_mtime_ns, or None if too recent or unknown
+        """
+        mtime_ns = self._mtime_ns(file_info)
+        if not mtime_ns or time.time_ns() - mtime_ns <= FileScanner.RACY_MTIME_WINDOW_NS:
+            return None
+        return mtime_ns
+    
+    def _build_stat_index(self) -> set:
+        """
+        Collect (path, size, mtime_ns) of every previous-state entry.
+        
+        A file whose scanned triple is in this set is unchanged, so
+        should_process_file can skip it with one set lookup.
+        
+        Returns:
+            Set of (path, size, mtime_ns) tuples
+        """
+        return {
+            (path, entry.get("size"), entry["mtime_ns"])
+            for path, entry in self.previous_state.items()
+            if entry.get("mtime_ns") is not None
+        }
+    
     def _load_state(self) -> dict:
         """
         Load previous ingestion state from JSON file.
@@ -468,8 +1003,9 @@ class IncrementalPipeline(IngestionPipeline):
             return {}
         
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
+            with open(self.state_file, 'rb') as f:
+                raw = f.read()
+            state = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
             logger.info(f"Loaded state for {len(state)} previously processed files")
             return state
         except Exception as e:
@@ -480,23 +1016,48 @@ class IncrementalPipeline(IngestionPipeline):
         """
         Save current ingestion state to JSON file.
         
+        Written compactly (orjson when available) and atomically, so an
+        interrupted save leaves the previous state intact.
+        
         Args:
             state: Dictionary mapping file paths to metadata
         """
+        tmp_file = self.state_file.with_suffix(self.state_file.suffix + ".tmp")
         try:
             # Ensure parent directory exists
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            if ORJSON_AVAILABLE:
+                raw = orjson.dumps(state)
+            else:
+                raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+            with open(tmp_file, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp_file, self.state_file)
             logger.info(f"Saved state for {len(state)} files to {self.state_file}")
         except Exception as e:
             logger.error(f"Failed to save state file: {e}")
+            tmp_file.unlink(missing_ok=True)
+    
+    def _unchanged_by_stat(self, file_info: FileInfo) -> bool:
+        """
+        Check whether a file's size and mtime match the saved state.
+        
+        Args:
+            file_info: Scanned file
+            
+        Returns:
+            True if the file is known to be unchanged
+        """
+        return (str(file_info.path), file_info.size, self._mtime_ns(file_info)) in self._stat_index
     
     def should_process_file(self, file_info: FileInfo) -> bool:
         """
         Check if file needs processing based on hash comparison.
         
+        Files whose size and mtime match the saved state are skipped with
+        a single set lookup; only files whose stat changed are hashed.
+        
         Args:
             file_info: File information
             
@@ -505,21 +1066,37 @@ class IncrementalPipeline(IngestionPipeline):
         """
         file_path_str = str(file_info.path)
         
+        # Unchanged size and mtime - skip without hashing
+        if self._unchanged_by_stat(file_info):
+            logger.debug(f"Skipping unchanged file: {file_info.path}")
+            return False
+        
         # File not in previous state - must process
-        if file_path_str not in self.previous_state:
+        previous = self.previous_state.get(file_path_str)
+        if previous is None:
             logger.debug(f"New file: {file_info.path}")
             return True
         
-        # Compute current hash
-        current_hash = self._compute_file_hash(file_info.path)
-        previous_hash = self.previous_state[file_path_str].get("hash", "")
+        # Compare hashes in the algorithm the entry was saved with
+        previous_algo = previous.get("algo", "sha256")
+        if previous_algo == self.scanner.hash_algo:
+            current_hash = self._current_hash(file_info)
+        else:
+            current_hash = self._compute_file_hash(file_info.path, previous_algo)
         
         # Hash mismatch - file was modified
-        if current_hash != previous_hash:
+        if current_hash != previous.get("hash", ""):
             logger.debug(f"Modified file: {file_info.path}")
             return True
         
-        # File unchanged
+        # File unchanged; refresh its entry so the next run takes the stat fast path
+        previous.update(
+            hash=self._current_hash(file_info),
+            algo=self.scanner.hash_algo,
+            size=file_info.size,
+            mtime_ns=self._stable_mtime_ns(file_info)
+        )
+        self._state_refreshed = True
         logger.debug(f"Skipping unchanged file: {file_info.path}")
         return False
     
@@ -531,15 +1108,25 @@ class IncrementalPipeline(IngestionPipeline):
             PipelineResult with chunks and statistics
         """
         logger.info("Starting incremental ingestion pipeline")
+        self._file_hashes.clear()
+        self._state_refreshed = False
         
         try:
             # Step 1: Scan files
             self.emit_progress(PipelineStage.SCANNING, 0, 1, "Scanning directory...")
             all_file_infos = self.scan_files()
-            self.stats["files_scanned"] = len(all_file_infos)
+            self.stats.files_scanned = len(all_file_infos)
             
-            # Step 2: Filter to only changed files
-            file_infos = [f for f in all_file_infos if self.should_process_file(f)]
+            # Step 2: Filter to only changed files. The stat check settles
+            # most files; the rest may need hashing, which runs in threads
+            # (hashing releases the GIL)
+            candidates = [f for f in all_file_infos if not self._unchanged_by_stat(f)]
+            if self.max_workers > 1 and len(candidates) > 1:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    changed = list(executor.map(self.should_process_file, candidates))
+            else:
+                changed = [self.should_process_file(f) for f in candidates]
+            file_infos = [f for f, is_changed in zip(candidates, changed) if is_changed]
             
             skipped_count = len(all_file_infos) - len(file_infos)
             logger.info(
@@ -549,8 +1136,10 @@ class IncrementalPipeline(IngestionPipeline):
             
             if len(file_infos) == 0:
                 logger.info("No files to process, all files are up to date")
+                if self._state_refreshed:
+                    self._save_state(self.previous_state)
                 return PipelineResult(
-                    total_files_scanned=self.stats["files_scanned"],
+                    total_files_scanned=self.stats.files_scanned,
                     total_files_processed=0,
                     total_sections_extracted=0,
                     total_chunks_generated=0,
@@ -558,66 +1147,65 @@ class IncrementalPipeline(IngestionPipeline):
                     errors=[]
                 )
             
-            # Step 3: Process changed files
+            # Steps 3-4: Process changed files and chunk their sections as they stream in
             self.emit_progress(PipelineStage.PROCESSING, 0, len(file_infos), "Processing files...")
-            all_sections = []
             new_state = self.previous_state.copy()
             
-            for i, file_info in enumerate(file_infos):
-                sections = self.process_file(file_info)
-                all_sections.extend(sections)
-                self.stats["files_processed"] += 1
-                self.stats["sections_extracted"] += len(sections)
-                
+            def record_state(file_info: FileInfo) -> None:
                 # Update state for this file
-                file_hash = self._compute_file_hash(file_info.path)
                 new_state[str(file_info.path)] = {
-                    "hash": file_hash,
+                    "hash": self._current_hash(file_info),
+                    "algo": self.scanner.hash_algo,
                     "last_processed": datetime.now().isoformat(),
                     "size": file_info.size,
+                    "mtime_ns": self._stable_mtime_ns(file_info),
                     "file_type": file_info.file_type.value,
                     "language": file_info.language
                 }
-                
-                self.emit_progress(
-                    PipelineStage.PROCESSING, 
-                    i + 1, 
-                    len(file_infos),
-                    f"Processed {file_info.path.name}"
-                )
             
-            # Step 4: Chunk sections
+            chunks = self.chunk_sections(self.iter_sections(file_infos, on_file=record_state))
+            self.stats.chunks_generated = len(chunks)
             self.emit_progress(
                 PipelineStage.CHUNKING, 
-                0, 
-                len(all_sections),
-                "Chunking sections..."
+                self.stats.sections_extracted, 
+                self.stats.sections_extracted,
+                "Chunked sections"
             )
-            chunks = self.chunk_sections(all_sections)
-            self.stats["chunks_generated"] = len(chunks)
             
             # Step 5: Save updated state
             self._save_state(new_state)
             
             logger.info(
-                f"Incremental pipeline complete: {self.stats['files_processed']}/{self.stats['files_scanned']} files, "
-                f"{self.stats['sections_extracted']} sections, "
-                f"{self.stats['chunks_generated']} chunks"
+                f"Incremental pipeline complete: {self.stats.files_processed}/{self.stats.files_scanned} files, "
+                f"{self.stats.sections_extracted} sections, "
+                f"{self.stats.chunks_generated} chunks"
             )
             
             return PipelineResult(
-                total_files_scanned=self.stats["files_scanned"],
-                total_files_processed=self.stats["files_processed"],
-                total_sections_extracted=self.stats["sections_extracted"],
-                total_chunks_generated=self.stats["chunks_generated"],
+                total_files_scanned=self.stats.files_scanned,
+                total_files_processed=self.stats.files_processed,
+                total_sections_extracted=self.stats.sections_extracted,
+                total_chunks_generated=self.stats.chunks_generated,
                 chunks=chunks,
-                errors=self.stats["errors"]
+                errors=list(self.stats.errors)
             )
             
         except Exception as e:
             logger.error(f"Incremental pipeline failed: {e}")
-            self.stats["errors"].append({
+            self.stats.errors.append({
                 "error": str(e),
                 "stage": "pipeline"
             })
             raise
+
+    async def run_async(self) -> PipelineResult:
+        """
+        Run incremental ingestion without blocking the event loop.
+        
+        Runs run() in a worker thread, so the state-file bookkeeping
+        stays in one place.
+        
+        Returns:
+            PipelineResult with chunks and statistics
+        """
+        return await asyncio.to_thread(self.run)
@@ -9,6 +9,7 @@ from devmind.llm.provider import (
     ProviderType,
     get_llm_manager
 )
+from devmind.llm.prompt_cache import PromptCache
 from devmind.llm.chat_engine import ChatEngine, ChatResponse
 from devmind.llm.answer_builder import AnswerBuilder, ContextBlock, AssembledContext
 from devmind.llm.query_expander import QueryExpander
@@ -21,6 +22,7 @@ __all__ = [
     "LLMProviderManager",
     "ProviderType",
     "get_llm_manager",
+    "PromptCache",
     
     # Chat
     "ChatEngine",
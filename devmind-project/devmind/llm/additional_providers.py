@@ -27,8 +27,25 @@ class OpenAIProvider(LLMProvider):
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY not set")
         
+        # Client is created on first use and reused so its HTTP connection
+        # pool stays warm across requests
+        self._client = None
+        
         logger.info(f"OpenAIProvider initialized (model={model})")
     
+    def _get_client(self):
+        """Get the shared AsyncOpenAI client, creating it on first use."""
+        if self._client is None:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(api_key=self.api_key)
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared client and its pooled connections."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+    
     async def generate(
         self,
         prompt: str,
@@ -38,9 +55,7 @@ class OpenAIProvider(LLMProvider):
     ) -> str:
         """Generate completion using OpenAI API."""
         try:
-            from openai import AsyncOpenAI
-            
-            client = AsyncOpenAI(api_key=self.api_key)
+            client = self._get_client()
             
             response = await client.chat.completions.create(
                 model=self.model,
@@ -64,9 +79,7 @@ class OpenAIProvider(LLMProvider):
     ) -> AsyncGenerator[str, None]:
         """Stream completion tokens."""
         try:
-            from openai import AsyncOpenAI
-            
-            client = AsyncOpenAI(api_key=self.api_key)
+            client = self._get_client()
             
             stream = await client.chat.completions.create(
                 model=self.model,
@@ -102,8 +115,19 @@ class GeminiProvider(LLMProvider):
         if not self.api_key:
             raise ValueError("GOOGLE_API_KEY not set")
         
+        # Model is configured on first use and reused across requests
+        self._model = None
+        
         logger.info(f"GeminiProvider initialized (model={model})")
     
+    def _get_model(self):
+        """Get the shared GenerativeModel, configuring the SDK on first use."""
+        if self._model is None:
+            import google.generativeai as genai
+            genai.configure(api_key=self.api_key)
+            self._model = genai.GenerativeModel(self.model)
+        return self._model
+    
     async def generate(
         self,
         prompt: str,
@@ -115,24 +139,18 @@ class GeminiProvider(LLMProvider):
         try:
             import google.generativeai as genai
             
-            genai.configure(api_key=self.api_key)
-            model = genai.GenerativeModel(self.model)
-            
-            # Gemini uses sync API, wrap in executor for async
-            import asyncio
-            loop = asyncio.get_event_loop()
+            model = self._get_model()
             
-            def _generate():
-                response = model.generate_content(
-                    prompt,
-                    generation_config=genai.GenerationConfig(
-                        temperature=temperature,
-                        max_output_tokens=max_tokens
-                    )
+            # Native async API - no thread hop per request
+            response = await model.generate_content_async(
+                prompt,
+                generation_config=genai.GenerationConfig(
+                    temperature=temperature,
+                    max_output_tokens=max_tokens
                 )
-                return response.text
+            )
             
-            return await loop.run_in_executor(None, _generate)
+            return response.text
             
         except Exception as e:
             logger.error(f"Gemini generation error: {e}")
@@ -148,27 +166,20 @@ class GeminiProvider(LLMProvider):
         """Stream completion tokens."""
         try:
             import google.generativeai as genai
-            import asyncio
-            
-            genai.configure(api_key=self.api_key)
-            model = genai.GenerativeModel(self.model)
             
-            # Gemini streaming
-            loop = asyncio.get_event_loop()
+            model = self._get_model()
             
-            def _stream():
-                return model.generate_content(
-                    prompt,
-                    generation_config=genai.GenerationConfig(
-                        temperature=temperature,
-                        max_output_tokens=max_tokens
-                    ),
-                    stream=True
-                )
-            
-            stream = await loop.run_in_executor(None, _stream)
+            # Gemini streaming (async iteration doesn't block the event loop)
+            stream = await model.generate_content_async(
+                prompt,
+                generation_config=genai.GenerationConfig(
+                    temperature=temperature,
+                    max_output_tokens=max_tokens
+                ),
+                stream=True
+            )
             
-            for chunk in stream:
+            async for chunk in stream:
                 if chunk.text:
                     yield chunk.text
                     
@@ -3,15 +3,33 @@ Answer Builder for DevMind.
 Assembles context from retrieval results into structured prompts.
 """
 
-from typing import List, Dict, Any
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from operator import attrgetter
 import logging
+import sys
 
 from devmind.retrieval import RetrievalResult
 
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a repeated metadata string (None passes through)."""
+    return sys.intern(value) if value else value
+
+
+# Sort key for merging blocks (C-level getter, no lambda call per block)
+_START_LINE = attrgetter("start_line")
+
+
 @dataclass
 class ContextBlock:
     """Single context block for LLM."""
@@ -40,14 +58,33 @@ class AnswerBuilder:
     Assembles context in a format optimized for LLM consumption.
     """
     
-    def __init__(self, max_context_tokens: int = 8000):
+    # Max distinct chunk contents whose token counts are memoized
+    MAX_CACHED_COUNTS = 4096
+    
+    # Smallest content budget worth including a truncated final block for
+    MIN_PARTIAL_TOKENS = 32
+    
+    def __init__(self, max_context_tokens: int = 8000, encoding: str = "cl100k_base"):
         """
         Initialize answer builder.
         
         Args:
             max_context_tokens: Maximum tokens for context
+            encoding: tiktoken BPE encoding used to count tokens
         """
         self.max_context_tokens = max_context_tokens
+        
+        # Real BPE counts when tiktoken is available, else ~4 chars/token
+        self._encoder = None
+        if TIKTOKEN_AVAILABLE:
+            try:
+                self._encoder = tiktoken.get_encoding(encoding)
+            except Exception as e:
+                logger.warning(f"Could not load {encoding} encoding, estimating tokens: {e}")
+        
+        # Token counts of chunk contents, reused across queries
+        self._content_tokens: Dict[str, int] = {}
+        
         logger.info(f"AnswerBuilder initialized (max_tokens={max_context_tokens})")
     
     def assemble_context(
@@ -67,45 +104,73 @@ class AnswerBuilder:
         """
         logger.info(f"Assembling context from {len(results)} results")
         
+        # Drop repeated spans before any formatting or token counting
+        results = self._dedup_spans(results)
+        
         context_blocks = []
-        formatted_parts = []
+        parts: List[str] = []  # Fragments of the final context, joined once
         total_tokens = 0
+        overflow = None  # First (highest-ranked) block that didn't fit whole
         
         for i, result in enumerate(results, 1):
-            # Create context block
+            if self.max_context_tokens - total_tokens < self.MIN_PARTIAL_TOKENS:
+                break
+            
+            # Create context block (repeated metadata strings are interned)
             block = ContextBlock(
-                file_path=result.file_path,
+                file_path=_intern(result.file_path),
                 start_line=result.start_line,
                 end_line=result.end_line,
-                section_type=result.section_type,
-                language=result.language,
+                section_type=_intern(result.section_type),
+                language=_intern(result.language),
                 content=result.content,
                 score=result.score
             )
             
-            # Format as structured block
-            if include_metadata:
-                formatted = self._format_block_with_metadata(block, i)
-            else:
-                formatted = self._format_block_simple(block)
+            # Structured block is header + content + footer; sources are
+            # numbered by position so they match build_citations ids
+            header, footer = self._block_wrapper(block, len(context_blocks) + 1, include_metadata)
             
-            # Estimate tokens (rough: 1 token ≈ 4 chars)
-            block_tokens = len(formatted) // 4
+            # Count the metadata wrapper and the (memoized) content separately
+            block_tokens = (
+                self._count_tokens(header + footer)
+                + self._count_content_tokens(block.content)
+            )
             
-            # Check token limit
+            # Skip blocks that don't fit, but keep packing smaller lower-ranked ones
             if total_tokens + block_tokens > self.max_context_tokens:
-                logger.warning(
-                    f"Context limit reached at block {i}, "
-                    f"total_tokens={total_tokens}"
-                )
-                break
+                if overflow is None:
+                    logger.warning(
+                        f"Context limit reached at block {i}, "
+                        f"total_tokens={total_tokens}"
+                    )
+                    overflow = block
+                continue
             
+            self._append_block(parts, header, block.content, footer)
             context_blocks.append(block)
-            formatted_parts.append(formatted)
             total_tokens += block_tokens
         
-        # Join all formatted blocks
-        formatted_context = "\n\n".join(formatted_parts)
+        # Fill what's left of the budget with the head of the first skipped block
+        if overflow is not None:
+            header, footer = self._block_wrapper(overflow, len(context_blocks) + 1, include_metadata)
+            wrapper_tokens = self._count_tokens(header + footer)
+            budget = self.max_context_tokens - total_tokens - wrapper_tokens
+            if budget >= self.MIN_PARTIAL_TOKENS:
+                content = self._truncate_to_tokens(overflow.content, budget)
+                if content:
+                    block = replace(
+                        overflow,
+                        content=content,
+                        end_line=overflow.start_line + content.count("\n")
+                    )
+                    header, footer = self._block_wrapper(block, len(context_blocks) + 1, include_metadata)
+                    self._append_block(parts, header, content, footer)
+                    context_blocks.append(block)
+                    total_tokens += self._count_tokens(header + footer) + self._count_tokens(content)
+        
+        # Copy all blocks into the context in one pass
+        formatted_context = "".join(parts)
         
         logger.info(
             f"Assembled {len(context_blocks)} blocks, "
@@ -119,9 +184,113 @@ class AnswerBuilder:
             sources_count=len(context_blocks)
         )
     
-    def _format_block_with_metadata(self, block: ContextBlock, index: int) -> str:
-        """Format context block with metadata."""
-        return f"""[Source {index}]
+    def _dedup_spans(self, results: List[RetrievalResult]) -> List[RetrievalResult]:
+        """
+        Drop results that repeat a span already in the list.
+        
+        Hybrid search can return the same lines under different chunk ids
+        (e.g. from several indexes). Each span keeps its first position
+        and the highest-scoring result.
+        
+        Args:
+            results: Retrieval results, in rank order
+            
+        Returns:
+            Results with one entry per (file_path, start_line, end_line)
+        """
+        best: Dict[Tuple[str, int, int], RetrievalResult] = {}
+        for result in results:
+            key = (result.file_path, result.start_line, result.end_line)
+            current = best.get(key)
+            if current is None or result.score > current.score:
+                best[key] = result
+        
+        if len(best) < len(results):
+            logger.debug(f"Deduplicated {len(results)} -> {len(best)} results by span")
+        return list(best.values())
+    
+    def _truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """
+        Cut text to at most max_tokens tokens, ending on a whole line.
+        
+        Args:
+            text: Text to truncate
+            max_tokens: Token budget
+            
+        Returns:
+            Longest prefix of whole lines within the budget (may be empty)
+        """
+        if self._encoder is None:
+            head = text[:max_tokens * 4]
+        else:
+            tokens = self._encoder.encode_ordinary(text)
+            if len(tokens) <= max_tokens:
+                return text
+            # Token boundaries can split a UTF-8 sequence; drop the partial char
+            head = self._encoder.decode_bytes(tokens[:max_tokens]).decode("utf-8", errors="ignore")
+        
+        if len(head) >= len(text):
+            return text
+        return head[:head.rfind("\n") + 1].rstrip("\n")
+    
+    def _count_tokens(self, text: str) -> int:
+        """
+        Count tokens in text.
+        
+        Args:
+            text: Text to count
+            
+        Returns:
+            BPE token count, or a ~4 chars/token estimate without tiktoken
+        """
+        if self._encoder is None:
+            return len(text) // 4
+        return len(self._encoder.encode_ordinary(text))
+    
+    def _count_content_tokens(self, content: str) -> int:
+        """
+        Count tokens in chunk content, memoized by content.
+        
+        Args:
+            content: Chunk content
+            
+        Returns:
+            Token count
+        """
+        count = self._content_tokens.get(content)
+        if count is None:
+            if len(self._content_tokens) >= self.MAX_CACHED_COUNTS:
+                self._content_tokens.clear()
+            count = self._count_tokens(content)
+            self._content_tokens[content] = count
+        return count
+    
+    @staticmethod
+    def _append_block(parts: List[str], header: str, content: str, footer: str) -> None:
+        """Append a block's fragments to the context, separated from the last."""
+        if parts:
+            parts.append("\n\n")
+        parts.extend((header, content, footer))
+    
+    def _block_wrapper(
+        self,
+        block: ContextBlock,
+        index: int,
+        include_metadata: bool
+    ) -> Tuple[str, str]:
+        """
+        Build the text around a block's content.
+        
+        Args:
+            block: Context block
+            index: 1-based source number
+            include_metadata: Whether to include the metadata header
+            
+        Returns:
+            Tuple of (header, footer); the block is header + content + footer
+        """
+        if include_metadata:
+            header = f"""[Source {index}]
 File: {block.file_path}
 Lines: {block.start_line}-{block.end_line}
 Type: {block.section_type}
@@ -129,16 +298,13 @@ Language: {block.language}
 Relevance: {block.score:.2f}
 
 ```{block.language}
-{block.content}
-```"""
-    
-    def _format_block_simple(self, block: ContextBlock) -> str:
-        """Format context block without metadata."""
-        return f"""# {block.file_path}:{block.start_line}-{block.end_line}
+"""
+        else:
+            header = f"""# {block.file_path}:{block.start_line}-{block.end_line}
 
 ```{block.language}
-{block.content}
-```"""
+"""
+        return header, "\n```"
     
     def build_citations(
         self,
@@ -186,38 +352,56 @@ Relevance: {block.score:.2f}
             return []
         
         # Group by file
-        by_file: Dict[str, List[ContextBlock]] = {}
+        by_file: Dict[str, List[ContextBlock]] = defaultdict(list)
         for block in blocks:
-            if block.file_path not in by_file:
-                by_file[block.file_path] = []
             by_file[block.file_path].append(block)
         
         merged = []
         
         for file_path, file_blocks in by_file.items():
             # Sort by start line
-            file_blocks.sort(key=lambda b: b.start_line)
+            file_blocks.sort(key=_START_LINE)
             
-            current = file_blocks[0]
+            # Sweep, collecting merged contents and joining them once
+            first = file_blocks[0]
+            end_line = first.end_line
+            score = first.score
+            fragments = [first.content]
             
             for next_block in file_blocks[1:]:
                 # Check if overlapping or adjacent
-                if next_block.start_line <= current.end_line + 5:
-                    # Merge
-                    current = ContextBlock(
-                        file_path=current.file_path,
-                        start_line=current.start_line,
-                        end_line=max(current.end_line, next_block.end_line),
-                        section_type=current.section_type,
-                        language=current.language,
-                        content=current.content + "\n\n" + next_block.content,
-                        score=max(current.score, next_block.score)
-                    )
+                if next_block.start_line <= end_line + 5:
+                    end_line = max(end_line, next_block.end_line)
+                    score = max(score, next_block.score)
+                    fragments.append(next_block.content)
                 else:
-                    merged.append(current)
-                    current = next_block
+                    merged.append(self._merged_block(first, end_line, score, fragments))
+                    first = next_block
+                    end_line = first.end_line
+                    score = first.score
+                    fragments = [first.content]
             
-            merged.append(current)
+            merged.append(self._merged_block(first, end_line, score, fragments))
         
         logger.info(f"Merged {len(blocks)} -> {len(merged)} blocks")
         return merged
+    
+    @staticmethod
+    def _merged_block(
+        first: ContextBlock,
+        end_line: int,
+        score: float,
+        fragments: List[str]
+    ) -> ContextBlock:
+        """Build a merged block from its first block and collected contents."""
+        if len(fragments) == 1:
+            return first
+        return ContextBlock(
+            file_path=first.file_path,
+            start_line=first.start_line,
+            end_line=end_line,
+            section_type=first.section_type,
+            language=first.language,
+            content="\n\n".join(fragments),
+            score=score
+        )
@@ -3,12 +3,15 @@ Chat Engine for DevMind.
 Core orchestration of retrieval + LLM for Q&A.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+import asyncio
 import logging
+import re
 import time
 
-from devmind.retrieval import RetrievalPipeline, FilterCriteria
+from devmind.retrieval import RetrievalPipeline, RetrievalResult, FilterCriteria
 from devmind.llm.provider import LLMProviderManager, ProviderType
 from devmind.llm.prompts import build_chat_prompt
 from devmind.llm.answer_builder import AnswerBuilder
@@ -16,6 +19,28 @@ from devmind.llm.query_expander import QueryExpander
 
 logger = logging.getLogger(__name__)
 
+# Prefix for debug_assist queries
+_DEBUG_PREFIX = "debug error: "
+
+# Answer given when retrieval finds nothing
+NO_RESULTS_ANSWER = "I couldn't find any relevant information in the codebase to answer your question."
+
+# Query complexity indicators (substring matches on the lowercased query)
+_COMPLEX_RE = re.compile(r"architecture|design|pattern|why|compare")
+_SIMPLE_RE = re.compile(r"what is|show|find|where")
+
+
+@lru_cache(maxsize=256)
+def _query_complexity(query: str) -> str:
+    """Classify a query as "simple", "medium" or "complex"."""
+    query_lower = query.lower()
+    
+    if _COMPLEX_RE.search(query_lower):
+        return "complex"
+    if _SIMPLE_RE.search(query_lower):
+        return "simple"
+    return "medium"
+
 
 @dataclass
 class ChatResponse:
@@ -59,6 +84,9 @@ class ChatEngine:
         self.answer_builder = AnswerBuilder(max_context_tokens=max_context_tokens)
         self.query_expander = QueryExpander()
         
+        # Expansion is a pure function of the query; repeated queries hit the cache
+        self._expand_query = lru_cache(maxsize=512)(self._expand_query_uncached)
+        
         logger.info("ChatEngine initialized")
     
     async def chat(
@@ -89,29 +117,14 @@ class ChatEngine:
         start_time = time.time()
         logger.info(f"Chat query: '{query}'")
         
-        # Step 1: Query expansion (optional)
-        search_query = query
-        if use_query_expansion:
-            expanded = self.query_expander.expand(query, max_variants=2)
-            if len(expanded) > 1:
-                search_query = expanded[1]  # Use first expansion
-                logger.info(f"Expanded query: '{search_query}'")
-        
-        # Step 2: Retrieval
-        retrieval_start = time.time()
-        results = self.retrieval_pipeline.search(
-            query=search_query,
-            top_k=top_k,
-            use_keyword=use_keyword_search,
-            filter_criteria=filter_criteria
+        # Steps 1-2: Query expansion and retrieval
+        results, retrieval_time, complexity = await self._retrieve(
+            query, top_k, use_query_expansion, use_keyword_search, filter_criteria
         )
-        retrieval_time = (time.time() - retrieval_start) * 1000
-        
-        logger.info(f"Retrieved {len(results)} results in {retrieval_time:.2f}ms")
         
         if not results:
             return ChatResponse(
-                answer="I couldn't find any relevant information in the codebase to answer your question.",
+                answer=NO_RESULTS_ANSWER,
                 citations=[],
                 retrieval_stats={
                     "num_results": 0,
@@ -131,13 +144,17 @@ class ChatEngine:
         # Step 4: Build prompt
         prompt = build_chat_prompt(query, assembled.formatted_context)
         
-        # Step 5: Generate answer
+        # Step 5: Select provider once and generate answer
+        selected_provider = self.llm_manager.auto_select_provider(
+            assembled.total_tokens,
+            complexity,
+            provider_type
+        )
+        
         llm_start = time.time()
         answer = await self.llm_manager.generate(
             prompt,
-            context_size=assembled.total_tokens,
-            query_complexity=self._assess_complexity(query),
-            provider_type=provider_type,
+            provider_type=selected_provider,
             temperature=temperature,
             max_tokens=2000
         )
@@ -150,13 +167,6 @@ class ChatEngine:
         
         total_time = (time.time() - start_time) * 1000
         
-        # Determine which provider was used
-        selected_provider = self.llm_manager.auto_select_provider(
-            assembled.total_tokens,
-            self._assess_complexity(query),
-            provider_type
-        )
-        
         return ChatResponse(
             answer=answer,
             citations=citations,
@@ -170,6 +180,126 @@ class ChatEngine:
             total_time_ms=total_time
         )
     
+    async def chat_stream(
+        self,
+        query: str,
+        top_k: int = 10,
+        use_query_expansion: bool = True,
+        use_keyword_search: bool = True,
+        filter_criteria: Optional[FilterCriteria] = None,
+        provider_type: Optional[ProviderType] = None,
+        temperature: float = 0.7
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process chat query, streaming the answer as it is generated.
+        
+        Citations come from the assembled context, so they are built before
+        generation starts and sent with the final event.
+        
+        Args:
+            query: User query
+            top_k: Number of results to retrieve
+            use_query_expansion: Whether to expand query
+            use_keyword_search: Use hybrid search
+            filter_criteria: Optional filters
+            provider_type: Force specific LLM provider
+            temperature: LLM temperature
+            
+        Yields:
+            {"delta": text, "is_final": False} per generated chunk, then
+            {"delta": "", "is_final": True, "citations": [...], "metadata": {...}}
+        """
+        logger.info(f"Streaming chat query: '{query}'")
+        
+        results, retrieval_time, complexity = await self._retrieve(
+            query, top_k, use_query_expansion, use_keyword_search, filter_criteria
+        )
+        
+        if not results:
+            yield {
+                "delta": NO_RESULTS_ANSWER,
+                "is_final": True,
+                "citations": [],
+                "metadata": {"num_results": 0}
+            }
+            return
+        
+        assembled = self.answer_builder.assemble_context(results, include_metadata=True)
+        prompt = build_chat_prompt(query, assembled.formatted_context)
+        citations = self.answer_builder.build_citations(assembled.context_blocks)
+        
+        selected_provider = self.llm_manager.auto_select_provider(
+            assembled.total_tokens,
+            complexity,
+            provider_type
+        )
+        
+        async for chunk in self.llm_manager.stream(
+            prompt,
+            provider_type=selected_provider,
+            temperature=temperature,
+            max_tokens=2000
+        ):
+            yield {"delta": chunk, "is_final": False}
+        
+        yield {
+            "delta": "",
+            "is_final": True,
+            "citations": citations,
+            "metadata": {
+                "num_results": len(results),
+                "retrieval_time_ms": retrieval_time,
+                "sources_count": assembled.sources_count,
+                "context_tokens": assembled.total_tokens,
+                "llm_provider": selected_provider.value
+            }
+        }
+    
+    async def _retrieve(
+        self,
+        query: str,
+        top_k: int,
+        use_query_expansion: bool,
+        use_keyword_search: bool,
+        filter_criteria: Optional[FilterCriteria]
+    ) -> Tuple[List[RetrievalResult], float, str]:
+        """
+        Expand the query (optionally) and retrieve results for it.
+        
+        Args:
+            query: User query
+            top_k: Number of results to retrieve
+            use_query_expansion: Whether to expand query
+            use_keyword_search: Use hybrid search
+            filter_criteria: Optional filters
+            
+        Returns:
+            Tuple of (results, retrieval time in ms, query complexity)
+        """
+        # Step 1: Query expansion (optional)
+        search_query = query
+        if use_query_expansion:
+            expanded = self._expand_query(query)
+            if len(expanded) > 1:
+                search_query = expanded[1]  # Use first expansion
+                logger.info(f"Expanded query: '{search_query}'")
+        
+        complexity = self._assess_complexity(query)
+        
+        # Step 2: Retrieval, in a worker thread so the event loop stays free
+        retrieval_start = time.time()
+        results = await asyncio.to_thread(
+            self.retrieval_pipeline.search,
+            query=search_query,
+            top_k=top_k,
+            use_keyword=use_keyword_search,
+            filter_criteria=filter_criteria
+        )
+        retrieval_time = (time.time() - retrieval_start) * 1000
+        
+        logger.info(f"Retrieved {len(results)} results in {retrieval_time:.2f}ms")
+        return results, retrieval_time, complexity
+    
     async def explain_code(
         self,
         file_path: str,
@@ -217,9 +347,11 @@ class ChatEngine:
         Returns:
             ChatResponse with debugging help
         """
-        query = f"debug error: {error_message}"
+        # Build the query in one concatenation
         if context_query:
-            query += f" {context_query}"
+            query = _DEBUG_PREFIX + error_message + " " + context_query
+        else:
+            query = _DEBUG_PREFIX + error_message
         
         return await self.chat(
             query=query,
@@ -228,16 +360,10 @@ class ChatEngine:
             temperature=0.5  # Lower temperature for debugging
         )
     
+    def _expand_query_uncached(self, query: str) -> Tuple[str, ...]:
+        """Expand a query into up to two variants (original first)."""
+        return tuple(self.query_expander.expand(query, max_variants=2))
+    
     def _assess_complexity(self, query: str) -> str:
-        """Assess query complexity."""
-        query_lower = query.lower()
-        
-        # Complex indicators
-        if any(word in query_lower for word in ["architecture", "design", "pattern", "why", "compare"]):
-            return "complex"
-        
-        # Simple indicators
-        if any(word in query_lower for word in ["what is", "show", "find", "where"]):
-            return "simple"
-        
-        return "medium"
+        """Assess query complexity (memoized per query)."""
+        return _query_complexity(query)
@@ -0,0 +1,121 @@
+"""
+Prompt response cache for DevMind LLM calls.
+Serves repeated prompts from memory instead of calling the provider again.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class PromptCache:
+    """
+    In-process LRU cache of LLM responses.
+    
+    Entries are keyed by a SHA-256 of the provider, the generation
+    parameters and the prompt, and expire after ttl_seconds. Matching is
+    exact: RAG prompts carry the retrieved context, so two prompts that are
+    merely similar can be grounded in different code.
+    """
+    
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 3600.0):
+        """
+        Initialize prompt cache.
+        
+        Args:
+            max_entries: Maximum cached responses (0 disables caching)
+            ttl_seconds: Time before a cached response expires
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        
+        # key -> (expiry on the monotonic clock, response), oldest first
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached."""
+        return self.max_entries > 0
+    
+    @staticmethod
+    def make_key(provider: str, prompt: str, params: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a generation request.
+        
+        Args:
+            provider: Provider that will serve the request
+            prompt: Prompt text (surrounding whitespace is ignored)
+            params: Generation parameters (temperature, max_tokens, ...)
+            
+        Returns:
+            Hex digest identifying the request
+        """
+        hasher = hashlib.sha256()
+        hasher.update(str(provider).encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(repr(sorted(params.items())).encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(prompt.strip().encode("utf-8"))
+        return hasher.hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached response.
+        
+        Args:
+            key: Key from make_key
+            
+        Returns:
+            Cached response, or None on a miss or expired entry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, response = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+    
+    def put(self, key: str, response: str) -> None:
+        """
+        Cache a response, evicting the least recently used entry if full.
+        
+        Args:
+            key: Key from make_key
+            response: Generated text
+        """
+        if not self.enabled:
+            return
+        
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+    
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
@@ -2,7 +2,8 @@
 Prompt templates for DevMind LLM interactions.
 """
 
-from typing import List, Dict
+from string import Formatter
+from typing import Callable, List, Dict
 
 # System prompts
 SYSTEM_PROMPT_BASE = """You are DevMind, an intelligent code assistant with access to a semantic codebase search system.
@@ -195,9 +196,48 @@ Format as JSON:
 Citations:"""
 
 
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Pre-parse a format template into literal and field segments.
+    
+    The returned renderer joins the segments in one pass, which avoids
+    re-parsing the template and is much faster than str.format when a
+    field (e.g. the retrieved context) is large.
+    
+    Args:
+        template: str.format-style template with plain {name} fields
+        
+    Returns:
+        Function taking the fields as keyword arguments
+    """
+    segments = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported field in prompt template: {field_name}")
+        segments.append((literal, field_name))
+    
+    def render(**values) -> str:
+        parts = []
+        for literal, field_name in segments:
+            parts.append(literal)
+            if field_name is not None:
+                parts.append(str(values[field_name]))
+        return "".join(parts)
+    
+    return render
+
+
+_render_chat = _compile_template(CHAT_PROMPT_TEMPLATE)
+_render_code_explanation = _compile_template(CODE_EXPLANATION_PROMPT)
+_render_architecture = _compile_template(ARCHITECTURE_PROMPT)
+_render_debug = _compile_template(DEBUG_PROMPT)
+_render_reasoning = _compile_template(REASONING_CHAIN_PROMPT)
+_render_summary = _compile_template(SUMMARY_PROMPT)
+
+
 def build_chat_prompt(query: str, context: str) -> str:
     """Build chat prompt."""
-    return CHAT_PROMPT_TEMPLATE.format(query=query, context=context)
+    return _render_chat(query=query, context=context)
 
 
 def build_code_explanation_prompt(
@@ -207,7 +247,7 @@ def build_code_explanation_prompt(
     end_line: int
 ) -> str:
     """Build code explanation prompt."""
-    return CODE_EXPLANATION_PROMPT.format(
+    return _render_code_explanation(
         context=context,
         file_path=file_path,
         start_line=start_line,
@@ -217,19 +257,19 @@ def build_code_explanation_prompt(
 
 def build_architecture_prompt(query: str, context: str) -> str:
     """Build architecture analysis prompt."""
-    return ARCHITECTURE_PROMPT.format(query=query, context=context)
+    return _render_architecture(query=query, context=context)
 
 
 def build_debug_prompt(query: str, context: str) -> str:
     """Build debugging prompt."""
-    return DEBUG_PROMPT.format(query=query, context=context)
+    return _render_debug(query=query, context=context)
 
 
 def build_reasoning_prompt(query: str, context: str) -> str:
     """Build reasoning chain prompt."""
-    return REASONING_CHAIN_PROMPT.format(query=query, context=context)
+    return _render_reasoning(query=query, context=context)
 
 
 def build_summary_prompt(content: str) -> str:
     """Build summary prompt."""
-    return SUMMARY_PROMPT.format(content=content)
+    return _render_summary(content=content)
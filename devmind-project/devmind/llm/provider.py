@@ -6,9 +6,12 @@ Supports multiple LLM providers with automatic selection.
 from typing import Optional, List, Dict, Any, AsyncGenerator
 from enum import Enum
 from abc import ABC, abstractmethod
+import json
 import logging
 import os
 
+from devmind.llm.prompt_cache import PromptCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,11 +48,19 @@ class LLMProvider(ABC):
     ) -> AsyncGenerator[str, None]:
         """Stream completion tokens."""
         pass
+    
+    async def aclose(self) -> None:
+        """Release pooled connections (no-op for providers without any)."""
+        pass
 
 
 class OllamaProvider(LLMProvider):
     """Ollama provider for local Phi-3."""
     
+    # Connection pool size and idle keep-alive (seconds) for the shared session
+    MAX_CONNECTIONS = 32
+    KEEPALIVE_TIMEOUT = 60
+    
     def __init__(self, model: str = "phi3", base_url: str = "http://localhost:11434"):
         """
         Initialize Ollama provider.
@@ -60,8 +71,31 @@ class OllamaProvider(LLMProvider):
         """
         self.model = model
         self.base_url = base_url
+        
+        # Session is created on first use and reused so requests share
+        # pooled keep-alive connections instead of reconnecting each time
+        self._session = None
+        
         logger.info(f"OllamaProvider initialized (model={model})")
     
+    def _get_session(self):
+        """Get the shared aiohttp session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            import aiohttp
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.MAX_CONNECTIONS,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT
+                )
+            )
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the shared session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
     async def generate(
         self,
         prompt: str,
@@ -71,20 +105,19 @@ class OllamaProvider(LLMProvider):
     ) -> str:
         """Generate completion using Ollama API."""
         try:
-            import aiohttp
+            session = self._get_session()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "temperature": temperature,
-                        "stream": False
-                    }
-                ) as response:
-                    data = await response.json()
-                    return data.get("response", "")
+            async with session.post(
+                f"{self.base_url}/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "temperature": temperature,
+                    "stream": False
+                }
+            ) as response:
+                data = await response.json()
+                return data.get("response", "")
                     
         except Exception as e:
             logger.error(f"Ollama generation error: {e}")
@@ -99,25 +132,23 @@ class OllamaProvider(LLMProvider):
     ) -> AsyncGenerator[str, None]:
         """Stream completion tokens."""
         try:
-            import aiohttp
+            session = self._get_session()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "temperature": temperature,
-                        "stream": True
-                    }
-                ) as response:
-                    async for line in response.content:
-                        if line:
-                            import json
-                            data = json.loads(line)
-                            if "response" in data:
-                                yield data["response"]
-                                
+            async with session.post(
+                f"{self.base_url}/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "temperature": temperature,
+                    "stream": True
+                }
+            ) as response:
+                async for line in response.content:
+                    if line:
+                        data = json.loads(line)
+                        if "response" in data:
+                            yield data["response"]
+                            
         except Exception as e:
             logger.error(f"Ollama streaming error: {e}")
             raise
@@ -140,8 +171,25 @@ class ClaudeProvider(LLMProvider):
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not set")
         
+        # Client is created on first use and reused so its HTTP connection
+        # pool stays warm across requests
+        self._client = None
+        
         logger.info(f"ClaudeProvider initialized (model={model})")
     
+    def _get_client(self):
+        """Get the shared AsyncAnthropic client, creating it on first use."""
+        if self._client is None:
+            import anthropic
+            self._client = anthropic.AsyncAnthropic(api_key=self.api_key)
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared client and its pooled connections."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+    
     async def generate(
         self,
         prompt: str,
@@ -151,9 +199,7 @@ class ClaudeProvider(LLMProvider):
     ) -> str:
         """Generate completion using Claude API."""
         try:
-            import anthropic
-            
-            client = anthropic.AsyncAnthropic(api_key=self.api_key)
+            client = self._get_client()
             
             message = await client.messages.create(
                 model=self.model,
@@ -177,9 +223,7 @@ class ClaudeProvider(LLMProvider):
     ) -> AsyncGenerator[str, None]:
         """Stream completion tokens."""
         try:
-            import anthropic
-            
-            client = anthropic.AsyncAnthropic(api_key=self.api_key)
+            client = self._get_client()
             
             async with client.messages.stream(
                 model=self.model,
@@ -202,9 +246,16 @@ class LLMProviderManager:
     Selects provider based on context size and complexity.
     """
     
-    def __init__(self):
-        """Initialize provider manager."""
+    def __init__(self, response_cache: Optional[PromptCache] = None):
+        """
+        Initialize provider manager.
+        
+        Args:
+            response_cache: Optional cache for generate() responses; only
+                deterministic (temperature=0) requests are cached
+        """
         self.providers: Dict[ProviderType, LLMProvider] = {}
+        self.response_cache = response_cache
         logger.info("LLMProviderManager initialized")
     
     def register_provider(self, provider_type: ProviderType, provider: LLMProvider):
@@ -286,8 +337,27 @@ class LLMProviderManager:
         if not provider:
             raise ValueError(f"Provider {selected} not available")
         
+        # Repeated deterministic prompts are served from the cache without a
+        # provider call; sampled answers (temperature > 0, or the provider
+        # default) must stay fresh
+        cache_key = None
+        if (
+            self.response_cache is not None 
+            and self.response_cache.enabled 
+            and kwargs.get("temperature") == 0
+        ):
+            cache_key = PromptCache.make_key(selected.value, prompt, kwargs)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Serving cached response for {selected}")
+                return cached
+        
         logger.info(f"Generating with {selected}")
-        return await provider.generate(prompt, **kwargs)
+        response = await provider.generate(prompt, **kwargs)
+        
+        if cache_key is not None and response:
+            self.response_cache.put(cache_key, response)
+        return response
     
     async def stream(
         self,
@@ -321,6 +391,14 @@ class LLMProviderManager:
         logger.info(f"Streaming with {selected}")
         async for chunk in provider.stream(prompt, **kwargs):
             yield chunk
+    
+    async def aclose(self) -> None:
+        """Close pooled connections held by all registered providers."""
+        for provider_type, provider in self.providers.items():
+            try:
+                await provider.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing provider {provider_type}: {e}")
 
 
 # Singleton manager
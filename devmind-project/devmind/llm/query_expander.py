@@ -9,6 +9,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Question words and articles dropped by rewrite_for_code_search
+_STOPWORD_RE = re.compile(
+    r'\b(how|what|where|when|why|show|find|get|can|i|you|a|an|the)\b',
+    re.IGNORECASE
+)
+
 
 class QueryExpander:
     """
@@ -47,6 +53,16 @@ class QueryExpander:
     
     def __init__(self):
         """Initialize query expander."""
+        # One regex scan finds every expansion term in a query. The lookahead
+        # reports overlapping matches; at each position the longest term
+        # wins, and _term_prefixes adds the shorter terms it starts with.
+        terms = sorted(self.CODE_TERM_EXPANSIONS, key=len, reverse=True)
+        self._term_re = re.compile("(?=(" + "|".join(map(re.escape, terms)) + "))")
+        self._term_prefixes = {
+            term: [other for other in terms if term.startswith(other)]
+            for term in terms
+        }
+        
         logger.info("QueryExpander initialized")
     
     def expand(self, query: str, max_variants: int = 3) -> List[str]:
@@ -67,9 +83,14 @@ class QueryExpander:
         # Lowercase for matching
         query_lower = query.lower()
         
+        # Find all code terms in one pass over the query
+        matched = set()
+        for match in self._term_re.finditer(query_lower):
+            matched.update(self._term_prefixes[match.group(1)])
+        
         # Check for code terms
         for term, expansions in self.CODE_TERM_EXPANSIONS.items():
-            if term in query_lower:
+            if term in matched:
                 # Generate variants with expansions
                 for expansion in expansions[:max_variants - 1]:
                     variant = query_lower.replace(term, expansion)
@@ -157,11 +178,8 @@ class QueryExpander:
         Returns:
             Code-optimized query
         """
-        # Remove common question words
-        query = re.sub(r'\b(how|what|where|when|why|show|find|get|can|i|you)\b', '', query, flags=re.IGNORECASE)
-        
-        # Remove articles
-        query = re.sub(r'\b(a|an|the)\b', '', query, flags=re.IGNORECASE)
+        # Remove common question words and articles
+        query = _STOPWORD_RE.sub('', query)
         
         # Clean up extra spaces
         query = ' '.join(query.split())
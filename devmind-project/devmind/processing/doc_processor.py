@@ -5,7 +5,7 @@ Parse documents (MD, PDF, HTML) into sections.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 import logging
 
@@ -300,10 +300,14 @@ class DocumentProcessorFactory:
     
     _processors: List[DocumentProcessor] = []
     
+    # Resolved processor (or None) per lowercase file suffix
+    _by_suffix: Dict[str, Optional[DocumentProcessor]] = {}
+    
     @classmethod
     def register(cls, processor: DocumentProcessor):
         """Register a document processor."""
         cls._processors.append(processor)
+        cls._by_suffix.clear()
         logger.info(f"Registered document processor: {processor.file_extension}")
     
     @classmethod
@@ -317,10 +321,20 @@ class DocumentProcessorFactory:
         Returns:
             Processor instance or None
         """
+        # Processors match on file suffix, so resolve each suffix only once
+        suffix = file_info.path.suffix.lower()
+        try:
+            return cls._by_suffix[suffix]
+        except KeyError:
+            pass
+        
+        match = None
         for processor in cls._processors:
             if processor.can_process(file_info):
-                return processor
-        return None
+                match = processor
+                break
+        cls._by_suffix[suffix] = match
+        return match
     
     @classmethod
     def initialize_defaults(cls):
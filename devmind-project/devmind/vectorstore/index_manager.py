@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import json
 import logging
+import numpy as np
 from .faiss_client import FAISSClient
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,10 @@ class IndexManager:
         
         # Load metadata if exists
         self._load_metadata()
+        
+        # Chunk IDs already stored per index, used to skip re-ingested chunks
+        self._chunk_ids: Dict[str, set] = {}
+        self._rebuild_chunk_ids()
     
     def _init_indices(self) -> None:
         """Initialize FAISS indices for each content type."""
@@ -64,6 +69,9 @@ class IndexManager:
         """
         Add embeddings and metadata to specified index.
         
+        Entries whose metadata carries a ``chunk_id`` already present in the
+        index (or earlier in the same batch) are skipped.
+        
         Args:
             index_name: Name of index (code, docs, notes)
             embeddings: Array of embeddings to add
@@ -81,11 +89,35 @@ class IndexManager:
                 f"metadata count ({len(metadata)})"
             )
         
+        # Drop chunks that are already indexed (or repeated in this batch)
+        indexed = self._chunk_ids[index_name]
+        new_ids = set()
+        keep = []
+        for i, meta in enumerate(metadata):
+            chunk_id = meta.get("chunk_id")
+            if chunk_id is None:
+                keep.append(i)
+            elif chunk_id not in indexed and chunk_id not in new_ids:
+                new_ids.add(chunk_id)
+                keep.append(i)
+        
+        if len(keep) < len(metadata):
+            logger.info(
+                f"Skipping {len(metadata) - len(keep)} already indexed chunks "
+                f"in '{index_name}'"
+            )
+            if not keep:
+                return
+            embeddings = np.asarray(embeddings)[keep]
+            metadata = [metadata[i] for i in keep]
+        
         # Add to FAISS index
         self.indices[index_name].add(embeddings)
         
-        # Add metadata
+        # Add metadata; IDs count as indexed only once the add succeeded,
+        # so a failed batch can be retried
         self.metadata[index_name].extend(metadata)
+        indexed.update(new_ids)
         
         logger.info(
             f"Added {len(embeddings)} vectors to '{index_name}' index "
@@ -201,6 +233,13 @@ class IndexManager:
         else:
             logger.debug("No existing metadata found")
     
+    def _rebuild_chunk_ids(self) -> None:
+        """Rebuild the per-index chunk ID sets from metadata."""
+        self._chunk_ids = {
+            name: {m["chunk_id"] for m in self.metadata.get(name, []) if "chunk_id" in m}
+            for name in self.indices.keys()
+        }
+    
     def get_stats(self) -> Dict[str, int]:
         """
         Get statistics for all indices.
@@ -225,6 +264,7 @@ class IndexManager:
         
         self.indices[index_name].reset()
         self.metadata[index_name] = []
+        self._chunk_ids[index_name] = set()
         
         logger.info(f"Cleared '{index_name}' index")
     
@@ -5,7 +5,7 @@ Provides dependency injection for workspace access control.
 """
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
 from devmind.workspaces.service import WorkspaceService
@@ -14,7 +14,7 @@ from devmind.auth.dependencies import get_current_user
 from devmind.core.database import get_db
 
 
-async def get_workspace_service(db: Session = Depends(get_db)) -> WorkspaceService:
+async def get_workspace_service(db: AsyncSession = Depends(get_db)) -> WorkspaceService:
     """
     Get workspace service dependency.
     
@@ -46,7 +46,7 @@ async def verify_workspace_access(
     Raises:
         HTTPException: If access denied
     """
-    if not workspace_service.can_access_workspace(current_user.id, workspace_id):
+    if not await workspace_service.can_access_workspace(current_user.id, workspace_id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have access to this workspace"
@@ -74,7 +74,7 @@ async def verify_workspace_management(
     Raises:
         HTTPException: If permission denied
     """
-    if not workspace_service.can_manage_workspace(current_user.id, workspace_id):
+    if not await workspace_service.can_manage_workspace(current_user.id, workspace_id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to manage this workspace"
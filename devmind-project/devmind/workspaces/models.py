@@ -44,7 +44,7 @@ class Workspace(Base):
     
     # Relationships
     owner = relationship("User", foreign_keys=[owner_id])
-    members = relationship("WorkspaceMember", back_populates="workspace", cascade="all, delete-orphan")
+    members = relationship("WorkspaceMember", back_populates="workspace", cascade="all, delete-orphan", lazy="selectin")
     
     def __repr__(self):
         return f"<Workspace {self.name} ({self.slug})>"
@@ -75,7 +75,7 @@ class WorkspaceMember(Base):
     
     # Relationships
     workspace = relationship("Workspace", back_populates="members")
-    user = relationship("User")
+    user = relationship("User", lazy="selectin")
     
     # Constraints
     __table_args__ = (
@@ -5,7 +5,8 @@ Business logic for workspace management and permissions.
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 import uuid
 import logging
@@ -42,11 +43,11 @@ class WorkspaceService:
     Workspace service for managing multi-tenant workspaces.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize workspace service."""
         self.db = db
     
-    def create_workspace(self, user_id: uuid.UUID, request: WorkspaceCreateRequest) -> Workspace:
+    async def create_workspace(self, user_id: uuid.UUID, request: WorkspaceCreateRequest) -> Workspace:
         """
         Create a new workspace.
         
@@ -70,7 +71,7 @@ class WorkspaceService:
         
         try:
             self.db.add(workspace)
-            self.db.flush()  # Get workspace ID
+            await self.db.flush()  # Get workspace ID
             
             # Add owner as member
             member = WorkspaceMember(
@@ -80,16 +81,16 @@ class WorkspaceService:
             )
             self.db.add(member)
             
-            self.db.commit()
-            self.db.refresh(workspace)
+            await self.db.commit()
+            await self.db.refresh(workspace)
             
             logger.info(f"Workspace created: {workspace.slug} by user {user_id}")
             return workspace
         except IntegrityError:
-            self.db.rollback()
+            await self.db.rollback()
             raise WorkspaceSlugExistsError(f"Workspace slug '{request.slug}' already exists")
     
-    def get_user_workspaces(self, user_id: uuid.UUID) -> List[Workspace]:
+    async def get_user_workspaces(self, user_id: uuid.UUID) -> List[Workspace]:
         """
         Get all workspaces where user is a member.
         
@@ -99,11 +100,12 @@ class WorkspaceService:
         Returns:
             List of workspaces
         """
-        return self.db.query(Workspace).join(WorkspaceMember).filter(
-            WorkspaceMember.user_id == user_id
-        ).all()
+        result = await self.db.execute(
+            select(Workspace).join(WorkspaceMember).where(WorkspaceMember.user_id == user_id)
+        )
+        return list(result.scalars().all())
     
-    def get_workspace(self, workspace_id: uuid.UUID) -> Optional[Workspace]:
+    async def get_workspace(self, workspace_id: uuid.UUID) -> Optional[Workspace]:
         """
         Get workspace by ID.
         
@@ -113,9 +115,10 @@ class WorkspaceService:
         Returns:
             Workspace or None
         """
-        return self.db.query(Workspace).filter(Workspace.id == workspace_id).first()
+        result = await self.db.execute(select(Workspace).where(Workspace.id == workspace_id))
+        return result.scalars().first()
     
-    def update_workspace(
+    async def update_workspace(
         self,
         workspace_id: uuid.UUID,
         user_id: uuid.UUID,
@@ -136,12 +139,12 @@ class WorkspaceService:
             WorkspaceNotFoundError: If workspace not found
             PermissionDeniedError: If user doesn't have permission
         """
-        workspace = self.get_workspace(workspace_id)
+        workspace = await self.get_workspace(workspace_id)
         if not workspace:
             raise WorkspaceNotFoundError("Workspace not found")
         
         # Check permission
-        if not self.can_manage_workspace(user_id, workspace_id):
+        if not await self.can_manage_workspace(user_id, workspace_id):
             raise PermissionDeniedError("You don't have permission to update this workspace")
         
         # Update fields
@@ -150,12 +153,12 @@ class WorkspaceService:
         if request.description is not None:
             workspace.description = request.description
         
-        self.db.commit()
-        self.db.refresh(workspace)
+        await self.db.commit()
+        await self.db.refresh(workspace)
         
         return workspace
     
-    def delete_workspace(self, workspace_id: uuid.UUID, user_id: uuid.UUID) -> None:
+    async def delete_workspace(self, workspace_id: uuid.UUID, user_id: uuid.UUID) -> None:
         """
         Delete workspace.
         
@@ -167,7 +170,7 @@ class WorkspaceService:
             WorkspaceNotFoundError: If workspace not found
             PermissionDeniedError: If user doesn't have permission
         """
-        workspace = self.get_workspace(workspace_id)
+        workspace = await self.get_workspace(workspace_id)
         if not workspace:
             raise WorkspaceNotFoundError("Workspace not found")
         
@@ -175,12 +178,12 @@ class WorkspaceService:
         if workspace.owner_id != user_id:
             raise PermissionDeniedError("Only the owner can delete this workspace")
         
-        self.db.delete(workspace)
-        self.db.commit()
+        await self.db.delete(workspace)
+        await self.db.commit()
         
         logger.info(f"Workspace deleted: {workspace.slug}")
     
-    def add_member(
+    async def add_member(
         self,
         workspace_id: uuid.UUID,
         user_id: uuid.UUID,
@@ -203,12 +206,12 @@ class WorkspaceService:
             WorkspaceNotFoundError: If workspace not found
             PermissionDeniedError: If user doesn't have permission
         """
-        workspace = self.get_workspace(workspace_id)
+        workspace = await self.get_workspace(workspace_id)
         if not workspace:
             raise WorkspaceNotFoundError("Workspace not found")
         
         # Check permission
-        member = self.get_member(workspace_id, user_id)
+        member = await self.get_member(workspace_id, user_id)
         if not member or not member.can_manage_members:
             raise PermissionDeniedError("You don't have permission to add members")
         
@@ -221,16 +224,16 @@ class WorkspaceService:
         
         try:
             self.db.add(new_member)
-            self.db.commit()
-            self.db.refresh(new_member)
+            await self.db.commit()
+            await self.db.refresh(new_member)
             
             logger.info(f"Member added to workspace {workspace_id}: {new_user_id}")
             return new_member
         except IntegrityError:
-            self.db.rollback()
+            await self.db.rollback()
             raise WorkspaceServiceError("User is already a member of this workspace")
     
-    def remove_member(
+    async def remove_member(
         self,
         workspace_id: uuid.UUID,
         user_id: uuid.UUID,
@@ -248,23 +251,23 @@ class WorkspaceService:
             PermissionDeniedError: If user doesn't have permission
         """
         # Check permission
-        acting_member = self.get_member(workspace_id, user_id)
+        acting_member = await self.get_member(workspace_id, user_id)
         if not acting_member or not acting_member.can_manage_members:
             raise PermissionDeniedError("You don't have permission to remove members")
         
         # Cannot remove owner
-        workspace = self.get_workspace(workspace_id)
+        workspace = await self.get_workspace(workspace_id)
         if workspace and workspace.owner_id == member_user_id:
             raise PermissionDeniedError("Cannot remove workspace owner")
         
         # Remove member
-        member = self.get_member(workspace_id, member_user_id)
+        member = await self.get_member(workspace_id, member_user_id)
         if member:
-            self.db.delete(member)
-            self.db.commit()
+            await self.db.delete(member)
+            await self.db.commit()
             logger.info(f"Member removed from workspace {workspace_id}: {member_user_id}")
     
-    def get_member(self, workspace_id: uuid.UUID, user_id: uuid.UUID) -> Optional[WorkspaceMember]:
+    async def get_member(self, workspace_id: uuid.UUID, user_id: uuid.UUID) -> Optional[WorkspaceMember]:
         """
         Get workspace member.
         
@@ -275,12 +278,15 @@ class WorkspaceService:
         Returns:
             Workspace member or None
         """
-        return self.db.query(WorkspaceMember).filter(
-            WorkspaceMember.workspace_id == workspace_id,
-            WorkspaceMember.user_id == user_id
-        ).first()
+        result = await self.db.execute(
+            select(WorkspaceMember).where(
+                WorkspaceMember.workspace_id == workspace_id,
+                WorkspaceMember.user_id == user_id
+            )
+        )
+        return result.scalars().first()
     
-    def can_access_workspace(self, user_id: uuid.UUID, workspace_id: uuid.UUID) -> bool:
+    async def can_access_workspace(self, user_id: uuid.UUID, workspace_id: uuid.UUID) -> bool:
         """
         Check if user has access to workspace.
         
@@ -291,9 +297,9 @@ class WorkspaceService:
         Returns:
             True if user has access
         """
-        return self.get_member(workspace_id, user_id) is not None
+        return await self.get_member(workspace_id, user_id) is not None
     
-    def can_manage_workspace(self, user_id: uuid.UUID, workspace_id: uuid.UUID) -> bool:
+    async def can_manage_workspace(self, user_id: uuid.UUID, workspace_id: uuid.UUID) -> bool:
         """
         Check if user can manage workspace settings.
         
@@ -304,5 +310,5 @@ class WorkspaceService:
         Returns:
             True if user can manage
         """
-        member = self.get_member(workspace_id, user_id)
+        member = await self.get_member(workspace_id, user_id)
         return member is not None and member.role in (WorkspaceRole.OWNER, WorkspaceRole.ADMIN)
@@ -0,0 +1,115 @@
+"""
+Unit tests for DevMind AnswerBuilder context assembly.
+"""
+
+import pytest
+import re
+from devmind.llm.answer_builder import AnswerBuilder
+from devmind.retrieval import RetrievalResult
+
+
+def make_result(file_path: str, content: str, start_line: int = 1, score: float = 0.5) -> RetrievalResult:
+    """Create a retrieval result spanning content's lines."""
+    return RetrievalResult(
+        score=score,
+        content=content,
+        file_path=file_path,
+        start_line=start_line,
+        end_line=start_line + content.count("\n"),
+        section_type="function",
+        language="python",
+        chunk_id=f"{file_path}:{start_line}",
+        index_name="code"
+    )
+
+
+def make_lines(count: int, prefix: str = "value") -> str:
+    """Create count lines of Python assignments."""
+    return "\n".join(f"{prefix}_{i} = {i}" for i in range(count))
+
+
+class TestAnswerBuilder:
+    """Tests for context packing and truncation."""
+    
+    @pytest.fixture
+    def builder(self):
+        """Create a builder with a small token budget."""
+        return AnswerBuilder(max_context_tokens=600)
+    
+    def test_truncate_single_long_line_to_nothing(self, builder):
+        """Test a line longer than the budget can't be cut to whole lines."""
+        assert builder._truncate_to_tokens("x" * 4000, 50) == ""
+    
+    def test_truncate_keeps_whole_lines(self, builder):
+        """Test truncation returns a prefix of whole lines within budget."""
+        text = make_lines(200)
+        truncated = builder._truncate_to_tokens(text, 40)
+        
+        assert truncated
+        assert text.startswith(truncated + "\n")
+        assert builder._count_tokens(truncated) <= 40
+    
+    def test_truncate_returns_text_within_budget(self, builder):
+        """Test text that already fits is returned unchanged."""
+        assert builder._truncate_to_tokens("a = 1\nb = 2", 100) == "a = 1\nb = 2"
+    
+    def test_overflow_block_is_truncated_with_end_line(self, builder):
+        """Test the first block that doesn't fit fills the rest of the budget."""
+        results = [
+            make_result("small.py", "a = 1", score=0.9),
+            make_result("big.py", make_lines(400), start_line=100, score=0.8),
+        ]
+        
+        assembled = builder.assemble_context(results)
+        
+        assert [b.file_path for b in assembled.context_blocks] == ["small.py", "big.py"]
+        partial = assembled.context_blocks[-1]
+        assert partial.start_line == 100
+        assert partial.end_line == 100 + partial.content.count("\n")
+        assert partial.end_line < results[1].end_line
+        assert assembled.total_tokens <= builder.max_context_tokens
+    
+    def test_single_line_overflow_block_is_dropped(self, builder):
+        """Test an overflowing block that truncates to nothing is left out."""
+        results = [
+            make_result("small.py", "a = 1", score=0.9),
+            make_result("minified.js", "x" * 8000, score=0.8),
+        ]
+        
+        assembled = builder.assemble_context(results)
+        
+        assert [b.file_path for b in assembled.context_blocks] == ["small.py"]
+        assert "minified.js" not in assembled.formatted_context
+    
+    def test_packing_skips_oversized_blocks_and_stays_in_budget(self, builder):
+        """Test smaller lower-ranked blocks are packed after one that doesn't fit."""
+        results = [
+            make_result("first.py", make_lines(5, "first"), score=0.9),
+            make_result("huge.py", make_lines(400, "huge"), score=0.8),
+            make_result("second.py", make_lines(5, "second"), score=0.7),
+            make_result("third.py", make_lines(5, "third"), score=0.6),
+        ]
+        
+        assembled = builder.assemble_context(results)
+        paths = [b.file_path for b in assembled.context_blocks]
+        
+        assert paths[:3] == ["first.py", "second.py", "third.py"]
+        assert paths.count("huge.py") <= 1
+        assert assembled.total_tokens <= builder.max_context_tokens
+        assert assembled.sources_count == len(assembled.context_blocks)
+    
+    def test_source_numbers_match_citations(self, builder):
+        """Test [Source N] headers line up with build_citations ids."""
+        results = [
+            make_result("first.py", make_lines(5, "first"), score=0.9),
+            make_result("huge.py", make_lines(400, "huge"), score=0.8),
+            make_result("second.py", make_lines(5, "second"), score=0.7),
+        ]
+        
+        assembled = builder.assemble_context(results)
+        citations = builder.build_citations(assembled.context_blocks)
+        headers = re.findall(r"\[Source (\d+)\]\nFile: (\S+)", assembled.formatted_context)
+        
+        assert [(int(n), path) for n, path in headers] == [
+            (c["id"], c["file_path"]) for c in citations
+        ]
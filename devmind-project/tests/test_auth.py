@@ -7,6 +7,7 @@ Covers registration, login, token management, RBAC, and security features.
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker
 import uuid
 
@@ -22,14 +23,15 @@ TEST_DATABASE_URL = "sqlite:///./test_auth.db"
 engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for the get_db override (same database file)
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_auth.db")
+AsyncTestingSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
 
-def override_get_db():
+
+async def override_get_db():
     """Override database for testing."""
-    try:
-        db = TestingSessionLocal()
+    async with AsyncTestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 @pytest.fixture(scope="function")
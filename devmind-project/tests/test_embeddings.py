@@ -4,6 +4,7 @@ Unit tests for DevMind Embedding Service.
 
 import pytest
 import numpy as np
+import torch
 from devmind.embeddings.model_manager import ModelManager, get_model_manager
 from devmind.embeddings.encoder import Encoder
 from devmind.embeddings.batch_processor import BatchProcessor
@@ -99,6 +100,17 @@ class TestEncoder:
         # Second vector should be zeros
         assert np.all(vectors[1] == 0)
     
+    def test_encode_batch_int8(self, encoder):
+        """Test int8 output is quantized from the normalized vectors."""
+        texts = ["Valid text", "", "Another text"]
+        vectors = encoder.encode_batch(texts, output_dtype="int8")
+        reference = encoder.encode_batch(texts)
+        
+        assert vectors.dtype == np.int8
+        assert vectors.shape == (3, 384)
+        assert np.all(vectors[1] == 0)
+        assert np.abs(vectors / 127.0 - reference).max() <= 1 / 127.0
+    
     def test_get_embedding_dim(self, encoder):
         """Test getting embedding dimension."""
         dim = encoder.get_embedding_dim()
@@ -113,6 +125,31 @@ class TestEncoder:
         assert "device" in info
 
 
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA graphs need a GPU")
+class TestEncoderCUDAGraphs:
+    """Tests for Encoder with CUDA-graph-wrapped models."""
+    
+    @pytest.fixture
+    def encoder(self):
+        """Create an encoder whose transformer replays CUDA graphs."""
+        manager = ModelManager(device="cuda", cuda_graphs=True)
+        return Encoder(model_type="mvp", model_manager=manager)
+    
+    def test_single_then_batch_on_same_bucket(self, encoder):
+        """Test a batch encode reuses graph buffers captured by a single encode."""
+        single = encoder.encode("short query")
+        batch = encoder.encode_batch(["short query"])
+        
+        assert np.allclose(single, batch[0], atol=1e-2)
+    
+    def test_batch_then_single_on_same_bucket(self, encoder):
+        """Test a single encode reuses graph buffers captured by a batch encode."""
+        batch = encoder.encode_batch(["another short query"])
+        single = encoder.encode("another short query")
+        
+        assert np.allclose(single, batch[0], atol=1e-2)
+
+
 class TestBatchProcessor:
     """Tests for BatchProcessor."""
     
@@ -0,0 +1,102 @@
+"""
+Unit tests for DevMind FileScanner hash cache.
+"""
+
+import pytest
+import json
+import os
+import time
+import tempfile
+import shutil
+from pathlib import Path
+from devmind.ingestion.file_scanner import FileScanner
+
+
+def write_file(path: Path, content: str, age_s: float = 0.0) -> Path:
+    """Write a file and backdate its mtime by age_s seconds."""
+    path.write_text(content)
+    if age_s:
+        mtime_ns = time.time_ns() - int(age_s * 1e9)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+class TestHashCache:
+    """Tests for the (size, mtime_ns, hash) sidecar."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        temp = tempfile.mkdtemp()
+        yield Path(temp)
+        shutil.rmtree(temp)
+    
+    @pytest.fixture
+    def source_dir(self, temp_dir):
+        """Create source directory with one old file."""
+        source = temp_dir / "src"
+        source.mkdir()
+        write_file(source / "a.py", "print('a')\n", age_s=60)
+        return source
+    
+    def make_scanner(self, temp_dir: Path, counter: list) -> FileScanner:
+        """Create a serial scanner that records every file it hashes."""
+        scanner = FileScanner(
+            max_workers=1,
+            hash_algo="sha256",
+            hash_cache_path=temp_dir / "hashes.json"
+        )
+        calculate = scanner.calculate_hash
+        
+        def counting_hash(path, size=None):
+            counter.append(Path(path).name)
+            return calculate(path, size)
+        
+        scanner.calculate_hash = counting_hash
+        return scanner
+    
+    def test_unchanged_files_reuse_cached_hash(self, temp_dir, source_dir):
+        """Test files with matching size and mtime are not re-hashed."""
+        hashed = []
+        first = self.make_scanner(temp_dir, hashed).scan(source_dir)
+        assert hashed == ["a.py"]
+        
+        hashed.clear()
+        second = self.make_scanner(temp_dir, hashed).scan(source_dir)
+        assert hashed == []
+        assert second[0].hash == first[0].hash
+    
+    def test_changed_mtime_rehashes(self, temp_dir, source_dir):
+        """Test a file whose mtime changed is hashed again."""
+        hashed = []
+        self.make_scanner(temp_dir, hashed).scan(source_dir)
+        
+        write_file(source_dir / "a.py", "print('b')\n", age_s=30)
+        hashed.clear()
+        files = self.make_scanner(temp_dir, hashed).scan(source_dir)
+        
+        assert hashed == ["a.py"]
+        assert files[0].hash == FileScanner(hash_algo="sha256").calculate_hash(source_dir / "a.py")
+    
+    def test_recently_modified_files_are_not_cached(self, temp_dir, source_dir):
+        """Test files inside the racy-mtime window are always re-hashed."""
+        write_file(source_dir / "fresh.py", "print('fresh')\n")
+        
+        hashed = []
+        self.make_scanner(temp_dir, hashed).scan(source_dir)
+        hashed.clear()
+        self.make_scanner(temp_dir, hashed).scan(source_dir)
+        
+        assert hashed == ["fresh.py"]
+    
+    def test_deleted_files_are_pruned(self, temp_dir, source_dir):
+        """Test sidecar entries for files no longer scanned are dropped."""
+        write_file(source_dir / "b.py", "print('b')\n", age_s=60)
+        self.make_scanner(temp_dir, []).scan(source_dir)
+        
+        (source_dir / "b.py").unlink()
+        self.make_scanner(temp_dir, []).scan(source_dir)
+        
+        with open(temp_dir / "hashes.json") as f:
+            cached = json.load(f)["files"]
+        assert sorted(Path(p).name for p in cached) == ["a.py"]
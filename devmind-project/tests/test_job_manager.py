@@ -0,0 +1,135 @@
+"""
+Unit tests for DevMind JobManager persistence.
+"""
+
+import pytest
+import threading
+import tempfile
+import shutil
+from pathlib import Path
+from devmind.ingestion.job_manager import JobManager, JobProgress, JobStatus
+from devmind.ingestion.pipeline import PipelineConfig, PipelineResult
+
+
+def make_result(chunks: int = 3) -> PipelineResult:
+    """Create a pipeline result with the given chunk count."""
+    return PipelineResult(
+        total_files_scanned=1,
+        total_files_processed=1,
+        total_sections_extracted=chunks,
+        total_chunks_generated=chunks,
+        chunks=[],
+        errors=[]
+    )
+
+
+class TestJobManager:
+    """Tests for JobManager eviction and background writes."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        temp = tempfile.mkdtemp()
+        yield Path(temp)
+        shutil.rmtree(temp)
+    
+    @pytest.fixture
+    def manager(self, temp_dir):
+        """Create a JobManager that keeps only two jobs in memory."""
+        manager = JobManager(temp_dir)
+        manager.MAX_HOT_JOBS = 2
+        yield manager
+        manager.close()
+    
+    def run_job(self, manager, job_id: str, chunks: int = 3) -> None:
+        """Create, start and complete a job."""
+        manager.create_job(PipelineConfig(source_path=Path(".")), job_id=job_id)
+        manager.start_job(job_id)
+        manager.complete_job(job_id, make_result(chunks))
+    
+    def test_evicted_job_reloads_from_disk(self, manager):
+        """Test finished jobs beyond MAX_HOT_JOBS are evicted and reloaded."""
+        for i in range(3):
+            self.run_job(manager, f"job{i}", chunks=i + 1)
+        
+        assert "job0" not in manager.jobs
+        assert len(manager.jobs) == 2
+        
+        job = manager.get_job("job0")
+        assert job is not None
+        assert job.status == JobStatus.COMPLETED
+        assert job.result.total_chunks_generated == 1
+        assert "job0" in manager.jobs
+        
+        stats = manager.get_stats()
+        assert stats["total_jobs"] == 3
+        assert stats["by_status"] == {"completed": 3}
+        assert stats["total_chunks"] == 6
+    
+    def test_active_jobs_are_not_evicted(self, manager):
+        """Test running jobs stay in memory past MAX_HOT_JOBS."""
+        config = PipelineConfig(source_path=Path("."))
+        for i in range(3):
+            manager.create_job(config, job_id=f"job{i}")
+            manager.start_job(f"job{i}")
+        
+        assert len(manager.jobs) == 3
+    
+    def test_reload_waits_for_in_flight_write(self, manager):
+        """Test a job evicted while its final state is being written reloads that state."""
+        write_started = threading.Event()
+        release = threading.Event()
+        write = manager._write_job_file
+        
+        def slow_write(job_id, job_data):
+            if job_id == "job0" and job_data["status"] == JobStatus.COMPLETED:
+                write_started.set()
+                release.wait(5)
+            write(job_id, job_data)
+        
+        manager._write_job_file = slow_write
+        self.run_job(manager, "job0")
+        assert write_started.wait(5)
+        
+        # Evict job0 while its completed state is still being written
+        self.run_job(manager, "job1")
+        self.run_job(manager, "job2")
+        assert "job0" not in manager.jobs
+        assert "job0" in manager._pending
+        
+        threading.Timer(0.1, release.set).start()
+        job = manager.get_job("job0")
+        
+        assert job.status == JobStatus.COMPLETED
+        assert job.result.total_chunks_generated == 3
+        assert manager.get_stats()["by_status"] == {"completed": 3}
+    
+    def test_saves_coalesce_into_latest_snapshot(self, manager, temp_dir):
+        """Test bursts of saves are written as few files holding the latest state."""
+        release = threading.Event()
+        written = []
+        write = manager._write_job_file
+        
+        def blocking_write(job_id, job_data):
+            release.wait(5)
+            written.append(job_data["progress"]["files_processed"])
+            write(job_id, job_data)
+        
+        manager._write_job_file = blocking_write
+        manager.create_job(PipelineConfig(source_path=Path(".")), job_id="job0")
+        manager.start_job("job0")
+        for i in range(1, 51):
+            manager.update_progress("job0", JobProgress(files_processed=i))
+        
+        release.set()
+        manager.flush()
+        
+        assert len(written) < 50
+        assert written[-1] == 50
+        assert "job0" not in manager._pending
+        
+        reloaded = JobManager(temp_dir)
+        try:
+            assert reloaded.get_job("job0").progress.files_processed == 50
+        finally:
+            reloaded.close()
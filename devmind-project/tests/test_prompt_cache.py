@@ -0,0 +1,149 @@
+"""
+Unit tests for DevMind LLM response caching.
+"""
+
+import pytest
+from devmind.llm import prompt_cache
+from devmind.llm.prompt_cache import PromptCache
+from devmind.llm.provider import LLMProvider, LLMProviderManager, ProviderType
+
+
+class FakeClock:
+    """Monotonic clock the test advances by hand."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingProvider(LLMProvider):
+    """Provider that returns a fixed response and counts calls."""
+    
+    def __init__(self, response: str = "answer"):
+        self.response = response
+        self.calls = 0
+    
+    async def generate(self, prompt, temperature=0.7, max_tokens=2000, **kwargs):
+        self.calls += 1
+        return self.response
+    
+    async def stream(self, prompt, temperature=0.7, max_tokens=2000, **kwargs):
+        yield self.response
+
+
+class TestPromptCache:
+    """Tests for PromptCache."""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the cache's monotonic clock."""
+        clock = FakeClock()
+        monkeypatch.setattr(prompt_cache.time, "monotonic", clock)
+        return clock
+    
+    def test_get_returns_cached_response(self):
+        """Test a stored response is returned and counted as a hit."""
+        cache = PromptCache()
+        cache.put("k", "v")
+        
+        assert cache.get("k") == "v"
+        assert cache.get("missing") is None
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+    
+    def test_entries_expire_after_ttl(self, clock):
+        """Test entries are dropped once ttl_seconds have passed."""
+        cache = PromptCache(ttl_seconds=10)
+        cache.put("k", "v")
+        
+        clock.now += 9.9
+        assert cache.get("k") == "v"
+        
+        clock.now += 0.1
+        assert cache.get("k") is None
+        assert cache.get_stats()["entries"] == 0
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the entry read least recently is evicted when full."""
+        cache = PromptCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+    
+    def test_zero_entries_disables_cache(self):
+        """Test max_entries=0 stores nothing."""
+        cache = PromptCache(max_entries=0)
+        cache.put("k", "v")
+        
+        assert not cache.enabled
+        assert cache.get("k") is None
+    
+    def test_make_key_is_stable(self):
+        """Test keys ignore param order and surrounding whitespace only."""
+        key = PromptCache.make_key("local", "prompt", {"temperature": 0, "max_tokens": 10})
+        
+        assert key == PromptCache.make_key("local", " prompt\n", {"max_tokens": 10, "temperature": 0})
+        assert key != PromptCache.make_key("sonnet", "prompt", {"temperature": 0, "max_tokens": 10})
+        assert key != PromptCache.make_key("local", "prompt", {"temperature": 0, "max_tokens": 20})
+        assert key != PromptCache.make_key("local", "other prompt", {"temperature": 0, "max_tokens": 10})
+
+
+class TestManagerResponseCache:
+    """Tests for LLMProviderManager's use of the response cache."""
+    
+    def make_manager(self, response: str = "answer"):
+        """Create a manager with one counting provider and a cache."""
+        manager = LLMProviderManager(response_cache=PromptCache())
+        provider = CountingProvider(response)
+        manager.register_provider(ProviderType.LOCAL, provider)
+        return manager, provider
+    
+    @pytest.mark.asyncio
+    async def test_cache_is_off_by_default(self):
+        """Test managers don't cache unless given a cache."""
+        manager = LLMProviderManager()
+        provider = CountingProvider()
+        manager.register_provider(ProviderType.LOCAL, provider)
+        
+        await manager.generate("q", temperature=0)
+        await manager.generate("q", temperature=0)
+        
+        assert provider.calls == 2
+    
+    @pytest.mark.asyncio
+    async def test_deterministic_requests_are_cached(self):
+        """Test temperature=0 requests are served from the cache."""
+        manager, provider = self.make_manager()
+        
+        assert await manager.generate("q", temperature=0) == "answer"
+        assert await manager.generate("q", temperature=0) == "answer"
+        
+        assert provider.calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_sampled_requests_are_not_cached(self):
+        """Test temperature > 0 (or the provider default) always calls the provider."""
+        manager, provider = self.make_manager()
+        
+        await manager.generate("q", temperature=0.7)
+        await manager.generate("q", temperature=0.7)
+        await manager.generate("q")
+        
+        assert provider.calls == 3
+    
+    @pytest.mark.asyncio
+    async def test_empty_responses_are_not_cached(self):
+        """Test empty responses are retried instead of replayed."""
+        manager, provider = self.make_manager(response="")
+        
+        await manager.generate("q", temperature=0)
+        await manager.generate("q", temperature=0)
+        
+        assert provider.calls == 2
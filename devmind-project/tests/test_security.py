@@ -7,6 +7,7 @@ Tests authentication, authorization, workspace isolation, and security hardening
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker
 import uuid
 
@@ -21,14 +22,15 @@ TEST_DATABASE_URL = "sqlite:///./test_security.db"
 engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for the get_db override (same database file)
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_security.db")
+AsyncTestingSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
 
-def override_get_db():
+
+async def override_get_db():
     """Override database for testing."""
-    try:
-        db = TestingSessionLocal()
+    async with AsyncTestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 @pytest.fixture(scope="function")
@@ -45,7 +47,7 @@ def client():
 @pytest.fixture
 def test_users(client):
     """Create test users with different roles."""
-    db = next(override_get_db())
+    db = TestingSessionLocal()
     
     # Admin user
     admin = User(
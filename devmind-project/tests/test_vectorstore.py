@@ -122,6 +122,33 @@ class TestIndexManager:
         assert manager.get_stats()["code"] == 3
         assert len(manager.metadata["code"]) == 3
     
+    def test_add_to_index_skips_known_chunk_ids(self, manager):
+        """Test re-adding chunks with the same chunk_id is a no-op."""
+        embeddings = np.random.randn(3, 10).astype('float32')
+        metadata = [{"chunk_id": f"c{i}"} for i in range(3)]
+        manager.add_to_index("code", embeddings, metadata)
+        
+        # Two known chunks and one new one
+        embeddings = np.random.randn(3, 10).astype('float32')
+        metadata = [{"chunk_id": "c0"}, {"chunk_id": "c2"}, {"chunk_id": "c3"}]
+        manager.add_to_index("code", embeddings, metadata)
+        
+        assert manager.get_stats()["code"] == 4
+        assert [m["chunk_id"] for m in manager.metadata["code"]] == ["c0", "c1", "c2", "c3"]
+    
+    def test_failed_add_can_be_retried(self, manager):
+        """Test chunk_ids from a failed add are not treated as indexed."""
+        metadata = [{"chunk_id": f"c{i}"} for i in range(3)]
+        
+        # Wrong dimension: the FAISS add fails
+        with pytest.raises(ValueError, match="dimension"):
+            manager.add_to_index("code", np.random.randn(3, 7).astype('float32'), metadata)
+        
+        manager.add_to_index("code", np.random.randn(3, 10).astype('float32'), metadata)
+        
+        assert manager.get_stats()["code"] == 3
+        assert [m["chunk_id"] for m in manager.metadata["code"]] == ["c0", "c1", "c2"]
+    
     def test_search(self, manager):
         """Test searching an index."""
         # Add some data